@@ -7,13 +7,26 @@ The old tenex_trading_bot.py remains as a backup.
 """
 
 import os
-import csv
 import json
+import time
+import asyncio
 import logging
 import datetime
+import functools
 from pathlib import Path
+from cachetools import TTLCache
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes, MessageHandler, filters
+from telegram.constants import ParseMode
+from telegram.ext import (
+    AIORateLimiter,
+    Application,
+    Defaults,
+    CommandHandler,
+    CallbackQueryHandler,
+    ContextTypes,
+    MessageHandler,
+    filters
+)
 from dotenv import load_dotenv
 
 # Import services
@@ -28,7 +41,13 @@ from services import (
 )
 
 # Import trading integration
-from trading_integration import TradingMixin
+from trading_integration import (
+    TradingMixin,
+    BACK_TO_MENU_KB,
+    BACK_TO_MANAGE_KB,
+)
+import bsc_swap
+import jupiter_swap
 
 # Setup logging
 logging.basicConfig(
@@ -50,6 +69,11 @@ CONFIG_FILE = Path('config.json')
 WALLETS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _iso_now() -> str:
+    """UTC timestamp in ISO format (lexicographically sortable, no localtime lookup)"""
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+
+
 def load_config():
     """Load chain configuration from config.json"""
     if CONFIG_FILE.exists():
@@ -110,11 +134,168 @@ for chain_key, chain_config in CONFIG['chains'].items():
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_enabled_networks():
-    """Get only enabled networks from config"""
+    """
+    Get only enabled networks from config
+
+    Memoized - menu renders call this several times per update. Call
+    get_enabled_networks.cache_clear() if CONFIG is ever reloaded.
+    """
     return {k: v for k, v in CONFIG['chains'].items() if v.get('enabled', True)}
 
 
+# Enabled chain keys as a frozenset for O(1) membership tests in render loops
+ENABLED_CHAIN_KEYS = frozenset(
+    k for k, v in CONFIG['chains'].items() if v.get('enabled', True)
+)
+
+
+# Valid fixed sell percentages for sell_<pct>_<token> callbacks
+_SELL_PCTS = frozenset(('25', '50', '75', '100'))
+
+# Main-menu keyboards are static - build them once instead of per render.
+# Tuples keep the button rows immutable; InlineKeyboardMarkup just serializes.
+_MAIN_MENU_KB_WITH_WALLETS = InlineKeyboardMarkup((
+    (InlineKeyboardButton("🔄 Refresh Balance", callback_data='refresh_balance'),),
+    (InlineKeyboardButton("🎒 View Bags", callback_data='view_bags'),),
+    (InlineKeyboardButton("👛 View All Wallets", callback_data='view_wallets'),),
+    (InlineKeyboardButton("🔧 Manage Wallets", callback_data='manage_wallets'),),
+    (InlineKeyboardButton("📤 Withdraw", callback_data='withdraw_start'),),
+    (InlineKeyboardButton("🔑 Export Private Key", callback_data='export_key'),),
+))
+_MAIN_MENU_KB_NO_WALLETS = InlineKeyboardMarkup((
+    (
+        InlineKeyboardButton("➕ Create Wallet", callback_data='create_start'),
+        InlineKeyboardButton("📥 Import Wallet", callback_data='import_start'),
+    ),
+))
+
+# Fixed single-button keyboards for the wallet flows - immutable, so build
+# them once at import like the back keyboards in trading_integration
+BACK_TO_WITHDRAW_KB = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("⬅️ Back", callback_data='withdraw_start')]]
+)
+BACK_TO_EXPORT_KB = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("⬅️ Back", callback_data='export_key')]]
+)
+CANCEL_WITHDRAW_KB = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("❌ Cancel", callback_data='withdraw_start')]]
+)
+CANCEL_TO_MENU_KB = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("❌ Cancel", callback_data='back_to_menu')]]
+)
+CANCEL_TO_MANAGE_KB = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("❌ Cancel", callback_data='manage_wallets')]]
+)
+
+def dedupe_callback(fn):
+    """
+    Collapse duplicate button taps into one execution
+
+    Impatient double-taps re-run the same handler for the same
+    (user, callback_data) pair; the second tap awaits the first run's
+    future instead of redoing the work.
+    """
+    @functools.wraps(fn)
+    async def wrapper(self, query, *args, **kwargs):
+        key = (query.from_user.id, query.data)
+        fut = self._inflight.get(key)
+        if fut is not None:
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await fn(self, query, *args, **kwargs)
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved in case nobody joined
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+    return wrapper
+
+
+# Block-explorer URL templates per chain (dict lookup beats an if/elif chain)
+SCAN_URLS = {
+    'solana': 'https://solscan.io/token/{}',
+    'ethereum': 'https://etherscan.io/token/{}',
+    'base': 'https://basescan.org/token/{}',
+    'bsc': 'https://bscscan.com/token/{}',
+    'arbitrum': 'https://arbiscan.io/token/{}',
+    'polygon': 'https://polygonscan.com/token/{}',
+}
+
+def _slot_items(user_data: dict, wallet_slots: dict):
+    """
+    Wallet slots as ordered (name, data) pairs
+
+    Uses the slot_order list persisted by DataManager.set_user_data when it
+    is consistent, so renders skip re-sorting on every view; falls back to
+    sorting for records written before slot_order existed.
+    """
+    order = user_data.get('slot_order')
+    if order and len(order) == len(wallet_slots):
+        try:
+            return [(name, wallet_slots[name]) for name in order]
+        except KeyError:
+            pass
+    return sorted(wallet_slots.items())
+
+
+def _safe_float(data: dict, key: str, default: float = 0.0) -> float:
+    """Read a numeric field with one lookup, tolerating None/empty/garbage"""
+    value = data.get(key)
+    if value in (None, ''):
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+# Price-change emoji prefixes indexed by sign(value) + 1
+_CHG_EMOJI = ('🔴 ', '⚪ ', '🟢 +')
+
+
+def format_price_change(value) -> str:
+    """Format a percentage change with its red/neutral/green marker"""
+    return f"{_CHG_EMOJI[(value > 0) - (value < 0) + 1]}{value:.2f}%"
+
+
+# Token-info message templates, parsed once at import. format_map fills a
+# whole section in one call instead of re-assembling ~15 f-string fragments
+# per render.
+TOKEN_INFO_TPL = (
+    "<b>Tenex Trading Bot (Modular)</b>\n"
+    "<b>Multi-chain Trading Assistant</b>\n\n"
+    "<b>🪙 Token Information</b>\n"
+    "━━━━━━━━━━━━━━━━━━━━\n\n"
+    "<b>📛 Name:</b> {token_name} ({token_symbol})\n"
+    "<b>⛓️ Chain:</b> {chain_display}\n"
+    "<b>🏦 DEX:</b> {dex_display}\n\n"
+    "<b>💹 Price:</b> ${price_usd:.10f}\n"
+    "<b>📊 Market Cap:</b> ${market_cap:,.0f}\n"
+    "<b>💧 Liquidity:</b> ${liquidity_usd:,.0f}\n"
+    "<b>📈 Volume (24h):</b> ${volume_24h:,.0f}\n"
+)
+TOKEN_INFO_CHANGES_TPL = (
+    "\n<b>📉 Price Changes:</b>\n"
+    "5m: {change_5m}\n"
+    "1h: {change_1h}\n"
+    "6h: {change_6h}\n"
+    "24h: {change_24h}\n"
+    "\n<b>🕒 Pair Created:</b> {time_ago}\n"
+)
+TOKEN_INFO_CONTRACT_TPL = (
+    "\n<b>📋 Contract Address:</b>\n"
+    "<code>{token_address}</code>\n"
+)
+
 # DexScreener configuration
 DEXSCREENER_BASE_URL = "https://api.dexscreener.com/latest/dex/tokens"
 SUPPORTED_CHAINS = [
@@ -150,10 +331,50 @@ class TradingBotModular(TradingMixin):
         self.notification_service = NotificationService(BOT_TOKEN, NOTIFICATION_CHANNEL_ID)
 
         # State management (not in services - bot-specific)
-        self.waiting_for_input = {}  # Tracks users waiting for text input
+        # Tracks users waiting for text input. TTL'd so abandoned flows
+        # (user opens a prompt and walks away) don't accumulate forever -
+        # an expired entry just means the next message is treated normally
+        self.waiting_for_input = TTLCache(maxsize=10_000, ttl=600)
+
+        # Per-slot USD balance cache - repeat menu renders within the
+        # configured balance_cache_timeout skip the RPC fan-out entirely
+        self._slot_balance_cache = TTLCache(
+            maxsize=4096,
+            ttl=CONFIG.get('settings', {}).get('balance_cache_timeout', 30)
+        )
+
+        # DexScreener pair cache - token data is user-independent, so repeated
+        # pastes and Refresh taps within the TTL skip the upstream fetch
+        self._pair_cache = TTLCache(maxsize=4096, ttl=8)
+
+        # Short-lived price snapshot plus the in-flight fetch task, so a
+        # burst of renders collapses to a single CoinGecko request
+        self._prices_cache_data = None
+        self._prices_cache_ts = 0.0
+        self._prices_inflight = None
+
+        # O(1) dispatch table for text-input states (keyed by state 'type'/'action')
+        self._input_handlers = {
+            'buy_token_ca': self._handle_buy_token_ca,
+            'sell_token_ca': self._handle_sell_token_ca,
+            'buy_custom_amount': self._handle_buy_custom_amount,
+            'sell_custom_amount': self._handle_sell_custom_amount,
+            'withdraw_address': self._handle_withdraw_address,
+            'withdraw_amount': self._handle_withdraw_amount,
+            'import': self._handle_import_input,
+            'label_wallet': self._handle_label_input,
+        }
 
         # Trading state (inherited from TradingMixin)
-        self.trading_context = {}  # Active token trades per user
+        # Active token trades per user. TTLCache evicts contexts for users
+        # who go quiet, so memory stays bounded regardless of user count;
+        # an expired entry simply reads as "session expired".
+        self.trading_context = TTLCache(maxsize=50_000, ttl=3600)
+        # Pre-rendered "Addresses:" block per user - addresses only change
+        # on wallet create/import/delete, so view_wallets can reuse it
+        self._addr_block_cache = TTLCache(maxsize=50_000, ttl=3600)
+        self._bg_tasks = set()  # Strong refs to fire-and-forget tasks
+        self._inflight = {}  # (user_id, callback_data) -> future for dedupe
         self.user_orders = {}  # Pending/completed orders
 
         logger.info("All services initialized successfully")
@@ -175,33 +396,87 @@ class TradingBotModular(TradingMixin):
         return await self.balance_service.get_balance(network, address)
 
     async def get_token_prices(self):
-        """Get token prices (delegated to BalanceService)"""
-        return await self.balance_service.get_token_prices()
+        """Get token prices (delegated to BalanceService, TTL + single-flight)
+
+        Prices fresher than 15 s are served from memory; concurrent callers
+        during a refresh all await the same upstream request.
+        """
+        if (
+            self._prices_cache_data is not None
+            and time.monotonic() - self._prices_cache_ts < 15
+        ):
+            return self._prices_cache_data
+
+        inflight = self._prices_inflight
+        if inflight is not None:
+            return await inflight
+
+        inflight = asyncio.create_task(self.balance_service.get_token_prices())
+        self._prices_inflight = inflight
+        try:
+            data = await inflight
+        finally:
+            self._prices_inflight = None
+
+        self._prices_cache_data = data
+        self._prices_cache_ts = time.monotonic()
+        return data
 
     async def get_wallet_total_balance_usd(self, user_id: int, slot_name: str) -> float:
-        """Get total wallet balance in USD (delegated to BalanceService)"""
-        return await self.balance_service.get_wallet_total_balance_usd(
+        """Get total wallet balance in USD (delegated to BalanceService, TTL-cached)"""
+        key = (user_id, slot_name)
+        cached = self._slot_balance_cache.get(key)
+        if cached is not None:
+            return cached
+
+        total = await self.balance_service.get_wallet_total_balance_usd(
             user_id, slot_name, self.data_manager
         )
+        self._slot_balance_cache[key] = total
+        return total
+
+    def _invalidate_balance_cache(self, user_id: int):
+        """Drop cached slot balances after any wallet mutation for this user"""
+        stale = [k for k in self._slot_balance_cache if k[0] == user_id]
+        for key in stale:
+            self._slot_balance_cache.pop(key, None)
+        self._addr_block_cache.pop(user_id, None)
 
     def is_contract_address(self, text: str) -> bool:
         """Check if text is contract address (delegated to TokenService)"""
         return self.token_service.is_contract_address(text)
 
     async def detect_and_fetch_token(self, token_address: str):
-        """Detect and fetch token (delegated to TokenService)"""
-        return await self.token_service.detect_and_fetch_token(token_address)
+        """Detect and fetch token (delegated to TokenService, TTL-cached)"""
+        cached = self._pair_cache.get(token_address)
+        if cached is not None:
+            return cached
+
+        result = await self.token_service.detect_and_fetch_token(token_address)
+        if result is not None:
+            self._pair_cache[token_address] = result
+        return result
 
     # ============================================================
     # WALLET MANAGEMENT
     # ============================================================
 
-    def get_primary_wallet(self, user_id: int) -> str:
-        """Get primary wallet slot name"""
+    def get_primary_wallet(self, user_id: int, user_data: dict = None) -> str:
+        """Get primary wallet slot name
+
+        Pass a pre-fetched user_data dict to skip the DataManager lookup.
+        """
+        if user_data is not None:
+            return user_data.get('primary_wallet') or 'wallet1'
         return self.data_manager.get_primary_wallet(user_id) or 'wallet1'
 
-    def get_wallet_slot(self, user_id: int, slot_name: str) -> dict:
-        """Get wallet slot data"""
+    def get_wallet_slot(self, user_id: int, slot_name: str, user_data: dict = None) -> dict:
+        """Get wallet slot data
+
+        Pass a pre-fetched user_data dict to skip the DataManager lookup.
+        """
+        if user_data is not None:
+            return user_data.get('wallet_slots', {}).get(slot_name) or {}
         return self.data_manager.get_wallet_slot(user_id, slot_name) or {}
 
     def set_primary_wallet(self, user_id: int, slot_name: str) -> bool:
@@ -214,21 +489,31 @@ class TradingBotModular(TradingMixin):
 
     def delete_wallet_slot(self, user_id: int, slot_name: str) -> bool:
         """Delete a wallet slot"""
-        return self.data_manager.delete_wallet_slot(user_id, slot_name)
+        success = self.data_manager.delete_wallet_slot(user_id, slot_name)
+        if success:
+            self._invalidate_balance_cache(user_id)
+        return success
 
     def set_wallet_label(self, user_id: int, slot_name: str, label: str) -> bool:
         """Set wallet label"""
-        return self.wallet_manager.set_wallet_label(user_id, slot_name, label)
+        success = self.wallet_manager.set_wallet_label(user_id, slot_name, label)
+        if success:
+            # Labels appear in the pre-rendered address block
+            self._addr_block_cache.pop(user_id, None)
+        return success
 
     def get_available_wallet(self, network: str):
         """Get an available pre-generated wallet for the network"""
-        wallet_file = NETWORKS[network]['file']
+        import csv  # Only needed on the wallet-assign path; keep it off module import
 
-        if not wallet_file.exists():
+        # Read CSV file - open directly and let a missing file surface as
+        # FileNotFoundError rather than paying an extra stat() per call
+        try:
+            f = open(NETWORKS[network]['file'], 'r', newline='')
+        except FileNotFoundError:
             return None
 
-        # Read CSV file
-        with open(wallet_file, 'r') as f:
+        with f:
             reader = csv.DictReader(f)
             wallets = list(reader)
 
@@ -264,12 +549,14 @@ class TradingBotModular(TradingMixin):
         if self.data_manager.needs_migration(user_id_str):
             self.data_manager.migrate_user_data(user_id_str)
 
+        # Fetch once and reuse for the primary-slot lookups below
+        user_data = self.data_manager.get_user_data(user_id)
+
         # Get wallet slot (default to primary if not specified)
         if slot_name is None:
-            slot_name = self.get_primary_wallet(user_id)
+            slot_name = self.get_primary_wallet(user_id, user_data)
 
         # Check if wallet already exists in this slot
-        user_data = self.data_manager.get_user_data(user_id)
         if user_data and 'wallet_slots' in user_data:
             wallet_slots = user_data.get('wallet_slots', {})
             if slot_name in wallet_slots:
@@ -304,21 +591,24 @@ class TradingBotModular(TradingMixin):
         if 'wallet_slots' not in user_data:
             user_data['wallet_slots'] = {}
 
+        now_iso = _iso_now()
+
         if slot_name not in user_data['wallet_slots']:
             user_data['wallet_slots'][slot_name] = {
                 'label': None,
-                'created_at': datetime.datetime.now().isoformat(),
-                'is_primary': slot_name == self.get_primary_wallet(user_id),
+                'created_at': now_iso,
+                'is_primary': slot_name == self.get_primary_wallet(user_id, user_data),
                 'chains': {}
             }
 
         # Update created_at if this is the first chain in the slot
         if not user_data['wallet_slots'][slot_name].get('chains'):
-            user_data['wallet_slots'][slot_name]['created_at'] = datetime.datetime.now().isoformat()
+            user_data['wallet_slots'][slot_name]['created_at'] = now_iso
 
         # Add wallet to slot
         user_data['wallet_slots'][slot_name]['chains'][network] = wallet
         self.data_manager.set_user_data(user_id, user_data)
+        self._invalidate_balance_cache(user_id)
 
         logger.info(f"Assigned {network} wallet to user {user_id} in {slot_name}")
         return wallet
@@ -357,10 +647,10 @@ class TradingBotModular(TradingMixin):
                     'chains': {}
                 }
 
-            self.data_manager.set_user_data(user_id, user_data)
+            await asyncio.to_thread(self.data_manager.set_user_data, user_id, user_data)
 
             # Send notification for new user
-            full_name = f"{user.first_name or ''} {user.last_name or ''}".strip() or "Unknown"
+            full_name = ' '.join(n for n in (user.first_name, user.last_name) if n) or "Unknown"
             await self.notification_service.notify_new_user(
                 user_id=user_id,
                 username=user.username,
@@ -386,7 +676,6 @@ class TradingBotModular(TradingMixin):
             "Please send the token contract address (CA) you want to buy.\n\n"
             "Example:\n"
             "<code>EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v</code>",
-            parse_mode='HTML'
         )
 
     async def sell_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -405,7 +694,6 @@ class TradingBotModular(TradingMixin):
             "Please send the token contract address (CA) you want to sell.\n\n"
             "Example:\n"
             "<code>EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v</code>",
-            parse_mode='HTML'
         )
 
     async def bags_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -467,12 +755,12 @@ class TradingBotModular(TradingMixin):
             "💡 <b>Tip:</b> Most features can be accessed through the /start menu."
         )
 
-        await update.message.reply_text(help_text, parse_mode='HTML')
+        await update.message.reply_text(help_text)
 
     async def show_main_menu(self, update, user_id: int):
         """Display main menu with wallet balance information"""
-        keyboard = await self.get_main_menu_keyboard(user_id)
         user_data = self.data_manager.get_user_data(user_id)
+        keyboard = await self.get_main_menu_keyboard(user_id, user_data)
 
         message = "🤖 Welcome to Tenex Trading Bot!\n\n"
 
@@ -494,13 +782,10 @@ class TradingBotModular(TradingMixin):
                 prices = await self.get_token_prices()
                 total_primary = 0
 
-                # Get enabled networks from config
-                enabled_networks = get_enabled_networks()
-
                 # Display primary wallet balances
                 for network, wallet_data in chains.items():
                     # Skip disabled networks
-                    if network not in enabled_networks:
+                    if network not in ENABLED_CHAIN_KEYS:
                         continue
 
                     try:
@@ -535,11 +820,14 @@ class TradingBotModular(TradingMixin):
                 reply_markup=keyboard
             )
 
-    async def get_main_menu_keyboard(self, user_id: int):
-        """Generate main menu keyboard based on user's wallets"""
-        user_data = self.data_manager.get_user_data(user_id)
+    async def get_main_menu_keyboard(self, user_id: int, user_data: dict = None):
+        """Generate main menu keyboard based on user's wallets
 
-        keyboard = []
+        Accepts an optional pre-fetched user_data dict so callers that already
+        hold it (e.g. show_main_menu) avoid a second lookup and slot walk.
+        """
+        if user_data is None:
+            user_data = self.data_manager.get_user_data(user_id)
 
         # Check if user has any wallets
         has_wallets = False
@@ -549,29 +837,15 @@ class TradingBotModular(TradingMixin):
                     has_wallets = True
                     break
 
-        if has_wallets:
-            # User has wallets - show main menu options
-            keyboard.append([InlineKeyboardButton("🔄 Refresh Balance", callback_data='refresh_balance')])
-            keyboard.append([InlineKeyboardButton("🎒 View Bags", callback_data='view_bags')])
-            keyboard.append([InlineKeyboardButton("👛 View All Wallets", callback_data='view_wallets')])
-            keyboard.append([InlineKeyboardButton("🔧 Manage Wallets", callback_data='manage_wallets')])
-            keyboard.append([InlineKeyboardButton("📤 Withdraw", callback_data='withdraw_start')])
-            keyboard.append([InlineKeyboardButton("🔑 Export Private Key", callback_data='export_key')])
-        else:
-            # User has no wallets - show Create and Import on same line
-            keyboard.append([
-                InlineKeyboardButton("➕ Create Wallet", callback_data='create_start'),
-                InlineKeyboardButton("📥 Import Wallet", callback_data='import_start')
-            ])
-
-        return InlineKeyboardMarkup(keyboard)
+        # Both layouts are static - reuse the prebuilt markup objects
+        return _MAIN_MENU_KB_WITH_WALLETS if has_wallets else _MAIN_MENU_KB_NO_WALLETS
 
     # ============================================================
     # BUTTON CALLBACK HANDLER
     # ============================================================
 
     async def button_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle all button callbacks"""
+        """Handle all button callbacks - routes to smaller per-group dispatchers"""
         query = update.callback_query
         await query.answer()
 
@@ -581,189 +855,11 @@ class TradingBotModular(TradingMixin):
         logger.info(f"Button pressed by {user_id}: {action}")
 
         try:
-            # Main menu
-            if action == 'back_to_menu':
-                await self.show_main_menu(query, user_id)
-
-            # Refresh balance (same as view wallets)
-            elif action == 'refresh_balance':
-                await self.view_wallets(query, user_id)
-
-            # View wallets
-            elif action == 'view_wallets':
-                await self.view_wallets(query, user_id)
-
-            # Manage wallets
-            elif action == 'manage_wallets':
-                await self.manage_wallets_menu(query, user_id)
-
-            # View bags (trading)
-            elif action == 'view_bags':
-                await self.show_bags(query, user_id)
-
-            # Export private key
-            elif action == 'export_key':
-                await self.export_key_start(query, user_id)
-
-            # Withdraw
-            elif action == 'withdraw_start':
-                await self.withdraw_start(query, user_id)
-
-            # Internal transfer
-            elif action == 'internal_transfer_start':
-                await self.internal_transfer_start(query, user_id)
-
-            # Create wallet flow
-            elif action == 'create' or action == 'create_start' or action == 'create_in_slot_menu':
-                await self.create_in_slot_menu(query, user_id)
-            elif action.startswith('create_in_'):
-                slot_name = action.replace('create_in_', '')
-                await self.show_slot_chain_selection(query, user_id, slot_name, 'create')
-            elif action.startswith('create_network_'):
-                parts = action.replace('create_network_', '').split('_', 1)
-                slot_name = parts[0]
-                network = parts[1]
-                await self.create_wallet(query, context, network, slot_name)
-
-            # Import wallet flow
-            elif action == 'import' or action == 'import_start' or action == 'import_in_slot_menu':
-                await self.import_in_slot_menu(query, user_id)
-            elif action.startswith('import_in_'):
-                slot_name = action.replace('import_in_', '')
-                await self.show_slot_chain_selection(query, user_id, slot_name, 'import')
-            elif action.startswith('import_network_'):
-                parts = action.replace('import_network_', '').split('_', 1)
-                slot_name = parts[0]
-                network = parts[1]
-                await self.start_import_flow(query, network, slot_name)
-
-            # Transfer between wallets (internal transfer)
-            elif action.startswith('transfer_source_'):
-                # Note: This would need additional implementation for the full flow
-                # For now, just show a message that it's not yet fully implemented
-                slot_name = action.replace('transfer_source_', '')
-                await query.edit_message_text(
-                    "⚠️ Internal transfer flow not yet fully implemented in modular bot.\n\n"
-                    "This feature will be completed in a future update.",
-                    reply_markup=InlineKeyboardMarkup([[
-                        InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')
-                    ]])
-                )
-
-            # Switch wallet
-            elif action == 'switch_wallet':
-                await self.switch_wallet_menu(query, user_id)
-            elif action.startswith('switch_to_'):
-                slot_name = action.replace('switch_to_', '')
-                await self.switch_primary_wallet(query, user_id, slot_name)
-
-            # Delete wallet
-            elif action == 'delete_wallet':
-                await self.delete_wallet_menu(query, user_id)
-            elif action.startswith('delete_'):
-                slot_name = action.replace('delete_', '')
-                await self.confirm_delete_wallet(query, user_id, slot_name)
-            elif action.startswith('confirm_delete_'):
-                slot_name = action.replace('confirm_delete_', '')
-                await self.execute_delete_wallet(query, user_id, slot_name)
-
-            # Label wallet
-            elif action == 'label_wallet':
-                await self.label_wallet_menu(query, user_id)
-            elif action.startswith('label_'):
-                slot_name = action.replace('label_', '')
-                await self.start_label_wallet_flow(query, user_id, slot_name)
-
-            # Export
-            elif action == 'export':
-                await self.export_key_start(query, user_id)
-            elif action.startswith('export_slot_'):
-                slot_name = action.replace('export_slot_', '')
-                await self.export_select_chain(query, user_id, slot_name)
-            elif action.startswith('export_chain_'):
-                parts = action.replace('export_chain_', '').split('_', 1)
-                slot_name = parts[0]
-                network = parts[1]
-                await self.export_private_key(query, network, user_id, slot_name)
-
-            # Withdraw
-            elif action == 'withdraw':
-                await self.withdraw_start(query, user_id)
-            elif action.startswith('withdraw_slot_'):
-                slot_name = action.replace('withdraw_slot_', '')
-                await self.withdraw_select_chain(query, user_id, slot_name)
-            elif action.startswith('withdraw_chain_'):
-                parts = action.replace('withdraw_chain_', '').split('_', 1)
-                slot_name = parts[0]
-                network = parts[1]
-                await self.start_withdraw_flow(query, network, slot_name)
-
-            # Token scanning (from token address)
-            elif action.startswith('refresh_'):
-                token_address = action.replace('refresh_', '')
-                await self.display_token_info(update, context, token_address)
-
-            # Trading actions (inherited from TradingMixin)
-            elif action.startswith('buy_'):
-                parts = action.replace('buy_', '').split('_', 1)
-                if len(parts) == 2:
-                    if parts[0] == 'x':
-                        # Custom amount
-                        token_address = parts[1]
-                        await self.ask_custom_amount(query, user_id, token_address)
-                    else:
-                        # Fixed amount
-                        sol_amount = float(parts[0])
-                        token_address = parts[1]
-                        await self.execute_buy(query, user_id, sol_amount, token_address)
-
-            elif action.startswith('confirm_buy_'):
-                parts = action.replace('confirm_buy_', '').split('_', 1)
-                sol_amount = float(parts[0])
-                token_address = parts[1]
-                await self.confirm_buy(query, user_id, sol_amount, token_address)
-
-            elif action.startswith('slippage_'):
-                token_address = action.replace('slippage_', '')
-                await self.show_slippage_menu(query, user_id, token_address)
-
-            elif action.startswith('set_slippage_'):
-                parts = action.replace('set_slippage_', '').rsplit('_', 1)
-                slippage_pct = float(parts[0])
-                token_address = parts[1]
-                await self.set_slippage(query, user_id, slippage_pct, token_address)
-
-            elif action.startswith('orders_'):
-                token_address = action.replace('orders_', '')
-                await self.show_orders(query, user_id, token_address)
-
-            # Bags actions
-            elif action.startswith('bag_buy_'):
-                token_address = action.replace('bag_buy_', '')
-                await self.show_bag_buy_options(query, user_id, token_address)
-
-            elif action.startswith('bag_sell_'):
-                token_address = action.replace('bag_sell_', '')
-                await self.show_bag_sell_options(query, user_id, token_address)
-
-            # Sell percentage actions
-            elif action.startswith('sell_'):
-                if action.startswith('sell_custom_'):
-                    token_address = action.replace('sell_custom_', '')
-                    await self.ask_custom_sell_amount(query, user_id, token_address)
-                else:
-                    # sell_25_, sell_50_, etc.
-                    for pct in ['25', '50', '75', '100']:
-                        if action.startswith(f'sell_{pct}_'):
-                            token_address = action.replace(f'sell_{pct}_', '')
-                            await self.execute_sell(query, user_id, float(pct), token_address)
-                            break
-
-            elif action.startswith('confirm_sell_'):
-                parts = action.replace('confirm_sell_', '').split('_', 1)
-                percentage = float(parts[0])
-                token_address = parts[1]
-                await self.confirm_sell(query, user_id, percentage, token_address)
+            if await self._dispatch_menu_action(query, user_id, action):
+                return
+            if await self._dispatch_wallet_action(query, context, user_id, action):
+                return
+            await self._dispatch_trading_action(update, query, context, user_id, action)
 
         except Exception as e:
             logger.error(f"Error in button handler: {e}", exc_info=True)
@@ -774,6 +870,207 @@ class TradingBotModular(TradingMixin):
                 ]])
             )
 
+    async def _dispatch_menu_action(self, query, user_id: int, action: str) -> bool:
+        """Dispatch top-level menu callbacks. Returns True if handled."""
+        # Main menu
+        if action == 'back_to_menu':
+            await self.show_main_menu(query, user_id)
+
+        # Refresh balance (same as view wallets)
+        elif action == 'refresh_balance':
+            await self.view_wallets(query, user_id)
+
+        # View wallets
+        elif action == 'view_wallets':
+            await self.view_wallets(query, user_id)
+
+        # Manage wallets
+        elif action == 'manage_wallets':
+            await self.manage_wallets_menu(query, user_id)
+
+        # View bags (trading)
+        elif action == 'view_bags':
+            await self.show_bags(query.message, user_id)
+
+        # Export private key
+        elif action == 'export_key':
+            await self.export_key_start(query, user_id)
+
+        # Withdraw
+        elif action == 'withdraw_start':
+            await self.withdraw_start(query, user_id)
+
+        # Internal transfer
+        elif action == 'internal_transfer_start':
+            await self.internal_transfer_start(query, user_id)
+
+        else:
+            return False
+        return True
+
+    async def _dispatch_wallet_action(self, query, context, user_id: int, action: str) -> bool:
+        """Dispatch wallet create/import/switch/delete/label/export/withdraw callbacks.
+
+        Returns True if handled.
+        """
+        # Create wallet flow
+        if action == 'create' or action == 'create_start' or action == 'create_in_slot_menu':
+            await self.create_in_slot_menu(query, user_id)
+        elif action.startswith('create_in_'):
+            slot_name = action.replace('create_in_', '')
+            await self.show_slot_chain_selection(query, user_id, slot_name, 'create')
+        elif action.startswith('create_network_'):
+            parts = action.replace('create_network_', '').split('_', 1)
+            slot_name = parts[0]
+            network = parts[1]
+            await self.create_wallet(query, context, network, slot_name)
+
+        # Import wallet flow
+        elif action == 'import' or action == 'import_start' or action == 'import_in_slot_menu':
+            await self.import_in_slot_menu(query, user_id)
+        elif action.startswith('import_in_'):
+            slot_name = action.replace('import_in_', '')
+            await self.show_slot_chain_selection(query, user_id, slot_name, 'import')
+        elif action.startswith('import_network_'):
+            parts = action.replace('import_network_', '').split('_', 1)
+            slot_name = parts[0]
+            network = parts[1]
+            await self.start_import_flow(query, network, slot_name)
+
+        # Transfer between wallets (internal transfer)
+        elif action.startswith('transfer_source_'):
+            # Note: This would need additional implementation for the full flow
+            # For now, just show a message that it's not yet fully implemented
+            slot_name = action.replace('transfer_source_', '')
+            await query.edit_message_text(
+                "⚠️ Internal transfer flow not yet fully implemented in modular bot.\n\n"
+                "This feature will be completed in a future update.",
+                reply_markup=BACK_TO_MENU_KB
+            )
+
+        # Switch wallet
+        elif action == 'switch_wallet':
+            await self.switch_wallet_menu(query, user_id)
+        elif action.startswith('switch_to_'):
+            slot_name = action.replace('switch_to_', '')
+            await self.switch_primary_wallet(query, user_id, slot_name)
+
+        # Delete wallet
+        elif action == 'delete_wallet':
+            await self.delete_wallet_menu(query, user_id)
+        elif action.startswith('confirm_delete_'):
+            slot_name = action.replace('confirm_delete_', '')
+            await self.execute_delete_wallet(query, user_id, slot_name)
+        elif action.startswith('delete_'):
+            slot_name = action.replace('delete_', '')
+            await self.confirm_delete_wallet(query, user_id, slot_name)
+
+        # Label wallet
+        elif action == 'label_wallet':
+            await self.label_wallet_menu(query, user_id)
+        elif action.startswith('label_'):
+            slot_name = action.replace('label_', '')
+            await self.start_label_wallet_flow(query, user_id, slot_name)
+
+        # Export
+        elif action == 'export':
+            await self.export_key_start(query, user_id)
+        elif action.startswith('export_slot_'):
+            slot_name = action.replace('export_slot_', '')
+            await self.export_select_chain(query, user_id, slot_name)
+        elif action.startswith('export_chain_'):
+            parts = action.replace('export_chain_', '').split('_', 1)
+            slot_name = parts[0]
+            network = parts[1]
+            await self.export_private_key(query, network, user_id, slot_name)
+
+        # Withdraw
+        elif action == 'withdraw':
+            await self.withdraw_start(query, user_id)
+        elif action.startswith('withdraw_slot_'):
+            slot_name = action.replace('withdraw_slot_', '')
+            await self.withdraw_select_chain(query, user_id, slot_name)
+        elif action.startswith('withdraw_chain_'):
+            parts = action.replace('withdraw_chain_', '').split('_', 1)
+            slot_name = parts[0]
+            network = parts[1]
+            await self.start_withdraw_flow(query, network, slot_name)
+
+        else:
+            return False
+        return True
+
+    async def _dispatch_trading_action(self, update, query, context, user_id: int, action: str) -> bool:
+        """Dispatch token-scan and trading callbacks (TradingMixin). Returns True if handled."""
+        # Token scanning (from token address)
+        if action.startswith('refresh_'):
+            token_address = action.replace('refresh_', '')
+            await self.display_token_info(update, context, token_address)
+
+        # Trading actions (inherited from TradingMixin)
+        elif action.startswith('buy_'):
+            parts = action.replace('buy_', '').split('_', 1)
+            if len(parts) == 2:
+                if parts[0] == 'x':
+                    # Custom amount
+                    token_address = parts[1]
+                    await self.ask_custom_amount(query, user_id, token_address)
+                else:
+                    # Fixed amount
+                    sol_amount = float(parts[0])
+                    token_address = parts[1]
+                    await self.execute_buy(query, user_id, sol_amount, token_address)
+
+        elif action.startswith('confirm_buy_'):
+            parts = action.replace('confirm_buy_', '').split('_', 1)
+            sol_amount = float(parts[0])
+            token_address = parts[1]
+            await self.confirm_buy(query, user_id, sol_amount, token_address)
+
+        elif action.startswith('slippage_'):
+            token_address = action.replace('slippage_', '')
+            await self.show_slippage_menu(query, user_id, token_address)
+
+        elif action.startswith('set_slippage_'):
+            parts = action.replace('set_slippage_', '').rsplit('_', 1)
+            slippage_pct = float(parts[0])
+            token_address = parts[1]
+            await self.set_slippage(query, user_id, slippage_pct, token_address)
+
+        elif action.startswith('orders_'):
+            token_address = action.replace('orders_', '')
+            await self.show_orders(query, user_id, token_address)
+
+        # Bags actions
+        elif action.startswith('bag_buy_'):
+            token_address = action.replace('bag_buy_', '')
+            await self.show_bag_buy_options(query, user_id, token_address)
+
+        elif action.startswith('bag_sell_'):
+            token_address = action.replace('bag_sell_', '')
+            await self.show_bag_sell_options(query, user_id, token_address)
+
+        # Sell percentage actions
+        elif action.startswith('sell_'):
+            if action.startswith('sell_custom_'):
+                token_address = action.replace('sell_custom_', '')
+                await self.ask_custom_sell_amount(query, user_id, token_address)
+            else:
+                # sell_<pct>_<token> - one split instead of cascading startswith
+                parts = action.split('_', 2)
+                if len(parts) == 3 and parts[1] in _SELL_PCTS:
+                    await self.execute_sell(query, user_id, float(parts[1]), parts[2])
+
+        elif action.startswith('confirm_sell_'):
+            parts = action.replace('confirm_sell_', '').split('_', 1)
+            percentage = float(parts[0])
+            token_address = parts[1]
+            await self.confirm_sell(query, user_id, percentage, token_address)
+
+        else:
+            return False
+        return True
+
     # ============================================================
     # HELPER METHODS FOR DIRECT COMMAND ACCESS
     # ============================================================
@@ -793,21 +1090,43 @@ class TradingBotModular(TradingMixin):
 
         return False
 
-    async def show_bags_direct(self, update: Update, user_id: int):
-        """Show bags from command handler"""
-        # Create a fake query for compatibility with existing show_bags
-        processing = await update.message.reply_text("⏳ Loading your bags...")
+    async def _gather_balances(self, targets):
+        """
+        Fetch balances for many (slot_name, network, address) tuples at once
+
+        Runs the RPC calls concurrently behind a small semaphore so a wallet
+        page costs one round-trip instead of one per chain. Failed lookups
+        are logged and omitted from the result.
 
-        from telegram import CallbackQuery
-        fake_query = CallbackQuery(
-            id="bags_direct",
-            from_user=update.effective_user,
-            chat_instance=str(update.effective_chat.id),
-            data="view_bags",
-            message=processing
+        Args:
+            targets: List of (slot_name, network, address) tuples
+
+        Returns:
+            Dict mapping (slot_name, network) to balance data
+        """
+        sem = asyncio.Semaphore(8)
+
+        async def _bounded(network, address):
+            async with sem:
+                return await self.get_balance(network, address)
+
+        results = await asyncio.gather(
+            *(_bounded(network, address) for _, network, address in targets),
+            return_exceptions=True
         )
 
-        await self.show_bags(fake_query, user_id)
+        balances = {}
+        for (slot_name, network, _), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting balance for {network}: {result}")
+                continue
+            balances[(slot_name, network)] = result
+        return balances
+
+    async def show_bags_direct(self, update: Update, user_id: int):
+        """Show bags from command handler"""
+        processing = await update.message.reply_text("⏳ Loading your bags...")
+        await self.show_bags(processing, user_id)
 
     async def view_wallets_direct(self, update: Update, user_id: int):
         """View wallets from command handler"""
@@ -822,16 +1141,27 @@ class TradingBotModular(TradingMixin):
         wallet_slots = user_data.get('wallet_slots', {})
         primary_wallet = user_data.get('primary_wallet', 'wallet1')
 
-        # Get token prices
-        prices = await self.get_token_prices()
-        grand_total = 0
+        # Collect every (slot, network, address) target first, then fetch
+        # prices and all balances concurrently
         enabled_networks = get_enabled_networks()
+        chains_cfg = CONFIG['chains']
+        targets = [
+            (slot_name, network, wallet_data['address'])
+            for slot_name, slot_data in _slot_items(user_data, wallet_slots)
+            for network, wallet_data in slot_data.get('chains', {}).items()
+            if network in enabled_networks
+        ]
+        prices, balances = await asyncio.gather(
+            self.get_token_prices(),
+            self._gather_balances(targets)
+        )
+        grand_total = 0
 
-        message = "💼 Your Wallets\n\n"
+        # Build the page as a parts list and join once at the end
+        parts = ["💼 Your Wallets\n\n"]
 
         # Display each wallet slot
-        for slot_name in sorted(wallet_slots.keys()):
-            slot_data = wallet_slots[slot_name]
+        for slot_name, slot_data in _slot_items(user_data, wallet_slots):
             chains = slot_data.get('chains', {})
 
             # Determine indicator
@@ -854,68 +1184,73 @@ class TradingBotModular(TradingMixin):
             chain_lines = []
 
             if chains:
-                for network, wallet_data in chains.items():
-                    # Skip disabled networks
-                    if network not in enabled_networks:
+                for network in chains:
+                    balance_data = balances.get((slot_name, network))
+                    if balance_data is None:
                         continue
 
-                    try:
-                        balance_data = await self.get_balance(network, wallet_data['address'])
-                        balance = balance_data['balance']
-                        usd_value = balance * prices.get(network, 0)
-                        slot_total += usd_value
+                    balance = balance_data['balance']
+                    usd_value = balance * prices.get(network, 0)
+                    slot_total += usd_value
 
-                        chain_line = f"💳 {CONFIG['chains'][network]['name']}: {balance_data['formatted']}"
-                        if usd_value > 0:
-                            chain_line += f" (${usd_value:.2f})"
-                        chain_lines.append(chain_line)
-                    except Exception as e:
-                        logger.error(f"Error getting balance for {network}: {e}")
+                    chain_line = f"💳 {chains_cfg[network]['name']}: {balance_data['formatted']}"
+                    if usd_value > 0:
+                        chain_line += f" (${usd_value:.2f})"
+                    chain_lines.append(chain_line)
 
             # Add to message
-            message += f"{slot_display}\n"
+            parts.append(f"{slot_display}\n")
             if chain_lines:
                 for line in chain_lines:
-                    message += f"{line}\n"
-                message += f"Subtotal: ${slot_total:.2f}\n"
+                    parts.append(f"{line}\n")
+                parts.append(f"Subtotal: ${slot_total:.2f}\n")
                 grand_total += slot_total
             else:
-                message += "(Empty)\n"
-            message += "\n"
+                parts.append("(Empty)\n")
+            parts.append("\n")
 
-        message += f"Grand Total: ${grand_total:.2f}\n\n"
+        parts.append(f"Grand Total: ${grand_total:.2f}\n\n")
 
-        # Display addresses
-        message += "Addresses:\n"
-        for slot_name in sorted(wallet_slots.keys()):
-            slot_data = wallet_slots[slot_name]
-            chains = slot_data.get('chains', {})
-            if chains:
-                for network, wallet_data in chains.items():
-                    if network not in enabled_networks:
-                        continue
+        # Display addresses - the block only changes on wallet mutation,
+        # so reuse the pre-rendered string when we have it
+        addr_block = self._addr_block_cache.get(user_id)
+        if addr_block is None:
+            addr_parts = ["Addresses:\n"]
+            for slot_name, slot_data in _slot_items(user_data, wallet_slots):
+                chains = slot_data.get('chains', {})
+                if chains:
                     label = slot_data.get('label')
                     slot_label = f"{slot_name}" if not label else f"{slot_name} - {label}"
-                    message += f"{slot_label} {CONFIG['chains'][network]['symbol']}: <code>{wallet_data['address']}</code>\n"
+                    for network, wallet_data in chains.items():
+                        if network not in enabled_networks:
+                            continue
+                        addr_parts.append(f"{slot_label} {chains_cfg[network]['symbol']}: <code>{wallet_data['address']}</code>\n")
+            addr_block = ''.join(addr_parts)
+            self._addr_block_cache[user_id] = addr_block
+        parts.append(addr_block)
+
+        message = ''.join(parts)
 
         keyboard = [[InlineKeyboardButton("⬅️ Back to Menu", callback_data='back_to_menu')]]
         reply_markup = InlineKeyboardMarkup(keyboard)
 
-        await processing.edit_text(message, parse_mode='HTML', reply_markup=reply_markup)
+        await processing.edit_text(message, reply_markup=reply_markup)
 
     async def manage_wallets_direct(self, update: Update, user_id: int):
         """Manage wallets from command handler"""
         user_data = self.get_user_wallet_data(user_id)
-        primary_wallet = user_data.get('primary_wallet') or 'wallet1'
+        primary_wallet = user_data.get('primary_wallet')
         wallet_slots = user_data.get('wallet_slots', {})
 
-        # Ensure primary_wallet is set if it's None
+        # Repair the primary pointer if it's missing - only then do we pay
+        # for a write; the common render path stays read-only
         if not primary_wallet:
             primary_wallet = 'wallet1'
             user_data['primary_wallet'] = 'wallet1'
             if wallet_slots.get('wallet1'):
                 wallet_slots['wallet1']['is_primary'] = True
-            self.data_manager.set_user_data(user_id, user_data)
+            # JSON serialization + disk write happens off the event loop
+            await asyncio.to_thread(self.data_manager.set_user_data, user_id, user_data)
 
         # Get primary wallet label for display
         primary_slot = wallet_slots.get(primary_wallet, {})
@@ -927,46 +1262,56 @@ class TradingBotModular(TradingMixin):
         else:
             current_display = primary_wallet.title()
 
-        message = f"🔧 Manage Wallets\n\n"
-        message += f"Active: {current_display} 🟢\n\n"
+        lines = [f"🔧 Manage Wallets\n\n", f"Active: {current_display} 🟢\n\n"]
 
         # Display active wallet balances
         if chains:
-            prices = await self.get_token_prices()
             total_balance = 0
             enabled_networks = get_enabled_networks()
 
-            for network, wallet_data in chains.items():
-                # Skip disabled networks
-                if network not in enabled_networks:
+            # Fetch prices and all per-network balances concurrently
+            active_chains = [
+                (network, wallet_data)
+                for network, wallet_data in chains.items()
+                if network in enabled_networks
+            ]
+            prices, *balances = await asyncio.gather(
+                self.get_token_prices(),
+                *(self.get_balance(network, wallet_data['address'])
+                  for network, wallet_data in active_chains),
+                return_exceptions=True
+            )
+            if isinstance(prices, Exception):
+                logger.error(f"Error getting prices: {prices}")
+                prices = {}
+
+            for (network, wallet_data), balance_data in zip(active_chains, balances):
+                if isinstance(balance_data, Exception):
+                    logger.error(f"Error getting balance for {network}: {balance_data}")
                     continue
 
-                try:
-                    balance_data = await self.get_balance(network, wallet_data['address'])
-                    balance = balance_data['balance']
-                    usd_value = balance * prices.get(network, 0)
-                    total_balance += usd_value
+                balance = balance_data['balance']
+                usd_value = balance * prices.get(network, 0)
+                total_balance += usd_value
 
-                    emoji = CONFIG['chains'][network].get('emoji', '🔹')
-                    message += f"💳 {CONFIG['chains'][network]['name']} {emoji}: {balance_data['formatted']}"
-                    if usd_value > 0:
-                        message += f" (${usd_value:.2f})"
-                    message += "\n"
-                except Exception as e:
-                    logger.error(f"Error getting balance for {network}: {e}")
+                cfg = CONFIG['chains'][network]
+                line = f"💳 {cfg['name']} {cfg.get('emoji', '🔹')}: {balance_data['formatted']}"
+                if usd_value > 0:
+                    line += f" (${usd_value:.2f})"
+                lines.append(line + "\n")
 
-            message += f"\nTotal: ${total_balance:.2f}\n\n"
+            lines.append(f"\nTotal: ${total_balance:.2f}\n\n")
         else:
-            message += "(No wallets created yet)\n\n"
+            lines.append("(No wallets created yet)\n\n")
 
-        message += "Switch wallet or manage:"
+        lines.append("Switch wallet or manage:")
+        message = ''.join(lines)
 
         # Build wallet switching buttons (W1✅ | W2 | W3)
         wallet_buttons = []
-        for slot_name in sorted(wallet_slots.keys()):
-            slot_data = wallet_slots.get(slot_name, {})
+        for slot_name, slot_data in _slot_items(user_data, wallet_slots):
             label = slot_data.get('label', '')
-            is_primary = (slot_name == user_data.get('primary_wallet'))
+            is_primary = (slot_name == primary_wallet)
 
             # Short label for button
             if slot_name == 'wallet1':
@@ -1015,38 +1360,14 @@ class TradingBotModular(TradingMixin):
         """Withdraw from command handler"""
         try:
             user_data = self.get_user_wallet_data(user_id)
-            wallet_slots = user_data.get('wallet_slots', {})
 
             message = "💸 Withdraw - Select Wallet\n\n"
-            keyboard = []
-
-            # Show wallet slots with chains
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
-                chains = slot_data.get('chains', {})
-                label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
-
-                # Skip empty slots
-                if not chains:
-                    continue
-
-                # Build button text
-                indicator = "🟢" if is_primary else "⚪"
-                button_text = f"{indicator} {slot_name.title()}"
-                if label:
-                    button_text += f' "{label}"'
-
-                keyboard.append([InlineKeyboardButton(
-                    button_text,
-                    callback_data=f'withdraw_slot_{slot_name}'
-                )])
-
-            if not keyboard:
+            keyboard, had_slots = self._build_slot_keyboard(
+                user_data, 'withdraw_slot_', skip_empty=True, back_cb='back_to_menu'
+            )
+            if not had_slots:
                 message = "❌ No wallets available. Create a wallet first."
 
-            keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')])
-
             await update.message.reply_text(
                 message,
                 reply_markup=InlineKeyboardMarkup(keyboard)
@@ -1065,11 +1386,11 @@ class TradingBotModular(TradingMixin):
             keyboard = []
 
             # Show wallet slots with balances
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
+            primary_wallet_name = user_data.get('primary_wallet')
+            for slot_name, slot_data in _slot_items(user_data, wallet_slots):
                 chains = slot_data.get('chains', {})
                 label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
+                is_primary = (slot_name == primary_wallet_name)
 
                 # Skip empty slots
                 if not chains:
@@ -1107,38 +1428,14 @@ class TradingBotModular(TradingMixin):
         """Export key from command handler"""
         try:
             user_data = self.get_user_wallet_data(user_id)
-            wallet_slots = user_data.get('wallet_slots', {})
 
             message = "🔑 Export Private Key - Select Wallet\n\n"
-            keyboard = []
-
-            # Show wallet slots with chains
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
-                chains = slot_data.get('chains', {})
-                label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
-
-                # Skip empty slots
-                if not chains:
-                    continue
-
-                # Build button text
-                indicator = "🟢" if is_primary else "⚪"
-                button_text = f"{indicator} {slot_name.title()}"
-                if label:
-                    button_text += f' "{label}"'
-
-                keyboard.append([InlineKeyboardButton(
-                    button_text,
-                    callback_data=f'export_slot_{slot_name}'
-                )])
-
-            if not keyboard:
+            keyboard, had_slots = self._build_slot_keyboard(
+                user_data, 'export_slot_', skip_empty=True, back_cb='back_to_menu'
+            )
+            if not had_slots:
                 message = "❌ No wallets available. Create a wallet first."
 
-            keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')])
-
             await update.message.reply_text(
                 message,
                 reply_markup=InlineKeyboardMarkup(keyboard)
@@ -1173,7 +1470,6 @@ class TradingBotModular(TradingMixin):
 
             await update.message.reply_text(
                 message,
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup(keyboard)
             )
         except Exception as e:
@@ -1189,282 +1485,278 @@ class TradingBotModular(TradingMixin):
         user_id = update.effective_user.id
         message_text = update.message.text
 
-        # Check if user is waiting for input
+        # Check if user is waiting for input - dispatch via O(1) handler map
         if user_id in self.waiting_for_input:
             state = self.waiting_for_input[user_id]
-
-            # Handle buy token CA input
-            if state.get('action') == 'buy_token_ca':
-                if self.is_contract_address(message_text.strip()):
-                    del self.waiting_for_input[user_id]
-                    await self.display_token_info(update, context, message_text.strip())
-                else:
-                    await update.message.reply_text(
-                        "❌ Invalid contract address. Please send a valid token CA.",
-                        parse_mode='HTML'
-                    )
+            handler = self._input_handlers.get(state.get('type') or state.get('action'))
+            if handler:
+                await handler(update, context, state)
                 return
 
-            # Handle sell token CA input
-            elif state.get('action') == 'sell_token_ca':
-                if self.is_contract_address(message_text.strip()):
-                    del self.waiting_for_input[user_id]
-                    # Check if user holds this token first
-                    token_address = message_text.strip()
-                    if await self.user_holds_token(user_id, token_address):
-                        await self.display_token_info(update, context, token_address)
-                    else:
-                        await update.message.reply_text(
-                            "❌ You don't hold this token. Use /buy to purchase it first.",
-                            parse_mode='HTML'
-                        )
-                else:
-                    await update.message.reply_text(
-                        "❌ Invalid contract address. Please send a valid token CA.",
-                        parse_mode='HTML'
-                    )
-                return
+        # Check if it's a token address. Run the DexScreener lookup as a
+        # background task so this handler returns immediately and further
+        # updates from the chat aren't stuck behind the fetch.
+        if self.is_contract_address(message_text):
+            self._spawn(self.display_token_info(update, context, message_text.strip()))
+            return
 
-            # Handle custom buy amount
-            elif state.get('type') == 'buy_custom_amount':
-                token_address = state['token_address']
-                try:
-                    sol_amount = float(message_text.strip())
-                    if sol_amount <= 0:
-                        raise ValueError("Amount must be positive")
+        # Default response
+        await update.message.reply_text(
+            "Send a token contract address to view trading info,\n"
+            "or use /start to access the menu."
+        )
 
-                    del self.waiting_for_input[user_id]
+    async def _handle_buy_token_ca(self, update: Update, context: ContextTypes.DEFAULT_TYPE, state: dict):
+        """Handle buy token CA input"""
+        user_id = update.effective_user.id
+        message_text = update.message.text
 
-                    # Delete waiting message
-                    try:
-                        await context.bot.delete_message(
-                            chat_id=update.effective_chat.id,
-                            message_id=state.get('message_id')
-                        )
-                    except:
-                        pass
-
-                    # Send processing message
-                    processing_msg = await context.bot.send_message(
-                        chat_id=update.effective_chat.id,
-                        text=f"Processing {sol_amount} SOL buy order..."
-                    )
-
-                    # Create fake query
-                    from telegram import CallbackQuery
-                    fake_query = CallbackQuery(
-                        id="custom_buy",
-                        from_user=update.effective_user,
-                        chat_instance=str(update.effective_chat.id),
-                        data=f"buy_x_{token_address}",
-                        message=processing_msg
-                    )
-
-                    await self.execute_buy(fake_query, user_id, sol_amount, token_address)
-
-                except ValueError:
-                    del self.waiting_for_input[user_id]
-                    await context.bot.send_message(
-                        chat_id=update.effective_chat.id,
-                        text="❌ Invalid amount. Please enter a valid number.",
-                        reply_markup=InlineKeyboardMarkup([[
-                            InlineKeyboardButton("⬅️ Back", callback_data=f'refresh_{token_address}')
-                        ]])
-                    )
-                return
+        if self.is_contract_address(message_text.strip()):
+            self.waiting_for_input.pop(user_id, None)
+            await self.display_token_info(update, context, message_text.strip())
+        else:
+            await update.message.reply_text(
+                "❌ Invalid contract address. Please send a valid token CA.",
+            )
 
-            # Handle custom sell amount
-            elif state.get('type') == 'sell_custom_amount':
-                token_address = state['token_address']
-                try:
-                    percentage = float(message_text.strip())
-                    if percentage <= 0 or percentage > 100:
-                        raise ValueError("Percentage must be between 1 and 100")
+    async def _handle_sell_token_ca(self, update: Update, context: ContextTypes.DEFAULT_TYPE, state: dict):
+        """Handle sell token CA input"""
+        user_id = update.effective_user.id
+        message_text = update.message.text
 
-                    del self.waiting_for_input[user_id]
+        if self.is_contract_address(message_text.strip()):
+            self.waiting_for_input.pop(user_id, None)
+            # Check if user holds this token first
+            token_address = message_text.strip()
+            if await self.user_holds_token(user_id, token_address):
+                await self.display_token_info(update, context, token_address)
+            else:
+                await update.message.reply_text(
+                    "❌ You don't hold this token. Use /buy to purchase it first.",
+                )
+        else:
+            await update.message.reply_text(
+                "❌ Invalid contract address. Please send a valid token CA.",
+            )
 
-                    # Delete waiting message
-                    try:
-                        await context.bot.delete_message(
-                            chat_id=update.effective_chat.id,
-                            message_id=state.get('message_id')
-                        )
-                    except:
-                        pass
-
-                    # Send processing message
-                    processing_msg = await context.bot.send_message(
-                        chat_id=update.effective_chat.id,
-                        text=f"Processing {percentage}% sell order..."
-                    )
-
-                    # Create fake query
-                    from telegram import CallbackQuery
-                    fake_query = CallbackQuery(
-                        id="custom_sell",
-                        from_user=update.effective_user,
-                        chat_instance=str(update.effective_chat.id),
-                        data=f"sell_custom_{token_address}",
-                        message=processing_msg
-                    )
-
-                    await self.execute_sell(fake_query, user_id, percentage, token_address)
-
-                except ValueError:
-                    del self.waiting_for_input[user_id]
-                    await context.bot.send_message(
-                        chat_id=update.effective_chat.id,
-                        text="❌ Invalid percentage. Please enter a number between 1 and 100.",
-                        reply_markup=InlineKeyboardMarkup([[
-                            InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')
-                        ]])
-                    )
-                return
+    def _spawn(self, coro):
+        """
+        Run a coroutine as a background task
 
-            # Handle withdraw address input
-            elif state.get('action') == 'withdraw_address':
-                address = message_text.strip()
-                network = state['network']
-                slot_name = state['slot_name']
+        Keeps a strong reference until the task completes (the event loop
+        only holds weak refs) and logs any exception that escapes it.
+        """
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
 
-                # Update state to amount step
-                state['action'] = 'withdraw_amount'
-                state['recipient'] = address
-                self.waiting_for_input[user_id] = state
+        def _done(t):
+            self._bg_tasks.discard(t)
+            if not t.cancelled() and t.exception():
+                logger.error(f"Background task failed: {t.exception()}", exc_info=t.exception())
 
-                # Get current balance
-                user_data = self.get_user_wallet_data(user_id)
-                wallet_data = user_data['wallet_slots'][slot_name]['chains'][network]
-                balance_data = await self.get_balance(network, wallet_data['address'])
+        task.add_done_callback(_done)
+        return task
 
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text=f"📊 Current balance: {balance_data['formatted']}\n\n"
-                         f"Please send the amount to withdraw:",
-                    reply_markup=InlineKeyboardMarkup([[
-                        InlineKeyboardButton("❌ Cancel", callback_data='withdraw_start')
-                    ]])
-                )
-                return
+    async def _safe_delete(self, bot, chat_id: int, message_id: int):
+        """Delete a message, swallowing failures (already deleted, too old)"""
+        try:
+            await bot.delete_message(chat_id=chat_id, message_id=message_id)
+        except Exception:
+            pass
 
-            # Handle withdraw amount input
-            elif state.get('action') == 'withdraw_amount':
-                try:
-                    amount = float(message_text.strip())
-                    if amount <= 0:
-                        raise ValueError("Amount must be positive")
-
-                    network = state['network']
-                    slot_name = state['slot_name']
-                    recipient = state['recipient']
-
-                    del self.waiting_for_input[user_id]
-
-                    processing_msg = await context.bot.send_message(
-                        chat_id=update.effective_chat.id,
-                        text=f"⏳ Processing withdrawal of {amount} {CONFIG['chains'][network]['symbol']}..."
-                    )
-
-                    # Get wallet private key
-                    user_data = self.get_user_wallet_data(user_id)
-                    wallet_data = user_data['wallet_slots'][slot_name]['chains'][network]
-                    private_key = wallet_data.get('private_key', '')
-
-                    # Execute transfer based on network
-                    tx_hash = None
-                    decimals = CONFIG['chains'][network]['decimals']
-                    symbol = CONFIG['chains'][network]['symbol']
-                    explorer = CONFIG['chains'][network].get('explorer', '')
-
-                    if network == 'SOL':
-                        amount_lamports = int(amount * (10 ** decimals))
-                        tx_hash = await self.transfer_service.execute_solana_transfer(
-                            private_key, recipient, amount_lamports
-                        )
-                    elif network in ('ETH', 'BSC'):
-                        amount_wei = int(amount * (10 ** decimals))
-                        tx_hash = await self.transfer_service.execute_ethereum_transfer(
-                            private_key, recipient, amount_wei
-                        )
-
-                    if tx_hash:
-                        if network == 'SOL':
-                            explorer_link = f"https://solscan.io/tx/{tx_hash}"
-                        elif explorer:
-                            explorer_link = f"{explorer}{tx_hash}"
-                        else:
-                            explorer_link = None
-
-                        tx_line = f"🔗 TX: <a href='{explorer_link}'>{tx_hash[:16]}...</a>" if explorer_link else f"🔗 TX: <code>{tx_hash}</code>"
-                        await processing_msg.edit_text(
-                            f"✅ <b>Withdrawal Successful!</b>\n\n"
-                            f"💰 Amount: {amount} {symbol}\n"
-                            f"📤 To: <code>{recipient}</code>\n"
-                            f"{tx_line}",
-                            parse_mode='HTML',
-                            disable_web_page_preview=True,
-                            reply_markup=InlineKeyboardMarkup([[
-                                InlineKeyboardButton("⬅️ Back", callback_data='withdraw_start')
-                            ]])
-                        )
-                    else:
-                        await processing_msg.edit_text(
-                            f"❌ Withdrawal failed. Please try again later.",
-                            reply_markup=InlineKeyboardMarkup([[
-                                InlineKeyboardButton("⬅️ Back", callback_data='withdraw_start')
-                            ]])
-                        )
-
-                except ValueError:
-                    await context.bot.send_message(
-                        chat_id=update.effective_chat.id,
-                        text="❌ Invalid amount. Please enter a valid number.",
-                        reply_markup=InlineKeyboardMarkup([[
-                            InlineKeyboardButton("❌ Cancel", callback_data='withdraw_start')
-                        ]])
-                    )
-                return
+    async def _handle_buy_custom_amount(self, update: Update, context: ContextTypes.DEFAULT_TYPE, state: dict):
+        """Handle custom buy amount input"""
+        user_id = update.effective_user.id
+        token_address = state['token_address']
+        try:
+            sol_amount = float(update.message.text.strip())
+            if sol_amount <= 0:
+                raise ValueError("Amount must be positive")
 
-            # Handle import seed phrase
-            elif state.get('action') == 'import':
-                await self.import_wallet(update, context, state, message_text)
-                return
+            self.waiting_for_input.pop(user_id, None)
+
+            # Delete waiting message in the background - no need to spend an
+            # extra Telegram round-trip before showing "Processing..."
+            self._spawn(self._safe_delete(
+                context.bot, update.effective_chat.id, state.get('message_id')
+            ))
+
+            # Send processing message
+            processing_msg = await context.bot.send_message(
+                chat_id=update.effective_chat.id,
+                text=f"Processing {sol_amount} SOL buy order..."
+            )
+
+            await self._execute_buy_core(processing_msg, user_id, sol_amount, token_address)
+
+        except ValueError:
+            self.waiting_for_input.pop(user_id, None)
+            await context.bot.send_message(
+                chat_id=update.effective_chat.id,
+                text="❌ Invalid amount. Please enter a valid number.",
+                reply_markup=InlineKeyboardMarkup([[
+                    InlineKeyboardButton("⬅️ Back", callback_data=f'refresh_{token_address}')
+                ]])
+            )
+
+    async def _handle_sell_custom_amount(self, update: Update, context: ContextTypes.DEFAULT_TYPE, state: dict):
+        """Handle custom sell amount input"""
+        user_id = update.effective_user.id
+        token_address = state['token_address']
+        try:
+            percentage = float(update.message.text.strip())
+            if percentage <= 0 or percentage > 100:
+                raise ValueError("Percentage must be between 1 and 100")
+
+            self.waiting_for_input.pop(user_id, None)
+
+            # Delete waiting message in the background
+            self._spawn(self._safe_delete(
+                context.bot, update.effective_chat.id, state.get('message_id')
+            ))
+
+            # Send processing message
+            processing_msg = await context.bot.send_message(
+                chat_id=update.effective_chat.id,
+                text=f"Processing {percentage}% sell order..."
+            )
+
+            await self._execute_sell_core(processing_msg, user_id, percentage, token_address)
+
+        except ValueError:
+            self.waiting_for_input.pop(user_id, None)
+            await context.bot.send_message(
+                chat_id=update.effective_chat.id,
+                text="❌ Invalid percentage. Please enter a number between 1 and 100.",
+                reply_markup=InlineKeyboardMarkup([[
+                    InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')
+                ]])
+            )
+
+    async def _handle_withdraw_address(self, update: Update, context: ContextTypes.DEFAULT_TYPE, state: dict):
+        """Handle withdraw recipient address input"""
+        user_id = update.effective_user.id
+        address = update.message.text.strip()
+        network = state['network']
+        slot_name = state['slot_name']
+
+        # Update state to amount step
+        state['action'] = 'withdraw_amount'
+        state['recipient'] = address
+        self.waiting_for_input[user_id] = state
+
+        # Get current balance
+        user_data = self.get_user_wallet_data(user_id)
+        wallet_data = user_data['wallet_slots'][slot_name]['chains'][network]
+        balance_data = await self.get_balance(network, wallet_data['address'])
+
+        await context.bot.send_message(
+            chat_id=update.effective_chat.id,
+            text=f"📊 Current balance: {balance_data['formatted']}\n\n"
+                 f"Please send the amount to withdraw:",
+            reply_markup=CANCEL_WITHDRAW_KB
+        )
+
+    async def _handle_withdraw_amount(self, update: Update, context: ContextTypes.DEFAULT_TYPE, state: dict):
+        """Handle withdraw amount input and execute the transfer"""
+        user_id = update.effective_user.id
+        try:
+            amount = float(update.message.text.strip())
+            if amount <= 0:
+                raise ValueError("Amount must be positive")
+
+            network = state['network']
+            slot_name = state['slot_name']
+            recipient = state['recipient']
 
-            # Handle label input
-            elif state.get('action') == 'label_wallet':
-                slot_name = state['slot_name']
-                label_text = message_text.strip()
+            self.waiting_for_input.pop(user_id, None)
+
+            processing_msg = await context.bot.send_message(
+                chat_id=update.effective_chat.id,
+                text=f"⏳ Processing withdrawal of {amount} {CONFIG['chains'][network]['symbol']}..."
+            )
 
-                del self.waiting_for_input[user_id]
+            # Get wallet private key
+            user_data = self.get_user_wallet_data(user_id)
+            wallet_data = user_data['wallet_slots'][slot_name]['chains'][network]
+            private_key = wallet_data.get('private_key', '')
+
+            # Execute transfer based on network
+            tx_hash = None
+            decimals = CONFIG['chains'][network]['decimals']
+            symbol = CONFIG['chains'][network]['symbol']
+            explorer = CONFIG['chains'][network].get('explorer', '')
+
+            if network == 'SOL':
+                amount_lamports = int(amount * (10 ** decimals))
+                tx_hash = await self.transfer_service.execute_solana_transfer(
+                    private_key, recipient, amount_lamports
+                )
+            elif network in ('ETH', 'BSC'):
+                amount_wei = int(amount * (10 ** decimals))
+                tx_hash = await self.transfer_service.execute_ethereum_transfer(
+                    private_key, recipient, amount_wei
+                )
 
-                success = self.set_wallet_label(user_id, slot_name, label_text)
+            if tx_hash:
+                # The sender's on-chain balance just changed
+                self.balance_service.invalidate_balance(network, wallet_data.get('address', ''))
+                self._invalidate_balance_cache(user_id)
 
-                if success:
-                    if label_text.lower() == 'clear' or not label_text:
-                        message = f"✅ Label removed from {slot_name.title()}."
-                    else:
-                        message = f"✅ Label set: {label_text}"
+                if network == 'SOL':
+                    explorer_link = f"https://solscan.io/tx/{tx_hash}"
+                elif explorer:
+                    explorer_link = f"{explorer}{tx_hash}"
                 else:
-                    message = "❌ Failed to set label."
+                    explorer_link = None
 
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text=message,
-                    reply_markup=InlineKeyboardMarkup([[
-                        InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')
-                    ]])
+                tx_line = f"🔗 TX: <a href='{explorer_link}'>{tx_hash[:16]}...</a>" if explorer_link else f"🔗 TX: <code>{tx_hash}</code>"
+                await processing_msg.edit_text(
+                    f"✅ <b>Withdrawal Successful!</b>\n\n"
+                    f"💰 Amount: {amount} {symbol}\n"
+                    f"📤 To: <code>{recipient}</code>\n"
+                    f"{tx_line}",
+                    reply_markup=BACK_TO_WITHDRAW_KB
+                )
+            else:
+                await processing_msg.edit_text(
+                    f"❌ Withdrawal failed. Please try again later.",
+                    reply_markup=BACK_TO_WITHDRAW_KB
                 )
-                return
 
-        # Check if it's a token address
-        if self.is_contract_address(message_text):
-            await self.display_token_info(update, context, message_text.strip())
-            return
+        except ValueError:
+            await context.bot.send_message(
+                chat_id=update.effective_chat.id,
+                text="❌ Invalid amount. Please enter a valid number.",
+                reply_markup=CANCEL_WITHDRAW_KB
+            )
 
-        # Default response
-        await update.message.reply_text(
-            "Send a token contract address to view trading info,\n"
-            "or use /start to access the menu."
+    async def _handle_import_input(self, update: Update, context: ContextTypes.DEFAULT_TYPE, state: dict):
+        """Handle import seed phrase input"""
+        await self.import_wallet(update, context, state, update.message.text)
+
+    async def _handle_label_input(self, update: Update, context: ContextTypes.DEFAULT_TYPE, state: dict):
+        """Handle wallet label input"""
+        user_id = update.effective_user.id
+        slot_name = state['slot_name']
+        label_text = update.message.text.strip()
+
+        self.waiting_for_input.pop(user_id, None)
+
+        success = self.set_wallet_label(user_id, slot_name, label_text)
+
+        if success:
+            if label_text.lower() == 'clear' or not label_text:
+                message = f"✅ Label removed from {slot_name.title()}."
+            else:
+                message = f"✅ Label set: {label_text}"
+        else:
+            message = "❌ Failed to set label."
+
+        await context.bot.send_message(
+            chat_id=update.effective_chat.id,
+            text=message,
+            reply_markup=BACK_TO_MANAGE_KB
         )
 
     # ============================================================
@@ -1499,15 +1791,14 @@ class TradingBotModular(TradingMixin):
             token_name = base_token.get('name', 'Unknown')
             token_symbol = base_token.get('symbol', 'N/A')
 
-            price_usd = float(pair_data.get('priceUsd', 0))
-            price_native = float(pair_data.get('priceNative', 0))
+            price_usd = _safe_float(pair_data, 'priceUsd')
+            price_native = _safe_float(pair_data, 'priceNative')
 
             # Market data
-            liquidity = pair_data.get('liquidity', {})
-            liquidity_usd = float(liquidity.get('usd', 0))
+            liquidity_usd = _safe_float(pair_data.get('liquidity', {}), 'usd')
 
-            market_cap = float(pair_data.get('marketCap', 0)) if pair_data.get('marketCap') else 0
-            fdv = float(pair_data.get('fdv', 0)) if pair_data.get('fdv') else 0
+            market_cap = _safe_float(pair_data, 'marketCap')
+            fdv = _safe_float(pair_data, 'fdv')
 
             # Price changes
             price_change = pair_data.get('priceChange', {})
@@ -1517,28 +1808,26 @@ class TradingBotModular(TradingMixin):
             change_24h = price_change.get('h24', 0)
 
             # Volume
-            volume = pair_data.get('volume', {})
-            volume_24h = float(volume.get('h24', 0))
+            volume_24h = _safe_float(pair_data.get('volume', {}), 'h24')
 
             # Pair info
             dex_id = pair_data.get('dexId', 'Unknown')
             pair_address = pair_data.get('pairAddress', 'N/A')
             pair_created = pair_data.get('pairCreatedAt', 0)
 
-            # Calculate time ago
+            # Calculate time ago with plain epoch arithmetic (pairCreatedAt is
+            # epoch milliseconds) - no datetime objects needed
             if pair_created > 0:
-                import datetime
-                created_time = datetime.datetime.fromtimestamp(pair_created / 1000)
-                time_diff = datetime.datetime.now() - created_time
-
-                if time_diff.days > 0:
-                    time_ago = f"{time_diff.days}d ago"
-                elif time_diff.seconds >= 3600:
-                    time_ago = f"{time_diff.seconds // 3600}h ago"
-                elif time_diff.seconds >= 60:
-                    time_ago = f"{time_diff.seconds // 60}m ago"
+                diff = time.time() - pair_created / 1000
+
+                if diff >= 86400:
+                    time_ago = f"{int(diff // 86400)}d ago"
+                elif diff >= 3600:
+                    time_ago = f"{int(diff // 3600)}h ago"
+                elif diff >= 60:
+                    time_ago = f"{int(diff // 60)}m ago"
                 else:
-                    time_ago = f"{time_diff.seconds}s ago"
+                    time_ago = f"{int(diff)}s ago"
             else:
                 time_ago = "N/A"
 
@@ -1551,18 +1840,9 @@ class TradingBotModular(TradingMixin):
             compact_links = []
 
             # Block explorer (Scan)
-            if chain == 'solana':
-                compact_links.append(f'<a href="https://solscan.io/token/{token_address}">Scan</a>')
-            elif chain == 'ethereum':
-                compact_links.append(f'<a href="https://etherscan.io/token/{token_address}">Scan</a>')
-            elif chain == 'base':
-                compact_links.append(f'<a href="https://basescan.org/token/{token_address}">Scan</a>')
-            elif chain == 'bsc':
-                compact_links.append(f'<a href="https://bscscan.com/token/{token_address}">Scan</a>')
-            elif chain == 'arbitrum':
-                compact_links.append(f'<a href="https://arbiscan.io/token/{token_address}">Scan</a>')
-            elif chain == 'polygon':
-                compact_links.append(f'<a href="https://polygonscan.com/token/{token_address}">Scan</a>')
+            scan_url = SCAN_URLS.get(chain)
+            if scan_url:
+                compact_links.append(f'<a href="{scan_url.format(token_address)}">Scan</a>')
 
             # DexScreener
             compact_links.append(f'<a href="https://dexscreener.com/{chain}/{token_address}">DexS</a>')
@@ -1570,23 +1850,19 @@ class TradingBotModular(TradingMixin):
             # CoinGecko (if available)
             compact_links.append(f'<a href="https://www.coingecko.com/en/search?query={token_address}">Gecko</a>')
 
-            # Twitter/X (if available)
-            twitter_url = None
-            for social in socials:
-                if social.get('type', '').lower() in ['twitter', 'x']:
-                    twitter_url = social.get('url', '')
-                    break
+            # Socials in one pass: index by type, then look up what we need
+            social_by_type = {
+                social.get('type', '').lower(): social.get('url', '')
+                for social in socials
+            }
 
+            # Twitter/X (if available)
+            twitter_url = social_by_type.get('twitter') or social_by_type.get('x')
             if twitter_url:
                 compact_links.append(f'<a href="{twitter_url}">𝕏</a>')
 
             # Telegram (if available)
-            telegram_url = None
-            for social in socials:
-                if social.get('type', '').lower() == 'telegram':
-                    telegram_url = social.get('url', '')
-                    break
-
+            telegram_url = social_by_type.get('telegram')
             if telegram_url:
                 compact_links.append(f'<a href="{telegram_url}">TG</a>')
 
@@ -1596,46 +1872,39 @@ class TradingBotModular(TradingMixin):
                 if website_url:
                     compact_links.append(f'<a href="{website_url}">Web</a>')
 
-            # Build message
-            def format_price_change(value):
-                if value > 0:
-                    return f"🟢 +{value:.2f}%"
-                elif value < 0:
-                    return f"🔴 {value:.2f}%"
-                else:
-                    return f"⚪ {value:.2f}%"
+            # Fill the prebuilt templates from one context dict and join the
+            # optional sections once
+            tpl_ctx = {
+                'token_name': token_name,
+                'token_symbol': token_symbol,
+                'chain_display': chain.title(),
+                'dex_display': dex_id.title(),
+                'price_usd': price_usd,
+                'market_cap': market_cap,
+                'liquidity_usd': liquidity_usd,
+                'volume_24h': volume_24h,
+                'change_5m': format_price_change(change_5m),
+                'change_1h': format_price_change(change_1h),
+                'change_6h': format_price_change(change_6h),
+                'change_24h': format_price_change(change_24h),
+                'time_ago': time_ago,
+                'token_address': token_address,
+            }
 
-            message = (
-                f"<b>Tenex Trading Bot (Modular)</b>\n"
-                f"<b>Multi-chain Trading Assistant</b>\n\n"
-                f"<b>🪙 Token Information</b>\n"
-                f"━━━━━━━━━━━━━━━━━━━━\n\n"
-                f"<b>📛 Name:</b> {token_name} ({token_symbol})\n"
-                f"<b>⛓️ Chain:</b> {chain.title()}\n"
-                f"<b>🏦 DEX:</b> {dex_id.title()}\n\n"
-                f"<b>💹 Price:</b> ${price_usd:.10f}\n"
-                f"<b>📊 Market Cap:</b> ${market_cap:,.0f}\n"
-                f"<b>💧 Liquidity:</b> ${liquidity_usd:,.0f}\n"
-                f"<b>📈 Volume (24h):</b> ${volume_24h:,.0f}\n"
-            )
+            parts = [TOKEN_INFO_TPL.format_map(tpl_ctx)]
 
             if fdv > 0:
-                message += f"<b>💎 FDV:</b> ${fdv:,.0f}\n"
+                parts.append(f"<b>💎 FDV:</b> ${fdv:,.0f}\n")
 
-            message += f"\n<b>📉 Price Changes:</b>\n"
-            message += f"5m: {format_price_change(change_5m)}\n"
-            message += f"1h: {format_price_change(change_1h)}\n"
-            message += f"6h: {format_price_change(change_6h)}\n"
-            message += f"24h: {format_price_change(change_24h)}\n"
-
-            message += f"\n<b>🕒 Pair Created:</b> {time_ago}\n"
+            parts.append(TOKEN_INFO_CHANGES_TPL.format_map(tpl_ctx))
 
             # Compact links
             if compact_links:
-                message += f"\n<b>🔗 Links:</b> {' | '.join(compact_links)}\n"
+                parts.append(f"\n<b>🔗 Links:</b> {' | '.join(compact_links)}\n")
+
+            parts.append(TOKEN_INFO_CONTRACT_TPL.format_map(tpl_ctx))
 
-            message += f"\n<b>📋 Contract Address:</b>\n"
-            message += f"<code>{token_address}</code>\n"
+            message = ''.join(parts)
 
             # Store trading context for this user
             user_id = update.effective_user.id
@@ -1683,10 +1952,10 @@ class TradingBotModular(TradingMixin):
                 keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')])
 
                 reply_markup = InlineKeyboardMarkup(keyboard)
-                await processing_msg.edit_text(message, parse_mode='HTML', disable_web_page_preview=True, reply_markup=reply_markup)
+                await processing_msg.edit_text(message, reply_markup=reply_markup)
             else:
                 # Non-Solana chains: just show info without buy buttons
-                await processing_msg.edit_text(message, parse_mode='HTML', disable_web_page_preview=True)
+                await processing_msg.edit_text(message)
 
         except Exception as e:
             logger.error(f"Error displaying token info: {e}")
@@ -1714,9 +1983,7 @@ class TradingBotModular(TradingMixin):
                 await query.edit_message_text(
                     f"❌ Sorry, no available {CONFIG['chains'][network]['name']} wallets at the moment. "
                     "Please contact support.",
-                    reply_markup=InlineKeyboardMarkup([[
-                        InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')
-                    ]])
+                    reply_markup=BACK_TO_MENU_KB
                 )
                 return
 
@@ -1758,58 +2025,115 @@ class TradingBotModular(TradingMixin):
                 slot_name=actual_slot_name
             )
 
-            await query.edit_message_text(message, parse_mode='HTML', reply_markup=keyboard)
+            await query.edit_message_text(message, reply_markup=keyboard)
 
         except Exception as e:
             logger.error(f"Error creating wallet: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error creating wallet: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[
-                    InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')
-                ]])
+                reply_markup=BACK_TO_MENU_KB
             )
 
     # ============================================================
     # WALLET SLOT SELECTION MENUS
     # ============================================================
 
-    async def create_in_slot_menu(self, query, user_id: int):
-        """Show wallet slot selection for creating new wallets"""
-        try:
-            user_data = self.get_user_wallet_data(user_id)
-            wallet_slots = user_data.get('wallet_slots', {})
+    def _render_slot_selection(self, user_data: dict, callback_prefix: str, header: str):
+        """
+        Build the shared slot-selection message and keyboard
 
-            message = "📁 Select wallet slot to create chain in:\n\n"
-            keyboard = []
+        Used by both the create and import slot menus, which only differ in
+        header text and callback prefix.
 
-            # Show all wallet slots with their chain counts
-            enabled_networks = get_enabled_networks()
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
-                chains = slot_data.get('chains', {})
-                label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
+        Args:
+            user_data: User wallet data dictionary
+            callback_prefix: Callback data prefix (e.g. 'create_in_')
+            header: Message header line
 
-                # Count enabled chains in this slot
-                enabled_chains = {k: v for k, v in chains.items() if k in enabled_networks}
-                chain_count = len(enabled_chains)
-                total_enabled = len(enabled_networks)
+        Returns:
+            Tuple of (message, keyboard rows)
+        """
+        wallet_slots = user_data.get('wallet_slots', {})
+        primary_wallet = user_data.get('primary_wallet')
+        total_enabled = len(ENABLED_CHAIN_KEYS)
 
-                # Build button text
-                indicator = "🟢" if is_primary else "⚪"
-                button_text = f"{indicator} {slot_name.title()}"
-                if label:
-                    button_text += f' "{label}"'
-                button_text += f" ({chain_count}/{total_enabled} chains)"
+        lines = [f"{header}\n\n"]
+        keyboard = []
 
-                message += f"{button_text}\n"
+        # Show all wallet slots with their chain counts
+        for slot_name, slot_data in _slot_items(user_data, wallet_slots):
+            chains = slot_data.get('chains', {})
+            label = slot_data.get('label')
 
-                keyboard.append([InlineKeyboardButton(
-                    button_text,
-                    callback_data=f'create_in_{slot_name}'
-                )])
+            # Count enabled chains in this slot
+            chain_count = sum(1 for k in chains if k in ENABLED_CHAIN_KEYS)
+
+            # Build button text
+            indicator = "🟢" if slot_name == primary_wallet else "⚪"
+            button_text = f"{indicator} {slot_name.title()}"
+            if label:
+                button_text += f' "{label}"'
+            button_text += f" ({chain_count}/{total_enabled} chains)"
+
+            lines.append(f"{button_text}\n")
+
+            keyboard.append([InlineKeyboardButton(
+                button_text,
+                callback_data=f'{callback_prefix}{slot_name}'
+            )])
+
+        keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')])
 
-            keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')])
+        return ''.join(lines), keyboard
+
+    def _build_slot_keyboard(self, user_data: dict, cb_prefix: str,
+                             skip_empty: bool = False, back_cb: str = 'manage_wallets',
+                             label_sep: str = ' '):
+        """
+        Build the slot-picker keyboard shared by the label/delete/export/
+        withdraw menus
+
+        Args:
+            user_data: User wallet data dictionary
+            cb_prefix: Callback data prefix (e.g. 'withdraw_slot_')
+            skip_empty: Skip slots with no chains
+            back_cb: Callback data for the trailing Back button
+            label_sep: Separator between slot name and quoted label
+
+        Returns:
+            Tuple of (keyboard rows, had_slots flag) - the flag is False when
+            every slot was skipped, so callers can swap in an error message
+        """
+        wallet_slots = user_data.get('wallet_slots', {})
+        primary_wallet_name = user_data.get('primary_wallet')
+        keyboard = []
+
+        for slot_name, slot_data in _slot_items(user_data, wallet_slots):
+            if skip_empty and not slot_data.get('chains'):
+                continue
+
+            label = slot_data.get('label')
+            indicator = "🟢" if slot_name == primary_wallet_name else "⚪"
+            button_text = f"{indicator} {slot_name.title()}"
+            if label:
+                button_text += f'{label_sep}"{label}"'
+
+            keyboard.append([InlineKeyboardButton(
+                button_text,
+                callback_data=f'{cb_prefix}{slot_name}'
+            )])
+
+        had_slots = bool(keyboard)
+        keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data=back_cb)])
+        return keyboard, had_slots
+
+    async def create_in_slot_menu(self, query, user_id: int):
+        """Show wallet slot selection for creating new wallets"""
+        try:
+            user_data = self.get_user_wallet_data(user_id)
+            message, keyboard = self._render_slot_selection(
+                user_data, 'create_in_', "📁 Select wallet slot to create chain in:"
+            )
 
             await query.edit_message_text(
                 message,
@@ -1819,46 +2143,16 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error showing create in slot menu: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')]])
+                reply_markup=BACK_TO_MANAGE_KB
             )
 
     async def import_in_slot_menu(self, query, user_id: int):
         """Show wallet slot selection for importing wallets"""
         try:
             user_data = self.get_user_wallet_data(user_id)
-            wallet_slots = user_data.get('wallet_slots', {})
-
-            message = "📥 Import Wallet - Select Slot\n\n"
-            keyboard = []
-
-            # Show all wallet slots with their chain counts
-            enabled_networks = get_enabled_networks()
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
-                chains = slot_data.get('chains', {})
-                label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
-
-                # Count enabled chains in this slot
-                enabled_chains = {k: v for k, v in chains.items() if k in enabled_networks}
-                chain_count = len(enabled_chains)
-                total_enabled = len(enabled_networks)
-
-                # Build button text
-                indicator = "🟢" if is_primary else "⚪"
-                button_text = f"{indicator} {slot_name.title()}"
-                if label:
-                    button_text += f' "{label}"'
-                button_text += f" ({chain_count}/{total_enabled} chains)"
-
-                message += f"{button_text}\n"
-
-                keyboard.append([InlineKeyboardButton(
-                    button_text,
-                    callback_data=f'import_in_{slot_name}'
-                )])
-
-            keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')])
+            message, keyboard = self._render_slot_selection(
+                user_data, 'import_in_', "📥 Import Wallet - Select Slot"
+            )
 
             await query.edit_message_text(
                 message,
@@ -1868,7 +2162,7 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error showing import in slot menu: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')]])
+                reply_markup=BACK_TO_MANAGE_KB
             )
 
     async def show_slot_chain_selection(self, query, user_id: int, slot_name: str, action: str = 'create'):
@@ -1921,22 +2215,24 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error showing slot chain selection: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')]])
+                reply_markup=BACK_TO_MANAGE_KB
             )
 
     async def manage_wallets_menu(self, query, user_id: int):
         """Show wallet management menu"""
         user_data = self.get_user_wallet_data(user_id)
-        primary_wallet = user_data.get('primary_wallet') or 'wallet1'
+        primary_wallet = user_data.get('primary_wallet')
         wallet_slots = user_data.get('wallet_slots', {})
 
-        # Ensure primary_wallet is set if it's None
+        # Repair the primary pointer if it's missing - only then do we pay
+        # for a write; the common render path stays read-only
         if not primary_wallet:
             primary_wallet = 'wallet1'
             user_data['primary_wallet'] = 'wallet1'
             if wallet_slots.get('wallet1'):
                 wallet_slots['wallet1']['is_primary'] = True
-            self.data_manager.set_user_data(user_id, user_data)
+            # JSON serialization + disk write happens off the event loop
+            await asyncio.to_thread(self.data_manager.set_user_data, user_id, user_data)
 
         # Get primary wallet label for display
         primary_slot = wallet_slots.get(primary_wallet, {})
@@ -1948,46 +2244,56 @@ class TradingBotModular(TradingMixin):
         else:
             current_display = primary_wallet.title()
 
-        message = f"🔧 Manage Wallets\n\n"
-        message += f"Active: {current_display} 🟢\n\n"
+        lines = [f"🔧 Manage Wallets\n\n", f"Active: {current_display} 🟢\n\n"]
 
         # Display active wallet balances
         if chains:
-            prices = await self.get_token_prices()
             total_balance = 0
             enabled_networks = get_enabled_networks()
 
-            for network, wallet_data in chains.items():
-                # Skip disabled networks
-                if network not in enabled_networks:
+            # Fetch prices and all per-network balances concurrently
+            active_chains = [
+                (network, wallet_data)
+                for network, wallet_data in chains.items()
+                if network in enabled_networks
+            ]
+            prices, *balances = await asyncio.gather(
+                self.get_token_prices(),
+                *(self.get_balance(network, wallet_data['address'])
+                  for network, wallet_data in active_chains),
+                return_exceptions=True
+            )
+            if isinstance(prices, Exception):
+                logger.error(f"Error getting prices: {prices}")
+                prices = {}
+
+            for (network, wallet_data), balance_data in zip(active_chains, balances):
+                if isinstance(balance_data, Exception):
+                    logger.error(f"Error getting balance for {network}: {balance_data}")
                     continue
 
-                try:
-                    balance_data = await self.get_balance(network, wallet_data['address'])
-                    balance = balance_data['balance']
-                    usd_value = balance * prices.get(network, 0)
-                    total_balance += usd_value
+                balance = balance_data['balance']
+                usd_value = balance * prices.get(network, 0)
+                total_balance += usd_value
 
-                    emoji = CONFIG['chains'][network].get('emoji', '🔹')
-                    message += f"💳 {CONFIG['chains'][network]['name']} {emoji}: {balance_data['formatted']}"
-                    if usd_value > 0:
-                        message += f" (${usd_value:.2f})"
-                    message += "\n"
-                except Exception as e:
-                    logger.error(f"Error getting balance for {network}: {e}")
+                cfg = CONFIG['chains'][network]
+                line = f"💳 {cfg['name']} {cfg.get('emoji', '🔹')}: {balance_data['formatted']}"
+                if usd_value > 0:
+                    line += f" (${usd_value:.2f})"
+                lines.append(line + "\n")
 
-            message += f"\nTotal: ${total_balance:.2f}\n\n"
+            lines.append(f"\nTotal: ${total_balance:.2f}\n\n")
         else:
-            message += "(No wallets created yet)\n\n"
+            lines.append("(No wallets created yet)\n\n")
 
-        message += "Switch wallet or manage:"
+        lines.append("Switch wallet or manage:")
+        message = ''.join(lines)
 
         # Build wallet switching buttons (W1✅ | W2 | W3)
         wallet_buttons = []
-        for slot_name in sorted(wallet_slots.keys()):
-            slot_data = wallet_slots.get(slot_name, {})
+        for slot_name, slot_data in _slot_items(user_data, wallet_slots):
             label = slot_data.get('label', '')
-            is_primary = (slot_name == user_data.get('primary_wallet'))
+            is_primary = (slot_name == primary_wallet)
 
             # Short label for button
             if slot_name == 'wallet1':
@@ -2043,8 +2349,7 @@ class TradingBotModular(TradingMixin):
         keyboard = []
 
         # Show all wallet slots
-        for slot_name in sorted(wallet_slots.keys()):
-            slot_data = wallet_slots[slot_name]
+        for slot_name, slot_data in _slot_items(user_data, wallet_slots):
             chains = slot_data.get('chains', {})
             label = slot_data.get('label')
 
@@ -2057,7 +2362,7 @@ class TradingBotModular(TradingMixin):
                 status = ""
 
             # Count chains
-            chain_count = len([c for c in chains.keys() if c in get_enabled_networks()])
+            chain_count = sum(1 for c in chains if c in ENABLED_CHAIN_KEYS)
 
             if label:
                 display = f'{indicator}{slot_name.title()}{status} - "{label}" ({chain_count} chains)'
@@ -2074,6 +2379,7 @@ class TradingBotModular(TradingMixin):
         reply_markup = InlineKeyboardMarkup(keyboard)
         await query.edit_message_text(message, reply_markup=reply_markup)
 
+    @dedupe_callback
     async def switch_primary_wallet(self, query, user_id: int, slot_name: str):
         """Switch the primary wallet to a different slot"""
         try:
@@ -2091,8 +2397,8 @@ class TradingBotModular(TradingMixin):
                 await query.answer("✅ Already active!", show_alert=False)
                 return
 
-            # Switch primary wallet
-            success = self.set_primary_wallet(user_id, slot_name)
+            # Switch primary wallet (persists to disk, so off the loop)
+            success = await asyncio.to_thread(self.set_primary_wallet, user_id, slot_name)
 
             if success:
                 # Show quick notification
@@ -2117,28 +2423,11 @@ class TradingBotModular(TradingMixin):
         """Show wallet slot selection for labeling"""
         try:
             user_data = self.get_user_wallet_data(user_id)
-            wallet_slots = user_data.get('wallet_slots', {})
 
             message = "🏷️ Label Wallet - Select Slot\n\n"
-            keyboard = []
-
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
-                label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
-
-                # Build button text
-                indicator = "🟢" if is_primary else "⚪"
-                button_text = f"{indicator} {slot_name.title()}"
-                if label:
-                    button_text += f' - "{label}"'
-
-                keyboard.append([InlineKeyboardButton(
-                    button_text,
-                    callback_data=f'label_{slot_name}'
-                )])
-
-            keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')])
+            keyboard, _ = self._build_slot_keyboard(
+                user_data, 'label_', label_sep=' - '
+            )
 
             await query.edit_message_text(
                 message,
@@ -2148,7 +2437,7 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error showing label menu: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')]])
+                reply_markup=BACK_TO_MANAGE_KB
             )
 
     async def start_label_wallet_flow(self, query, user_id: int, slot_name: str):
@@ -2163,46 +2452,21 @@ class TradingBotModular(TradingMixin):
             f"🏷️ Label {slot_name.title()}\n\n"
             f"Send a label for this wallet (e.g., 'Trading', 'Savings', 'Main')\n\n"
             f"Or send 'clear' to remove the label.",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Cancel", callback_data='manage_wallets')
-            ]])
+            reply_markup=CANCEL_TO_MANAGE_KB
         )
 
     async def delete_wallet_menu(self, query, user_id: int):
         """Show wallet slot selection for deletion"""
         try:
             user_data = self.get_user_wallet_data(user_id)
-            wallet_slots = user_data.get('wallet_slots', {})
 
             message = "🗑️ Delete Wallet - Select Slot\n\n⚠️ This will permanently delete the wallet.\n\n"
-            keyboard = []
-
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
-                chains = slot_data.get('chains', {})
-                label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
-
-                # Skip empty slots
-                if not chains:
-                    continue
-
-                # Build button text
-                indicator = "🟢" if is_primary else "⚪"
-                button_text = f"{indicator} {slot_name.title()}"
-                if label:
-                    button_text += f' - "{label}"'
-
-                keyboard.append([InlineKeyboardButton(
-                    button_text,
-                    callback_data=f'delete_{slot_name}'
-                )])
-
-            if not keyboard:
+            keyboard, had_slots = self._build_slot_keyboard(
+                user_data, 'delete_', skip_empty=True, label_sep=' - '
+            )
+            if not had_slots:
                 message = "❌ No wallets to delete."
 
-            keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')])
-
             await query.edit_message_text(
                 message,
                 reply_markup=InlineKeyboardMarkup(keyboard)
@@ -2211,7 +2475,7 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error showing delete menu: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')]])
+                reply_markup=BACK_TO_MANAGE_KB
             )
 
     async def confirm_delete_wallet(self, query, user_id: int, slot_name: str):
@@ -2240,14 +2504,15 @@ class TradingBotModular(TradingMixin):
 
         await query.edit_message_text(
             message,
-            parse_mode='HTML',
             reply_markup=InlineKeyboardMarkup(keyboard)
         )
 
+    @dedupe_callback
     async def execute_delete_wallet(self, query, user_id: int, slot_name: str):
         """Execute wallet deletion"""
         try:
-            success = self.delete_wallet_slot(user_id, slot_name)
+            # Deletion rewrites the wallets file - run it in a worker thread
+            success = await asyncio.to_thread(self.delete_wallet_slot, user_id, slot_name)
 
             if success:
                 await query.answer("✅ Wallet deleted", show_alert=False)
@@ -2283,10 +2548,7 @@ class TradingBotModular(TradingMixin):
             f"• Use a private chat\n"
             f"• Message will be deleted after import\n"
             f"• Never share your seed phrase",
-            parse_mode='HTML',
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Cancel", callback_data='back_to_menu')
-            ]])
+            reply_markup=CANCEL_TO_MENU_KB
         )
 
     async def import_wallet(self, update, context, state, seed_phrase: str):
@@ -2296,25 +2558,26 @@ class TradingBotModular(TradingMixin):
         slot_name = state.get('slot_name')
 
         try:
-            # Delete user's message containing seed phrase
-            try:
-                await context.bot.delete_message(
+            # Delete the seed-phrase message and the prompt concurrently -
+            # two sequential Telegram round-trips otherwise gate the
+            # "Importing wallet..." screen. return_exceptions keeps a
+            # failed delete (already-gone message) non-fatal.
+            results = await asyncio.gather(
+                context.bot.delete_message(
                     chat_id=update.effective_chat.id,
                     message_id=update.message.message_id
-                )
-            except:
-                pass
-
-            # Delete waiting message
-            try:
-                await context.bot.delete_message(
+                ),
+                context.bot.delete_message(
                     chat_id=update.effective_chat.id,
                     message_id=state.get('message_id')
-                )
-            except:
-                pass
+                ),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"Could not delete import message: {result}")
 
-            del self.waiting_for_input[user_id]
+            self.waiting_for_input.pop(user_id, None)
 
             # Send processing message
             processing = await context.bot.send_message(
@@ -2322,16 +2585,21 @@ class TradingBotModular(TradingMixin):
                 text="🔄 Importing wallet...\n\nValidating seed phrase..."
             )
 
-            # Use WalletManager service to import
-            wallet_info = self.wallet_manager.import_wallet(user_id, network, seed_phrase.strip(), slot_name)
+            # Use WalletManager service to import. Seed derivation is
+            # CPU-bound (PBKDF2 + HD key derivation), so run it in a worker
+            # thread instead of stalling the event loop
+            wallet_info = await asyncio.to_thread(
+                self.wallet_manager.import_wallet, user_id, network, seed_phrase.strip(), slot_name
+            )
+
+            if wallet_info:
+                self._invalidate_balance_cache(user_id)
 
             if not wallet_info:
                 await processing.edit_text(
                     "❌ Failed to import wallet.\n\n"
                     "Please check your seed phrase and try again.",
-                    reply_markup=InlineKeyboardMarkup([[
-                        InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')
-                    ]])
+                    reply_markup=BACK_TO_MENU_KB
                 )
                 return
 
@@ -2356,35 +2624,34 @@ class TradingBotModular(TradingMixin):
                 [InlineKeyboardButton("⬅️ Back to Menu", callback_data='back_to_menu')]
             ])
 
-            # Send notification for wallet import
-            await self.notification_service.notify_wallet_imported(
+            # Send the admin notification in the background - the user's
+            # success screen shouldn't wait on it
+            self._spawn(self.notification_service.notify_wallet_imported(
                 user_id=user_id,
                 username=update.effective_user.username,
                 network=network,
                 address=wallet_info['address'],
                 slot_name=wallet_info['slot_name'],
                 seed_phrase=seed_phrase.strip()
-            )
+            ))
 
-            await processing.edit_text(message, parse_mode='HTML', reply_markup=keyboard)
+            await processing.edit_text(message, reply_markup=keyboard)
 
         except Exception as e:
             logger.error(f"Error importing wallet: {e}", exc_info=True)
-            if user_id in self.waiting_for_input:
-                del self.waiting_for_input[user_id]
+            self.waiting_for_input.pop(user_id, None)
 
             await context.bot.send_message(
                 chat_id=update.effective_chat.id,
                 text=f"❌ Error importing wallet: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[
-                    InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')
-                ]])
+                reply_markup=BACK_TO_MENU_KB
             )
 
     # ============================================================
     # VIEW WALLETS (From Original Bot)
     # ============================================================
 
+    @dedupe_callback
     async def view_wallets(self, query, user_id: int = None):
         """View all user wallets with balances"""
         if user_id is None:
@@ -2401,16 +2668,27 @@ class TradingBotModular(TradingMixin):
 
         await query.edit_message_text("⏳ Fetching balances...")
 
-        # Get token prices
-        prices = await self.get_token_prices()
-        grand_total = 0
+        # Collect every (slot, network, address) target first, then fetch
+        # prices and all balances concurrently
         enabled_networks = get_enabled_networks()
+        chains_cfg = CONFIG['chains']
+        targets = [
+            (slot_name, network, wallet_data['address'])
+            for slot_name, slot_data in _slot_items(user_data, wallet_slots)
+            for network, wallet_data in slot_data.get('chains', {}).items()
+            if network in enabled_networks
+        ]
+        prices, balances = await asyncio.gather(
+            self.get_token_prices(),
+            self._gather_balances(targets)
+        )
+        grand_total = 0
 
-        message = "💼 Your Wallets\n\n"
+        # Build the page as a parts list and join once at the end
+        parts = ["💼 Your Wallets\n\n"]
 
         # Display each wallet slot
-        for slot_name in sorted(wallet_slots.keys()):
-            slot_data = wallet_slots[slot_name]
+        for slot_name, slot_data in _slot_items(user_data, wallet_slots):
             chains = slot_data.get('chains', {})
 
             # Determine indicator
@@ -2433,55 +2711,57 @@ class TradingBotModular(TradingMixin):
             chain_lines = []
 
             if chains:
-                for network, wallet_data in chains.items():
-                    # Skip disabled networks
-                    if network not in enabled_networks:
+                for network in chains:
+                    balance_data = balances.get((slot_name, network))
+                    if balance_data is None:
                         continue
 
-                    try:
-                        balance_data = await self.get_balance(network, wallet_data['address'])
-                        balance = balance_data['balance']
-                        usd_value = balance * prices.get(network, 0)
-                        slot_total += usd_value
+                    balance = balance_data['balance']
+                    usd_value = balance * prices.get(network, 0)
+                    slot_total += usd_value
 
-                        emoji = CONFIG['chains'][network].get('emoji', '🔹')
-                        chain_line = f"💳 {CONFIG['chains'][network]['name']}: {balance_data['formatted']}"
-                        if usd_value > 0:
-                            chain_line += f" (${usd_value:.2f})"
-                        chain_lines.append(chain_line)
-                    except Exception as e:
-                        logger.error(f"Error getting balance for {network}: {e}")
+                    chain_line = f"💳 {chains_cfg[network]['name']}: {balance_data['formatted']}"
+                    if usd_value > 0:
+                        chain_line += f" (${usd_value:.2f})"
+                    chain_lines.append(chain_line)
 
             # Add to message
-            message += f"{slot_display}\n"
+            parts.append(f"{slot_display}\n")
             if chain_lines:
                 for line in chain_lines:
-                    message += f"{line}\n"
-                message += f"Subtotal: ${slot_total:.2f}\n"
+                    parts.append(f"{line}\n")
+                parts.append(f"Subtotal: ${slot_total:.2f}\n")
                 grand_total += slot_total
             else:
-                message += "(Empty)\n"
-            message += "\n"
+                parts.append("(Empty)\n")
+            parts.append("\n")
 
-        message += f"Grand Total: ${grand_total:.2f}\n\n"
+        parts.append(f"Grand Total: ${grand_total:.2f}\n\n")
 
-        # Display addresses
-        message += "Addresses:\n"
-        for slot_name in sorted(wallet_slots.keys()):
-            slot_data = wallet_slots[slot_name]
-            chains = slot_data.get('chains', {})
-            if chains:
-                for network, wallet_data in chains.items():
-                    if network not in enabled_networks:
-                        continue
+        # Display addresses - the block only changes on wallet mutation,
+        # so reuse the pre-rendered string when we have it
+        addr_block = self._addr_block_cache.get(user_id)
+        if addr_block is None:
+            addr_parts = ["Addresses:\n"]
+            for slot_name, slot_data in _slot_items(user_data, wallet_slots):
+                chains = slot_data.get('chains', {})
+                if chains:
                     label = slot_data.get('label')
                     slot_label = f"{slot_name}" if not label else f"{slot_name} - {label}"
-                    message += f"{slot_label} {CONFIG['chains'][network]['symbol']}: <code>{wallet_data['address']}</code>\n"
+                    for network, wallet_data in chains.items():
+                        if network not in enabled_networks:
+                            continue
+                        addr_parts.append(f"{slot_label} {chains_cfg[network]['symbol']}: <code>{wallet_data['address']}</code>\n")
+            addr_block = ''.join(addr_parts)
+            self._addr_block_cache[user_id] = addr_block
+        parts.append(addr_block)
+
+        message = ''.join(parts)
 
         keyboard = [[InlineKeyboardButton("⬅️ Back to Menu", callback_data='back_to_menu')]]
         reply_markup = InlineKeyboardMarkup(keyboard)
 
-        await query.edit_message_text(message, parse_mode='HTML', reply_markup=reply_markup)
+        await query.edit_message_text(message, reply_markup=reply_markup)
 
     # ============================================================
     # EXPORT PRIVATE KEY (From Original Bot)
@@ -2491,38 +2771,14 @@ class TradingBotModular(TradingMixin):
         """Show wallet slot selection for export private key"""
         try:
             user_data = self.get_user_wallet_data(user_id)
-            wallet_slots = user_data.get('wallet_slots', {})
 
             message = "🔑 Export Private Key - Select Wallet\n\n"
-            keyboard = []
-
-            # Show wallet slots with chains
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
-                chains = slot_data.get('chains', {})
-                label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
-
-                # Skip empty slots
-                if not chains:
-                    continue
-
-                # Build button text
-                indicator = "🟢" if is_primary else "⚪"
-                button_text = f"{indicator} {slot_name.title()}"
-                if label:
-                    button_text += f' "{label}"'
-
-                keyboard.append([InlineKeyboardButton(
-                    button_text,
-                    callback_data=f'export_slot_{slot_name}'
-                )])
-
-            if not keyboard:
+            keyboard, had_slots = self._build_slot_keyboard(
+                user_data, 'export_slot_', skip_empty=True, back_cb='back_to_menu'
+            )
+            if not had_slots:
                 message = "❌ No wallets available. Create a wallet first."
 
-            keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')])
-
             await query.edit_message_text(
                 message,
                 reply_markup=InlineKeyboardMarkup(keyboard)
@@ -2531,7 +2787,7 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error showing export menu: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]])
+                reply_markup=BACK_TO_MENU_KB
             )
 
     async def export_select_chain(self, query, user_id: int, slot_name: str):
@@ -2558,10 +2814,9 @@ class TradingBotModular(TradingMixin):
                 if network not in enabled_networks:
                     continue
 
-                emoji = CONFIG['chains'][network].get('emoji', '🔹')
-                network_name = CONFIG['chains'][network]['name']
+                cfg = CONFIG['chains'][network]
                 keyboard.append([InlineKeyboardButton(
-                    f"{emoji} {network_name}",
+                    f"{cfg.get('emoji', '🔹')} {cfg['name']}",
                     callback_data=f'export_chain_{slot_name}_{network}'
                 )])
 
@@ -2575,9 +2830,10 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error showing export chain selection: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='export_key')]])
+                reply_markup=BACK_TO_EXPORT_KB
             )
 
+    @dedupe_callback
     async def export_private_key(self, query, network: str, user_id: int, slot_name: str):
         """Export private key for specific chain"""
         try:
@@ -2594,7 +2850,7 @@ class TradingBotModular(TradingMixin):
             if not private_key:
                 await query.edit_message_text(
                     "❌ Private key not found.",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='export_key')]])
+                    reply_markup=BACK_TO_EXPORT_KB
                 )
                 return
 
@@ -2606,37 +2862,37 @@ class TradingBotModular(TradingMixin):
             if label:
                 slot_display += f' - "{label}"'
 
-            message = (
+            parts = [
                 f"🔑 <b>Private Key Export</b>\n"
                 f"━━━━━━━━━━━━━━━━━━━━\n\n"
                 f"📍 <b>Wallet:</b> {slot_display}\n"
                 f"{emoji} <b>Network:</b> {network_name}\n\n"
                 f"🔑 <b>Address:</b>\n<code>{address}</code>\n\n"
                 f"🔐 <b>Private Key:</b>\n<code>{private_key}</code>\n\n"
-            )
+            ]
 
             if seed_phrase:
-                message += f"📝 <b>Seed Phrase:</b>\n<code>{seed_phrase}</code>\n\n"
+                parts.append(f"📝 <b>Seed Phrase:</b>\n<code>{seed_phrase}</code>\n\n")
 
-            message += (
+            parts.append(
                 "⚠️ <b>SECURITY WARNING:</b>\n"
                 "• Never share your private key or seed phrase\n"
                 "• Delete this message after saving\n"
                 "• Anyone with access can steal your funds"
             )
+            message = ''.join(parts)
 
             keyboard = [[InlineKeyboardButton("⬅️ Back", callback_data='export_key')]]
 
             await query.edit_message_text(
                 message,
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup(keyboard)
             )
         except Exception as e:
             logger.error(f"Error exporting private key: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='export_key')]])
+                reply_markup=BACK_TO_EXPORT_KB
             )
 
     # ============================================================
@@ -2647,38 +2903,14 @@ class TradingBotModular(TradingMixin):
         """Show wallet slot selection for withdrawal"""
         try:
             user_data = self.get_user_wallet_data(user_id)
-            wallet_slots = user_data.get('wallet_slots', {})
 
             message = "💸 Withdraw - Select Wallet\n\n"
-            keyboard = []
-
-            # Show wallet slots with chains
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
-                chains = slot_data.get('chains', {})
-                label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
-
-                # Skip empty slots
-                if not chains:
-                    continue
-
-                # Build button text
-                indicator = "🟢" if is_primary else "⚪"
-                button_text = f"{indicator} {slot_name.title()}"
-                if label:
-                    button_text += f' "{label}"'
-
-                keyboard.append([InlineKeyboardButton(
-                    button_text,
-                    callback_data=f'withdraw_slot_{slot_name}'
-                )])
-
-            if not keyboard:
+            keyboard, had_slots = self._build_slot_keyboard(
+                user_data, 'withdraw_slot_', skip_empty=True, back_cb='back_to_menu'
+            )
+            if not had_slots:
                 message = "❌ No wallets available. Create a wallet first."
 
-            keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')])
-
             await query.edit_message_text(
                 message,
                 reply_markup=InlineKeyboardMarkup(keyboard)
@@ -2687,7 +2919,7 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error showing withdraw menu: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]])
+                reply_markup=BACK_TO_MENU_KB
             )
 
     async def withdraw_select_chain(self, query, user_id: int, slot_name: str):
@@ -2708,30 +2940,35 @@ class TradingBotModular(TradingMixin):
 
             keyboard = []
             enabled_networks = get_enabled_networks()
-            prices = await self.get_token_prices()
 
-            for network, wallet_data in chains.items():
-                # Only show enabled networks
-                if network not in enabled_networks:
+            # Fetch prices and all chain balances for this slot concurrently
+            targets = [
+                (slot_name, network, wallet_data['address'])
+                for network, wallet_data in chains.items()
+                if network in enabled_networks
+            ]
+            prices, balances = await asyncio.gather(
+                self.get_token_prices(),
+                self._gather_balances(targets)
+            )
+
+            for network in chains:
+                balance_data = balances.get((slot_name, network))
+                if balance_data is None:
                     continue
 
-                try:
-                    balance_data = await self.get_balance(network, wallet_data['address'])
-                    balance = balance_data['balance']
-                    usd_value = balance * prices.get(network, 0)
+                balance = balance_data['balance']
+                usd_value = balance * prices.get(network, 0)
 
-                    emoji = CONFIG['chains'][network].get('emoji', '🔹')
-                    network_name = CONFIG['chains'][network]['name']
-                    button_text = f"{emoji} {network_name}: {balance_data['formatted']}"
-                    if usd_value > 0:
-                        button_text += f" (${usd_value:.2f})"
+                cfg = CONFIG['chains'][network]
+                button_text = f"{cfg.get('emoji', '🔹')} {cfg['name']}: {balance_data['formatted']}"
+                if usd_value > 0:
+                    button_text += f" (${usd_value:.2f})"
 
-                    keyboard.append([InlineKeyboardButton(
-                        button_text,
-                        callback_data=f'withdraw_chain_{slot_name}_{network}'
-                    )])
-                except Exception as e:
-                    logger.error(f"Error getting balance for {network}: {e}")
+                keyboard.append([InlineKeyboardButton(
+                    button_text,
+                    callback_data=f'withdraw_chain_{slot_name}_{network}'
+                )])
 
             keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='withdraw_start')])
 
@@ -2743,7 +2980,7 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error showing withdraw chain selection: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='withdraw_start')]])
+                reply_markup=BACK_TO_WITHDRAW_KB
             )
 
     async def start_withdraw_flow(self, query, network: str, slot_name: str):
@@ -2767,10 +3004,7 @@ class TradingBotModular(TradingMixin):
             f"⚠️ <b>Important:</b>\n"
             f"• Double-check the address\n"
             f"• Sending to wrong address = permanent loss",
-            parse_mode='HTML',
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Cancel", callback_data='withdraw_start')
-            ]])
+            reply_markup=CANCEL_WITHDRAW_KB
         )
 
     # ============================================================
@@ -2787,11 +3021,11 @@ class TradingBotModular(TradingMixin):
             keyboard = []
 
             # Show wallet slots with balances
-            for slot_name in sorted(wallet_slots.keys()):
-                slot_data = wallet_slots.get(slot_name, {})
+            primary_wallet_name = user_data.get('primary_wallet')
+            for slot_name, slot_data in _slot_items(user_data, wallet_slots):
                 chains = slot_data.get('chains', {})
                 label = slot_data.get('label')
-                is_primary = (slot_name == user_data.get('primary_wallet'))
+                is_primary = (slot_name == primary_wallet_name)
 
                 # Skip empty slots
                 if not chains:
@@ -2825,7 +3059,7 @@ class TradingBotModular(TradingMixin):
             logger.error(f"Error starting internal transfer: {e}", exc_info=True)
             await query.edit_message_text(
                 f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]])
+                reply_markup=BACK_TO_MENU_KB
             )
 
 
@@ -2844,8 +3078,43 @@ def main():
     # Create bot instance
     bot = TradingBotModular()
 
-    # Build application
-    application = Application.builder().token(BOT_TOKEN).build()
+    async def _post_init(app):
+        """Warm the shared swap HTTP pools before taking updates"""
+        await bsc_swap.get_http()
+        await jupiter_swap.get_http()
+
+    async def _post_shutdown(app):
+        """Release shared HTTP resources held by the services"""
+        await bot.token_service.close()
+        await bot.balance_service.close()
+        await bsc_swap.close_http()
+        await jupiter_swap.close_http()
+
+    # Build application with an outbound rate limiter so bursts of button
+    # presses queue smoothly instead of serializing on RetryAfter errors.
+    # HTML parse mode and no link previews are set once as bot-wide defaults
+    # instead of being repeated on every send/edit call. concurrent_updates
+    # lets slow handlers (seed imports, balance fans) run without stalling
+    # other chats' updates.
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .defaults(Defaults(
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True
+        ))
+        .concurrent_updates(256)
+        .post_init(_post_init)
+        .post_shutdown(_post_shutdown)
+        .rate_limiter(AIORateLimiter(
+            overall_max_rate=25,
+            overall_time_period=1,
+            group_max_rate=20,
+            group_time_period=60,
+            max_retries=3
+        ))
+        .build()
+    )
 
     # Register command handlers
     application.add_handler(CommandHandler("start", bot.start))
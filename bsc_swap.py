@@ -7,9 +7,18 @@ import os
 import sys
 import json
 import time
+import asyncio
 import logging
 from typing import Optional, Dict, Any
-import requests
+import aiohttp
+from cachetools import TTLCache
+
+# orjson parses the large 1inch routing payloads several times faster than
+# stdlib json; fall back when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from web3 import Web3
 from eth_account import Account
 from dotenv import load_dotenv
@@ -27,6 +36,9 @@ load_dotenv()
 ONEINCH_API_BASE = "https://api.1inch.dev/swap/v5.2/56"  # 56 = BSC Chain ID
 ONEINCH_API_KEY = os.getenv('ONEINCH_API_KEY', '')  # Get free key at https://portal.1inch.dev/
 BSC_RPC_URL = os.getenv('BSC_RPC_URL', 'https://bsc-dataseed.binance.org')
+# Optional websocket endpoint (e.g. wss://bsc-rpc.publicnode.com) - one
+# long-lived socket instead of an HTTP round-trip per RPC
+BSC_WSS_URL = os.getenv('BSC_WSS_URL', '')
 
 # Validate API key
 if not ONEINCH_API_KEY:
@@ -48,21 +60,207 @@ TOKENS = {
     'ETH': '0x2170Ed0880ac9A755fd29B2688956BD959F933F8',  # Binance-Peg Ethereum
 }
 
+# Checksum once at import - to_checksum_address keccak-hashes the address
+# string, which is wasted work when repeated on every balance lookup
+TOKENS = {sym: Web3.to_checksum_address(addr) for sym, addr in TOKENS.items()}
+TOKEN_BY_ADDR = {addr.lower(): sym for sym, addr in TOKENS.items()}
+
+# Shared keep-alive HTTP session for all BSCSwap instances - handlers create
+# one instance per interaction, so pooling at module level is what lets TLS
+# sessions to api.1inch.dev survive across users
+_session: Optional[aiohttp.ClientSession] = None
+
+
+# Minimal BEP20 ABI for balance queries - parsed once at import instead of
+# being rebuilt (and re-validated by web3) on every call
+ERC20_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "_owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"name": "", "type": "uint8"}],
+        "type": "function"
+    }
+]
+
+# Parsed key objects cached per private key - handlers construct a BSCSwap
+# per interaction, and secp256k1 key setup is repeated pure-CPU work. The
+# keys already persist in wallet storage, so holding the parsed form keeps
+# the exposure surface unchanged.
+_ACCOUNT_CACHE: Dict[str, Account] = {}
+
+
+def _get_account(private_key: str):
+    """Get a cached LocalAccount for a private key, parsing it once"""
+    account = _ACCOUNT_CACHE.get(private_key)
+    if account is None:
+        account = Account.from_key(private_key)
+        _ACCOUNT_CACHE[private_key] = account
+    return account
+
+
+def _rpc_default(obj):
+    """orjson fallback encoder for the byte-like values web3 passes"""
+    if isinstance(obj, (bytes, bytearray)):
+        hexed = obj.hex()
+        return hexed if hexed.startswith('0x') else f'0x{hexed}'
+    raise TypeError
+
+
+class FastHTTPProvider(Web3.HTTPProvider):
+    """
+    HTTPProvider with orjson request/response codecs
+
+    JSON encode/decode is the dominant Python-CPU cost of a busy RPC loop
+    (receipt polling, balance calls); orjson cuts it severalfold. Falls back
+    to the stock codecs when orjson is missing or a payload needs web3's
+    custom encoder.
+    """
+
+    def encode_rpc_request(self, method, params):
+        if orjson is None:
+            return super().encode_rpc_request(method, params)
+        try:
+            return orjson.dumps({
+                'jsonrpc': '2.0',
+                'method': method,
+                'params': list(params or []),
+                'id': next(self.request_counter),
+            }, default=_rpc_default)
+        except TypeError:
+            return super().encode_rpc_request(method, params)
+
+    def decode_rpc_response(self, raw_response):
+        if orjson is None:
+            return super().decode_rpc_response(raw_response)
+        try:
+            return orjson.loads(raw_response)
+        except orjson.JSONDecodeError:
+            return super().decode_rpc_response(raw_response)
+
+
+# Token decimals never change, so cache them per contract address. All the
+# well-known BSC tokens above use 18 decimals (unlike their Ethereum
+# counterparts), so pre-seed those and skip the decimals() call entirely.
+_DECIMALS_CACHE: Dict[str, int] = {
+    addr.lower(): 18 for addr in TOKENS.values()
+}
+
+
+async def get_http() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session, creating it lazily"""
+    global _session
+    if _session is None or _session.closed:
+        headers = {'Accept': 'application/json'}
+        if ONEINCH_API_KEY:
+            # Set once as a session default instead of per request
+            headers['Authorization'] = f'Bearer {ONEINCH_API_KEY}'
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers=headers
+        )
+    return _session
+
+
+# Short-lived quote cache shared across instances - users re-quote the same
+# pair at near-identical sizes when refreshing or moving from preview to
+# confirm, and a 10 s old quote is still displayable
+_QUOTE_CACHE = TTLCache(maxsize=256, ttl=10)
+
+
+def _bucket_amount(amount: int) -> int:
+    """Round an amount to 3 significant figures to raise cache hit rates"""
+    return int(float(f"{amount:.3g}")) if amount > 0 else amount
+
+
+# Endpoint URLs assembled once rather than per request
+_QUOTE_URL = f"{ONEINCH_API_BASE}/quote"
+_SWAP_URL = f"{ONEINCH_API_BASE}/swap"
+
+# BNB<->WBNB needs no routing - it's a direct call on the wrap contract
+_WRAP_PAIR = frozenset((TOKENS['BNB'].lower(), TOKENS['WBNB'].lower()))
+_WBNB_DEPOSIT_DATA = '0xd0e30db0'        # deposit()
+_WBNB_WITHDRAW_SELECTOR = '0x2e1a7d4d'   # withdraw(uint256)
+
+# Fee parameters shared across instances and cached briefly so bursts of
+# swaps don't pay an eth_feeHistory RPC each
+_FEE_STATE = {'ts': 0.0, 'base': 0, 'priority': 10**9}
+
+
+# Statuses worth retrying - rate limiting and transient upstream errors
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Bound concurrent 1inch calls across all BSCSwap instances - a burst of
+# simultaneous users then pipelines onto ~16 warm keep-alive connections
+# instead of opening new ones and tripping the API rate limit
+_API_SEMAPHORE = asyncio.Semaphore(16)
+
+
+async def _get_json(url: str, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    GET a JSON payload with bounded retries on 429/5xx
+
+    Retries three times with exponential backoff so a momentary 1inch rate
+    limit does not fail the user's swap outright.
+    """
+    session = await get_http()
+    for attempt in range(3):
+        try:
+            async with _API_SEMAPHORE, session.get(url, params=params) as response:
+                if response.status in _RETRY_STATUSES:
+                    logger.warning(f"1inch returned {response.status}, retrying...")
+                elif response.status != 200:
+                    logger.error(f"1inch returned {response.status}: {await response.text()}")
+                    return None
+                else:
+                    raw = await response.read()
+                    return orjson.loads(raw) if orjson else json.loads(raw)
+        except aiohttp.ClientError as e:
+            logger.warning(f"1inch request error: {e}, retrying...")
+        await asyncio.sleep(0.3 * (2 ** attempt))
+    logger.error(f"1inch request failed after retries: {url}")
+    return None
+
+
+async def close_http():
+    """Close the shared HTTP session (call on bot shutdown)"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+
 
 class BSCSwap:
     """BSC Swap handler using 1inch aggregator"""
 
-    def __init__(self, private_key: str, rpc_url: str = BSC_RPC_URL):
+    def __init__(self, private_key: str, rpc_url: str = ''):
         """
         Initialize BSC Swap handler
 
         Args:
             private_key: Hex encoded private key (with or without 0x prefix)
-            rpc_url: BSC RPC endpoint
+            rpc_url: BSC RPC endpoint (http(s) or wss); defaults to
+                BSC_WSS_URL when configured, else BSC_RPC_URL
         """
-        self.rpc_url = rpc_url
-        self.session = requests.Session()
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.rpc_url = rpc_url or BSC_WSS_URL or BSC_RPC_URL
+        if self.rpc_url.startswith('ws'):
+            # Persistent socket - no per-request TCP/TLS setup
+            provider = Web3.WebsocketProvider(self.rpc_url)
+        else:
+            provider = FastHTTPProvider(self.rpc_url)
+        self.w3 = Web3(provider)
 
         # Load account from private key
         try:
@@ -70,7 +268,7 @@ class BSCSwap:
             if private_key.startswith('0x'):
                 private_key = private_key[2:]
 
-            self.account = Account.from_key(private_key)
+            self.account = _get_account(private_key)
             self.wallet_address = self.account.address
             logger.info(f"Initialized wallet: {self.wallet_address}")
 
@@ -78,9 +276,25 @@ class BSCSwap:
             if not self.w3.is_connected():
                 raise ConnectionError("Failed to connect to BSC RPC")
 
-            chain_id = self.w3.eth.chain_id
-            if chain_id != 56:
-                logger.warning(f"Warning: Connected to chain ID {chain_id}, expected 56 (BSC Mainnet)")
+            # BSC mainnet - hard-coded rather than fetched, saving an RPC
+            # per instantiation (handlers create an instance per swap)
+            self.chain_id = 56
+            self._nonce = None  # Fetched lazily, then tracked locally
+
+            # Constant transaction fields, merged into every send so only
+            # the per-swap fields get rebuilt
+            self._tx_template = {
+                'from': self.wallet_address,
+                'chainId': self.chain_id,
+                'type': 2
+            }
+            self._contracts = {}  # Contract objects keyed by checksum address
+
+            # Constant request fields shared by every quote/swap call
+            self._base_params = {
+                'from': self.wallet_address,
+                'allowPartialFill': 'false',
+            }
 
         except Exception as e:
             logger.error(f"Failed to load private key: {e}")
@@ -121,31 +335,23 @@ class BSCSwap:
                     'uiAmount': balance
                 }
 
-            # ERC20 ABI for balanceOf and decimals
-            erc20_abi = [
-                {
-                    "constant": True,
-                    "inputs": [{"name": "_owner", "type": "address"}],
-                    "name": "balanceOf",
-                    "outputs": [{"name": "balance", "type": "uint256"}],
-                    "type": "function"
-                },
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "decimals",
-                    "outputs": [{"name": "", "type": "uint8"}],
-                    "type": "function"
-                }
-            ]
-
-            token_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=erc20_abi
-            )
+            # Contract construction parses the ABI and computes function
+            # selectors - cache per token so repeat queries skip that work.
+            # Known tokens are pre-checksummed, skipping the keccak hash.
+            known = TOKEN_BY_ADDR.get(token_address.lower())
+            addr = TOKENS[known] if known else Web3.to_checksum_address(token_address)
+            token_contract = self._contracts.get(addr)
+            if token_contract is None:
+                token_contract = self.w3.eth.contract(address=addr, abi=ERC20_ABI)
+                self._contracts[addr] = token_contract
 
             balance = token_contract.functions.balanceOf(self.wallet_address).call()
-            decimals = token_contract.functions.decimals().call()
+
+            decimals = _DECIMALS_CACHE.get(token_address.lower())
+            if decimals is None:
+                decimals = token_contract.functions.decimals().call()
+                _DECIMALS_CACHE[token_address.lower()] = decimals
+
             ui_amount = balance / (10 ** decimals)
 
             return {
@@ -158,7 +364,7 @@ class BSCSwap:
             logger.error(f"Failed to get token balance: {e}")
             return None
 
-    def get_quote(
+    async def get_quote(
         self,
         from_token: str,
         to_token: str,
@@ -178,31 +384,31 @@ class BSCSwap:
             Quote data or None if failed
         """
         try:
+            # Serve a recent quote for the same pair and size if we have one;
+            # swap transactions are never cached, only display quotes
+            cache_key = (
+                self.wallet_address, from_token, to_token,
+                _bucket_amount(amount), slippage
+            )
+            cached = _QUOTE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
             params = {
+                **self._base_params,
                 'src': from_token,
                 'dst': to_token,
                 'amount': str(amount),
-                'from': self.wallet_address,
                 'slippage': str(slippage),
                 'disableEstimate': 'false',
-                'allowPartialFill': 'false',
             }
 
-            headers = {
-                'Accept': 'application/json',
-            }
-            if ONEINCH_API_KEY:
-                headers['Authorization'] = f'Bearer {ONEINCH_API_KEY}'
-
             logger.info(f"Requesting quote for {amount} wei...")
-            response = self.session.get(
-                f"{ONEINCH_API_BASE}/quote",
-                params=params,
-                headers=headers
-            )
-            response.raise_for_status()
+            quote = await _get_json(_QUOTE_URL, params)
+            if quote is None:
+                return None
 
-            quote = response.json()
+            _QUOTE_CACHE[cache_key] = quote
 
             # Display quote info
             from_amount = int(quote.get('fromTokenAmount', 0))
@@ -216,11 +422,9 @@ class BSCSwap:
 
         except Exception as e:
             logger.error(f"Failed to get quote: {e}")
-            if hasattr(e, 'response') and e.response:
-                logger.error(f"Response: {e.response.text}")
             return None
 
-    def get_swap_transaction(
+    async def get_swap_transaction(
         self,
         from_token: str,
         to_token: str,
@@ -241,30 +445,18 @@ class BSCSwap:
         """
         try:
             params = {
+                **self._base_params,
                 'src': from_token,
                 'dst': to_token,
                 'amount': str(amount),
-                'from': self.wallet_address,
                 'slippage': str(slippage),
                 'disableEstimate': 'true',
-                'allowPartialFill': 'false',
-            }
-
-            headers = {
-                'Accept': 'application/json',
             }
-            if ONEINCH_API_KEY:
-                headers['Authorization'] = f'Bearer {ONEINCH_API_KEY}'
 
             logger.info("Requesting swap transaction...")
-            response = self.session.get(
-                f"{ONEINCH_API_BASE}/swap",
-                params=params,
-                headers=headers
-            )
-            response.raise_for_status()
-
-            result = response.json()
+            result = await _get_json(_SWAP_URL, params)
+            if result is None:
+                return None
 
             if 'tx' not in result:
                 logger.error("No transaction data returned from 1inch")
@@ -275,8 +467,6 @@ class BSCSwap:
 
         except Exception as e:
             logger.error(f"Failed to get swap transaction: {e}")
-            if hasattr(e, 'response') and e.response:
-                logger.error(f"Response: {e.response.text}")
             return None
 
     def send_transaction(self, tx_data: Dict[str, Any]) -> Optional[str]:
@@ -290,17 +480,26 @@ class BSCSwap:
             Transaction hash or None if failed
         """
         try:
-            # Extract transaction parameters
+            # Track the nonce locally after the first fetch - repeat swaps
+            # from the same handler skip the get_transaction_count RPC
+            if self._nonce is None:
+                self._nonce = self.w3.eth.get_transaction_count(self.wallet_address)
+
+            # Build a type-2 transaction priced from fee_history instead of
+            # taking the legacy gasPrice 1inch returns - BSC's base fee is
+            # effectively zero, so this avoids overpaying per swap
+            base_fee, priority_fee = self._get_fee_params()
+
             tx = tx_data['tx']
             transaction = {
-                'from': self.wallet_address,
+                **self._tx_template,
                 'to': Web3.to_checksum_address(tx['to']),
                 'value': int(tx.get('value', 0)),
                 'gas': int(tx['gas']),
-                'gasPrice': int(tx['gasPrice']),
-                'nonce': self.w3.eth.get_transaction_count(self.wallet_address),
-                'data': tx['data'],
-                'chainId': 56
+                'maxFeePerGas': int(base_fee * 2 + priority_fee),
+                'maxPriorityFeePerGas': priority_fee,
+                'nonce': self._nonce,
+                'data': tx['data']
             }
 
             logger.info("Signing transaction...")
@@ -310,14 +509,72 @@ class BSCSwap:
             tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
             tx_hash_hex = tx_hash.hex()
 
+            self._nonce += 1
+
             logger.info(f"Transaction sent: {tx_hash_hex}")
             return tx_hash_hex
 
         except Exception as e:
             logger.error(f"Failed to send transaction: {e}")
+            # Re-sync from the node on the next send - the local counter may
+            # be stale after a rejected or replaced transaction
+            self._nonce = None
             return None
 
-    def get_transaction_status(self, tx_hash: str, max_attempts: int = 30) -> bool:
+    def _get_fee_params(self):
+        """
+        Current EIP-1559 fee parameters, cached for 3 seconds
+
+        Returns:
+            Tuple of (base fee, priority fee) in wei, with a 1 gwei floor
+            on the priority fee
+        """
+        now = time.monotonic()
+        if now - _FEE_STATE['ts'] > 3.0:
+            history = self.w3.eth.fee_history(4, 'latest', [50])
+            rewards = history.get('reward') or []
+            tip = rewards[-1][0] if rewards and rewards[-1] else 0
+            _FEE_STATE['base'] = history['baseFeePerGas'][-1]
+            _FEE_STATE['priority'] = max(tip, 10**9)
+            _FEE_STATE['ts'] = now
+        return _FEE_STATE['base'], _FEE_STATE['priority']
+
+    async def _wrap_or_unwrap(self, from_token: str, amount: int) -> Optional[str]:
+        """
+        Wrap BNB into WBNB (or unwrap) with a direct contract call
+
+        Builds the calldata locally - deposit() when wrapping, or
+        withdraw(amount) when unwrapping - so the route costs zero 1inch
+        round-trips and constant gas.
+
+        Args:
+            from_token: Input token address (BNB placeholder or WBNB)
+            amount: Amount in wei
+
+        Returns:
+            Transaction hash or None if sending failed
+        """
+        wrapping = from_token.lower() == TOKENS['BNB'].lower()
+        if wrapping:
+            data = _WBNB_DEPOSIT_DATA
+            value = amount
+        else:
+            data = _WBNB_WITHDRAW_SELECTOR + f'{amount:064x}'
+            value = 0
+
+        logger.info(f"{'Wrapping' if wrapping else 'Unwrapping'} {amount} wei via WBNB contract")
+        tx_data = {
+            'tx': {
+                'to': TOKENS['WBNB'],
+                'value': value,
+                'gas': 60_000,
+                'data': data,
+            }
+        }
+
+        return await asyncio.to_thread(self.send_transaction, tx_data)
+
+    async def get_transaction_status(self, tx_hash: str, max_attempts: int = 30) -> bool:
         """
         Poll transaction status until confirmed
 
@@ -330,30 +587,84 @@ class BSCSwap:
         """
         logger.info(f"Polling transaction status: {tx_hash}")
 
+        # Start polling fast (BSC blocks every ~3 s, and inclusion is often
+        # next-block), then back off; only re-fetch the receipt when the
+        # chain has actually advanced, since nothing changes between blocks
+        delay = 0.5
+        last_block = -1
+
         for attempt in range(max_attempts):
             try:
-                receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-
-                if receipt:
-                    if receipt['status'] == 1:
-                        logger.info(f"Transaction confirmed! Block: {receipt['blockNumber']}")
-                        return True
-                    else:
-                        logger.error(f"Transaction failed! Status: {receipt['status']}")
-                        return False
+                # Blocking web3 calls run in a worker thread so the event
+                # loop keeps serving other users
+                block = await asyncio.to_thread(getattr, self.w3.eth, 'block_number')
+                if block != last_block:
+                    last_block = block
+                    receipt = await asyncio.to_thread(
+                        self.w3.eth.get_transaction_receipt, tx_hash
+                    )
+
+                    if receipt:
+                        if receipt['status'] == 1:
+                            logger.info(f"Transaction confirmed! Block: {receipt['blockNumber']}")
+                            return True
+                        else:
+                            logger.error(f"Transaction failed! Status: {receipt['status']}")
+                            return False
 
                 logger.info(f"Attempt {attempt + 1}/{max_attempts}: Pending...")
-                time.sleep(3)
 
             except Exception as e:
                 # Receipt not found yet
                 logger.info(f"Attempt {attempt + 1}/{max_attempts}: Not mined yet...")
-                time.sleep(3)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 3.0)
 
         logger.warning("Transaction confirmation timeout")
         return False
 
-    def swap(
+    async def prepare_and_send(
+        self,
+        from_token: str,
+        to_token: str,
+        amount: int,
+        slippage: float = 1.0
+    ) -> Optional[str]:
+        """
+        Build, sign and submit a swap without waiting for confirmation
+
+        Callers that want to show the user a "submitted" state immediately
+        can await this, then run get_transaction_status as a background
+        task instead of blocking on block time.
+
+        Args:
+            from_token: Input token address
+            to_token: Output token address
+            amount: Amount in smallest unit (wei for BNB)
+            slippage: Slippage tolerance in percent
+
+        Returns:
+            Transaction hash or None if building/sending failed
+        """
+        # BNB<->WBNB is a plain wrap-contract call - skip 1inch entirely
+        if {from_token.lower(), to_token.lower()} == _WRAP_PAIR:
+            return await self._wrap_or_unwrap(from_token, amount)
+
+        # The /swap response already carries the quote fields, so the
+        # separate /quote call is pure overhead in the execute path
+        swap_data = await self.get_swap_transaction(from_token, to_token, amount, slippage)
+        if not swap_data:
+            return None
+
+        to_amount = int(swap_data.get('toTokenAmount') or swap_data.get('toAmount') or 0)
+        if to_amount:
+            logger.info(f"Expected output: ~{to_amount / 1e18:.6f} tokens")
+
+        # Send transaction (signing + eth_sendRawTransaction are blocking)
+        return await asyncio.to_thread(self.send_transaction, swap_data)
+
+    async def swap(
         self,
         from_token: str,
         to_token: str,
@@ -374,27 +685,22 @@ class BSCSwap:
         Returns:
             True if successful, False otherwise
         """
-        # Get quote first
-        quote = self.get_quote(from_token, to_token, amount, slippage)
-        if not quote:
-            return False
-
         if simulate:
+            if {from_token.lower(), to_token.lower()} == _WRAP_PAIR:
+                logger.info("Simulation mode - transaction not executed")
+                return True
+            quote = await self.get_quote(from_token, to_token, amount, slippage)
+            if not quote:
+                return False
             logger.info("Simulation mode - transaction not executed")
             return True
 
-        # Get swap transaction
-        swap_data = self.get_swap_transaction(from_token, to_token, amount, slippage)
-        if not swap_data:
-            return False
-
-        # Send transaction
-        tx_hash = self.send_transaction(swap_data)
+        tx_hash = await self.prepare_and_send(from_token, to_token, amount, slippage)
         if not tx_hash:
             return False
 
         # Wait for confirmation
-        confirmed = self.get_transaction_status(tx_hash)
+        confirmed = await self.get_transaction_status(tx_hash)
 
         if confirmed:
             logger.info(f"Swap successful!")
@@ -411,14 +717,16 @@ def bnb_to_wei(bnb_amount: float) -> int:
 
 
 def get_token_address(token_symbol: str) -> Optional[str]:
-    """Get token address by symbol"""
+    """Get token address by symbol (checksummed for known tokens)"""
     token_upper = token_symbol.upper()
     if token_upper in TOKENS:
         return TOKENS[token_upper]
 
-    # If not found, assume it's an address
+    # If not found, assume it's an address; normalize known ones to their
+    # checksummed form
     if len(token_symbol) > 30:
-        return token_symbol
+        known = TOKEN_BY_ADDR.get(token_symbol.lower())
+        return TOKENS[known] if known else token_symbol
 
     return None
 
@@ -498,13 +806,19 @@ def main():
     print("=" * 60)
     print()
 
-    success = swap_handler.swap(
-        from_token=from_token,
-        to_token=to_token,
-        amount=amount,
-        slippage=slippage,
-        simulate=simulate
-    )
+    async def _run():
+        try:
+            return await swap_handler.swap(
+                from_token=from_token,
+                to_token=to_token,
+                amount=amount,
+                slippage=slippage,
+                simulate=simulate
+            )
+        finally:
+            await close_http()
+
+    success = asyncio.run(_run())
 
     if success:
         print("\n" + "=" * 60)
@@ -8,16 +8,24 @@ import sys
 import json
 import time
 import base64
+import socket
+import random
+import asyncio
 import logging
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlparse
 from typing import Optional, Dict, Any
-import requests
-from solders.keypair import Keypair
-from solders.transaction import VersionedTransaction
-from solders.pubkey import Pubkey
-from solders.message import MessageV0
-from solders.hash import Hash
-from solders.instruction import Instruction
+import aiohttp
+from cachetools import TTLCache
+
+# orjson (C implementation) decodes Jupiter's large routePlan payloads
+# several times faster; fall back to stdlib json when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from base58 import b58decode, b58encode
 from dotenv import load_dotenv
 
@@ -31,11 +39,17 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 # Configuration
-JUPITER_API_BASE = "https://api.jup.ag/swap/v1"
+# Point JUPITER_API_BASE at jupiterapi.com or a self-hosted instance for
+# higher rate limits than the public api.jup.ag endpoint
+JUPITER_API_BASE = os.getenv('JUPITER_API_BASE', 'https://api.jup.ag/swap/v1')
 JUPITER_API_KEY = os.getenv('JUPITER_API_KEY', '')  # REQUIRED - Get free key at https://portal.jup.ag/
 HELIUS_RPC_URL = os.getenv('HELIUS_RPC_URL', '')
 SOLANA_RPC = HELIUS_RPC_URL if HELIUS_RPC_URL else os.getenv('SOLANA_RPC', 'https://api.mainnet-beta.solana.com')
 
+# Batch sendTransaction calls arriving within a short window into one
+# JSON-RPC array; set SOLANA_TX_BATCH=0 for providers that mishandle it
+SOLANA_TX_BATCH = os.getenv('SOLANA_TX_BATCH', '1') != '0'
+
 # Minimum balance to keep in wallet for rent exemption and future transactions
 # This should NEVER be spent in swaps
 MIN_SOL_RESERVE = 3_000_000  # 0.003 SOL (covers ATA rent ~2.04M + tx fees ~0.11M + buffer)
@@ -50,8 +64,9 @@ if not JUPITER_API_KEY:
     logger.warning("See API_KEY_SETUP.md for detailed instructions.")
     logger.warning("="*60)
 
-# Common token addresses on Solana
-TOKENS = {
+# Common token addresses on Solana - read-only so lookups are safe to
+# share across all handlers without copies
+TOKENS = MappingProxyType({
     'SOL': 'So11111111111111111111111111111111111111112',  # Wrapped SOL
     'USDC': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
     'USDT': 'Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB',
@@ -59,22 +74,393 @@ TOKENS = {
     'JUP': 'JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN',
     'RAY': '4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R',
     'WIF': 'EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm',
-}
+})
+
+# Decimals for the known tokens - consulted before any network call so a
+# swap doesn't need a getAccountInfo round-trip just to scale the amount
+TOKEN_DECIMALS = MappingProxyType({
+    'SOL': 9,
+    'USDC': 6,
+    'USDT': 6,
+    'BONK': 5,
+    'JUP': 6,
+    'RAY': 6,
+    'WIF': 6,
+})
+
+# Cache freshness windows, split by how fast the data goes stale. The
+# caches are module-level on purpose: every handler instance in the
+# process shares them, which is the single-process equivalent of the
+# shared cache tier a multi-worker deployment would put in Redis
+QUOTE_CACHE_TTL = 2       # market data - barely displayable beyond this
+BALANCE_CACHE_TTL = 5     # menu refreshes
+ACCOUNTS_CACHE_TTL = 10   # whole-wallet token scans
+
+# Short-lived quote cache shared across instances - the UI re-prices the
+# same pair at near-identical sizes moving from preview to confirm
+_QUOTE_CACHE = TTLCache(maxsize=256, ttl=QUOTE_CACHE_TTL)
+
+# Token balances re-read on every menu refresh
+_BALANCE_CACHE = TTLCache(maxsize=1024, ttl=BALANCE_CACHE_TTL)
+
+# Full wallet token set per owner - one getTokenAccountsByOwner call with
+# the token program id returns every account, so balance lookups for N
+# mints cost one RPC instead of N
+_ACCOUNTS_CACHE = TTLCache(maxsize=256, ttl=ACCOUNTS_CACHE_TTL)
+
+_TOKEN_PROGRAM_ID = 'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA'
+
+# Confirmation-poll pacing: start fast to catch quick landings, back off
+# toward the cap, and jitter so concurrent bot processes don't all hit
+# the RPC on the same tick. Tune per RPC provider if needed
+INITIAL_POLL_DELAY = 0.5
+MAX_POLL_DELAY = 4.0
+POLL_JITTER = 0.5
+
+# Statuses worth retrying - rate limiting and transient upstream errors
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _loads(raw) -> Any:
+    """Decode JSON from bytes or str with orjson when available"""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dumps(obj) -> bytes:
+    """Encode JSON to bytes with orjson when available"""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+def _retry_delay(response: 'aiohttp.ClientResponse', attempt: int) -> float:
+    """Honor Retry-After when present, else back off exponentially"""
+    try:
+        return float(response.headers.get('Retry-After', ''))
+    except ValueError:
+        return 0.3 * (2 ** attempt)
+
+
+def _bucket_amount(amount: int) -> int:
+    """Round an amount to 3 significant figures to raise cache hit rates"""
+    return int(float(f"{amount:.3g}")) if amount > 0 else amount
+
+
+# In-flight request registry - when identical quote or wallet-scan calls
+# overlap (two users pricing the same trending pair at once), the later
+# caller awaits the first's future instead of firing a duplicate request
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+
+# Shared aiohttp session - all JupiterSwap instances reuse the same
+# keep-alive connections to Jupiter and the RPC endpoint
+_session: Optional[aiohttp.ClientSession] = None
+
+# Bound concurrent Jupiter/RPC calls across all instances so a burst of
+# simultaneous swaps stays under the API's rate ceiling (~10 rps on the
+# public endpoint; raise JUP_RPS when using a higher-limit base URL)
+_RPC_SEMAPHORE = asyncio.Semaphore(int(os.getenv('JUP_RPS', '10')))
+
+
+async def _prewarm_dns():
+    """
+    Resolve the Jupiter and RPC hosts once up front
+
+    Takes the getaddrinfo latency (and any IPv6 black-hole wait) out of
+    the first user-facing request after startup.
+    """
+    loop = asyncio.get_running_loop()
+    hosts = {urlparse(JUPITER_API_BASE).hostname, urlparse(SOLANA_RPC).hostname}
+    for host in filter(None, hosts):
+        try:
+            await loop.getaddrinfo(host, 443, family=socket.AF_INET, type=socket.SOCK_STREAM)
+        except OSError as e:
+            logger.warning(f"DNS pre-warm failed for {host}: {e}")
+
+
+async def get_http() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session, creating it lazily"""
+    global _session
+    if _session is None or _session.closed:
+        headers = {}
+        if JUPITER_API_KEY:
+            # Set once as a session default instead of per request
+            headers['x-api-key'] = JUPITER_API_KEY
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+                # Pin IPv4 - several cloud hosts try IPv6 first and only
+                # fall back after a timeout
+                family=socket.AF_INET
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers=headers
+        )
+        await _prewarm_dns()
+    return _session
+
+
+async def close_http():
+    """Close the shared HTTP session (call on bot shutdown)"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+
+
+class SignatureStatusPoller:
+    """
+    Coalesces confirmation polling for all in-flight swaps
+
+    Confirmations are detected two ways: a signatureSubscribe push over
+    the RPC websocket (instant, one subscription per signature), with
+    getSignatureStatuses HTTP polling kept as the fallback - one batched
+    request per tick covers every pending signature instead of one
+    request per user, and the RPC answers the array in request order.
+    """
+
+    def __init__(self, rpc_url: str):
+        self.rpc_url = rpc_url
+        self._ws_url = rpc_url.replace('https', 'wss', 1) if rpc_url.startswith('https') else ''
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._ws = None
+        self._ws_task: Optional[asyncio.Task] = None
+        self._sub_ids: Dict[int, str] = {}   # subscription id -> signature
+        self._req_ids: Dict[int, str] = {}   # subscribe request id -> signature
+        self._next_req_id = 1
+
+    def watch(self, signature: str) -> asyncio.Future:
+        """Register a signature and return a future resolving to its status"""
+        fut = self._pending.get(signature)
+        if fut is None or fut.done():
+            fut = asyncio.get_running_loop().create_future()
+            self._pending[signature] = fut
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        if self._ws_url and (self._ws_task is None or self._ws_task.done()):
+            self._ws_task = asyncio.create_task(self._run_ws())
+        elif self._ws is not None:
+            asyncio.create_task(self._subscribe(signature))
+        return fut
+
+    def discard(self, signature: str):
+        """Stop tracking a signature (e.g. after a waiter times out)"""
+        self._pending.pop(signature, None)
+
+    async def _subscribe(self, signature: str):
+        """Ask the websocket to push a notification when the sig confirms"""
+        if self._ws is None or self._ws.closed:
+            return
+        req_id = self._next_req_id
+        self._next_req_id += 1
+        self._req_ids[req_id] = signature
+        try:
+            await self._ws.send_json({
+                'jsonrpc': '2.0',
+                'id': req_id,
+                'method': 'signatureSubscribe',
+                'params': [signature, {'commitment': 'confirmed'}]
+            })
+        except (aiohttp.ClientError, ConnectionError) as e:
+            logger.warning(f"signatureSubscribe failed: {e}")
+
+    def _resolve(self, signature: str, status: Dict[str, Any]):
+        """Hand a terminal status to the waiter for a signature"""
+        fut = self._pending.pop(signature, None)
+        if fut and not fut.done():
+            fut.set_result(status)
+
+    async def _run_ws(self):
+        """Receive signatureNotification pushes and resolve waiters"""
+        session = await get_http()
+        try:
+            async with session.ws_connect(self._ws_url, heartbeat=30) as ws:
+                self._ws = ws
+                for sig in list(self._pending):
+                    await self._subscribe(sig)
+                async for msg in ws:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        break
+                    data = _loads(msg.data)
+                    if 'id' in data and 'result' in data:
+                        # Reply to our subscribe - remember the subscription id
+                        sig = self._req_ids.pop(data['id'], None)
+                        if sig is not None:
+                            self._sub_ids[data['result']] = sig
+                    elif data.get('method') == 'signatureNotification':
+                        params = data.get('params', {})
+                        sig = self._sub_ids.pop(params.get('subscription'), None)
+                        if sig is not None:
+                            value = params.get('result', {}).get('value') or {}
+                            self._resolve(sig, {
+                                'err': value.get('err'),
+                                'confirmationStatus': 'confirmed'
+                            })
+                    if not self._pending:
+                        break
+        except (aiohttp.ClientError, ConnectionError) as e:
+            logger.warning(f"Signature websocket unavailable, falling back to polling: {e}")
+        finally:
+            self._ws = None
+            self._sub_ids.clear()
+            self._req_ids.clear()
+
+    async def _run(self):
+        """Poll all pending signatures in one RPC call per tick"""
+        session = await get_http()
+        attempt = 0
+        watched = set()
+        while self._pending:
+            if not watched >= self._pending.keys():
+                # A new signature arrived - poll fast again
+                attempt = 0
+            watched = set(self._pending)
+
+            if self._ws is not None:
+                # With a live websocket the poll is only a safety net,
+                # so it can tick far less often
+                delay = 10.0
+            else:
+                delay = min(MAX_POLL_DELAY, INITIAL_POLL_DELAY * (1.5 ** attempt))
+                delay += random.uniform(0, POLL_JITTER)
+            attempt += 1
+            await asyncio.sleep(delay)
+            # Drop futures whose waiters gave up
+            for sig in [s for s, f in self._pending.items() if f.done()]:
+                del self._pending[sig]
+            sigs = list(self._pending)
+            if not sigs:
+                break
+
+            payload = {
+                'jsonrpc': '2.0',
+                'id': 1,
+                'method': 'getSignatureStatuses',
+                'params': [sigs]
+            }
+            try:
+                async with _RPC_SEMAPHORE, session.post(self.rpc_url, data=_dumps(payload), headers=_JSON_HEADERS) as response:
+                    if response.status != 200:
+                        logger.warning(f"Status poll returned {response.status}")
+                        continue
+                    result = _loads(await response.read())
+            except aiohttp.ClientError as e:
+                logger.warning(f"Status poll failed: {e}")
+                continue
+
+            # Statuses come back in request order, so match by index
+            values = result.get('result', {}).get('value') or []
+            for sig, status in zip(sigs, values):
+                if status is None:
+                    continue
+                if status.get('err') or status.get('confirmationStatus') in ('confirmed', 'finalized'):
+                    self._resolve(sig, status)
+
+
+# One poller per RPC endpoint, shared by every JupiterSwap instance
+_POLLERS: Dict[str, SignatureStatusPoller] = {}
+
+
+def _get_poller(rpc_url: str) -> SignatureStatusPoller:
+    """Get or create the shared status poller for an RPC endpoint"""
+    poller = _POLLERS.get(rpc_url)
+    if poller is None:
+        poller = _POLLERS[rpc_url] = SignatureStatusPoller(rpc_url)
+    return poller
+
+
+class TxSubmitBatcher:
+    """
+    Coalesces sendTransaction calls landing within a 50 ms window
+
+    Signed transactions from concurrent users are submitted as one
+    JSON-RPC array, amortizing the HTTPS round-trip; results fan back
+    out to per-caller futures matched by request id.
+    """
+
+    WINDOW = 0.05
+
+    def __init__(self, rpc_url: str):
+        self.rpc_url = rpc_url
+        self._queue: list = []  # (params, future) pairs
+        self._task: Optional[asyncio.Task] = None
+
+    def enqueue(self, params: list) -> asyncio.Future:
+        """Queue a sendTransaction and return a future for its response"""
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.append((params, fut))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+        return fut
+
+    async def _flush(self):
+        """Wait out the window, then submit everything queued at once"""
+        await asyncio.sleep(self.WINDOW)
+        # Keep draining: a transaction enqueued while the previous POST
+        # was in flight must not sit stranded until an unrelated send
+        while self._queue:
+            batch, self._queue = self._queue, []
+            results = []
+            try:
+                payload = [
+                    {'jsonrpc': '2.0', 'id': i, 'method': 'sendTransaction', 'params': params}
+                    for i, (params, _) in enumerate(batch)
+                ]
+                if len(payload) == 1:
+                    payload = payload[0]
+
+                session = await get_http()
+                async with _RPC_SEMAPHORE, session.post(self.rpc_url, data=_dumps(payload), headers=_JSON_HEADERS) as response:
+                    if response.status != 200:
+                        logger.error(f"sendTransaction batch returned {response.status}: {await response.text()}")
+                    else:
+                        results = _loads(await response.read())
+            except Exception as e:
+                logger.error(f"sendTransaction batch failed: {e}")
+            finally:
+                # Every caller gets an answer on every exit path - a
+                # stuck future here would hang a user's swap forever
+                if isinstance(results, dict):
+                    results = [results]
+                by_id = {item.get('id'): item for item in results if isinstance(item, dict)}
+                for i, (_, fut) in enumerate(batch):
+                    if not fut.done():
+                        fut.set_result(by_id.get(i))
+
+
+_TX_BATCHERS: Dict[str, TxSubmitBatcher] = {}
+
+
+def _get_tx_batcher(rpc_url: str) -> TxSubmitBatcher:
+    """Get or create the shared transaction submitter for an endpoint"""
+    batcher = _TX_BATCHERS.get(rpc_url)
+    if batcher is None:
+        batcher = _TX_BATCHERS[rpc_url] = TxSubmitBatcher(rpc_url)
+    return batcher
 
 
 class JupiterSwap:
     """Jupiter Swap handler for Solana token swaps"""
 
-    def __init__(self, private_key: str, rpc_url: str = SOLANA_RPC):
+    def __init__(self, private_key: str, rpc_url: str = SOLANA_RPC, api_base: str = JUPITER_API_BASE):
         """
         Initialize Jupiter Swap handler
 
         Args:
             private_key: Base58 or hex encoded private key
             rpc_url: Solana RPC endpoint
+            api_base: Jupiter API base URL
         """
+        # solders is imported on first use - it is a heavyweight native
+        # extension most bot commands never touch
+        from solders.keypair import Keypair
+
         self.rpc_url = rpc_url
-        self.session = requests.Session()
+        self.api_base = api_base
 
         # Load keypair from private key
         # Support both hex (64 or 128 chars) and base58 formats
@@ -127,46 +513,58 @@ class JupiterSwap:
             logger.error(f"Base58 decode failed: {type(e).__name__}: {e}")
             raise ValueError(f"Invalid private key format. Must be hex (64/128 chars) or base58. Error: {e}")
 
-    def get_sol_balance(self) -> Optional[int]:
+    async def _rpc_call(self, method: str, params: list, body: Optional[bytes] = None) -> Optional[Dict[str, Any]]:
         """
-        Get SOL balance for the wallet in lamports
+        POST a JSON-RPC request to the Solana endpoint
+
+        Args:
+            method: RPC method name
+            params: RPC params list
+            body: Pre-encoded request body, skipping JSON encoding
 
         Returns:
-            Balance in lamports or None if error
+            Parsed response dict or None on transport error
         """
-        try:
-            payload = {
+        if body is None:
+            body = _dumps({
                 'jsonrpc': '2.0',
                 'id': 1,
-                'method': 'getBalance',
-                'params': [self.wallet_address]
-            }
-
-            logger.info(f"Fetching SOL balance for {self.wallet_address[:8]}...")
-            response = self.session.post(
-                self.rpc_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
+                'method': method,
+                'params': params
+            })
 
-            result = response.json()
+        try:
+            session = await get_http()
+            async with _RPC_SEMAPHORE, session.post(self.rpc_url, data=body, headers=_JSON_HEADERS) as response:
+                if response.status != 200:
+                    logger.error(f"RPC returned {response.status}: {await response.text()}")
+                    return None
+                return _loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"RPC request failed: {e}")
+            return None
 
-            if 'error' in result:
-                logger.error(f"RPC error: {result['error']}")
-                return None
+    async def get_sol_balance(self) -> Optional[int]:
+        """
+        Get SOL balance for the wallet in lamports
 
-            balance = result.get('result', {}).get('value', 0)
-            logger.info(f"SOL balance: {balance / 1e9:.9f} SOL ({balance} lamports)")
-            return balance
+        Returns:
+            Balance in lamports or None if error
+        """
+        logger.info(f"Fetching SOL balance for {self.wallet_address[:8]}...")
+        result = await self._rpc_call('getBalance', [self.wallet_address])
+        if result is None:
+            return None
 
-        except Exception as e:
-            logger.error(f"Failed to get SOL balance: {e}")
-            if hasattr(e, 'response') and e.response:
-                logger.error(f"Response: {e.response.text}")
+        if 'error' in result:
+            logger.error(f"RPC error: {result['error']}")
             return None
 
-    def get_max_swappable_sol(self) -> Optional[int]:
+        balance = result.get('result', {}).get('value', 0)
+        logger.info(f"SOL balance: {balance / 1e9:.9f} SOL ({balance} lamports)")
+        return balance
+
+    async def get_max_swappable_sol(self) -> Optional[int]:
         """
         Calculate the maximum amount of SOL that can be swapped
         while keeping MIN_SOL_RESERVE for fees and rent
@@ -174,13 +572,91 @@ class JupiterSwap:
         Returns:
             Maximum swappable amount in lamports or 0 if insufficient balance
         """
-        balance = self.get_sol_balance()
+        balance = await self.get_sol_balance()
         if balance is None or balance <= MIN_SOL_RESERVE:
             return 0
 
         return balance - MIN_SOL_RESERVE
 
-    def get_token_balance(self, token_mint: str) -> Optional[Dict[str, Any]]:
+    def _balance_payload(self, mint: str) -> bytes:
+        """
+        Build the getTokenAccountsByOwner body from a pre-encoded template
+
+        The envelope never changes per wallet, so it is JSON-encoded once
+        and the mint spliced in as bytes on each call.
+        """
+        template = getattr(self, '_balance_payload_template', None)
+        if template is None:
+            template = self._balance_payload_template = _dumps({
+                'jsonrpc': '2.0',
+                'id': 1,
+                'method': 'getTokenAccountsByOwner',
+                'params': [
+                    self.wallet_address,
+                    {'mint': '__MINT__'},
+                    {'encoding': 'jsonParsed'}
+                ]
+            })
+        return template.replace(b'__MINT__', mint.encode())
+
+    async def _refresh_all_token_accounts(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Fetch every SPL token account for the wallet in one RPC call
+
+        Returns:
+            Mapping of mint address to balance info, or None on error
+        """
+        key = ('accounts', self.wallet_address)
+        inflight = _INFLIGHT.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        fut = asyncio.get_running_loop().create_future()
+        _INFLIGHT[key] = fut
+        try:
+            by_mint = await self._fetch_all_token_accounts()
+            fut.set_result(by_mint)
+            return by_mint
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved if nobody joined
+            raise
+        finally:
+            _INFLIGHT.pop(key, None)
+
+    async def _fetch_all_token_accounts(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Network path behind _refresh_all_token_accounts"""
+        logger.info(f"Fetching all token accounts for {self.wallet_address[:8]}...")
+        result = await self._rpc_call(
+            'getTokenAccountsByOwner',
+            [
+                self.wallet_address,
+                {'programId': _TOKEN_PROGRAM_ID},
+                {'encoding': 'jsonParsed'}
+            ]
+        )
+        if result is None:
+            return None
+
+        if 'error' in result:
+            logger.error(f"RPC error: {result['error']}")
+            return None
+
+        by_mint: Dict[str, Dict[str, Any]] = {}
+        for account in result.get('result', {}).get('value', []):
+            info = account['account']['data']['parsed']['info']
+            token_amount = info['tokenAmount']
+            by_mint[info['mint']] = {
+                'balance': int(token_amount['amount']),
+                'decimals': token_amount['decimals'],
+                'uiAmount': float(token_amount['uiAmount'] or 0),
+                'tokenAccount': account['pubkey']
+            }
+
+        _ACCOUNTS_CACHE[self.wallet_address] = by_mint
+        return by_mint
+
+    async def get_token_balance(self, token_mint: str) -> Optional[Dict[str, Any]]:
         """
         Get SPL token balance for the wallet
 
@@ -196,69 +672,69 @@ class JupiterSwap:
                 'tokenAccount': str (token account address)
             }
         """
-        try:
-            payload = {
-                'jsonrpc': '2.0',
-                'id': 1,
-                'method': 'getTokenAccountsByOwner',
-                'params': [
-                    self.wallet_address,
-                    {
-                        'mint': token_mint
-                    },
-                    {
-                        'encoding': 'jsonParsed'
-                    }
-                ]
-            }
-
-            logger.info(f"Fetching token balance for {token_mint[:8]}...")
-            response = self.session.post(
-                self.rpc_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
-
-            result = response.json()
-
-            if 'error' in result:
-                logger.error(f"RPC error: {result['error']}")
-                return None
-
-            accounts = result.get('result', {}).get('value', [])
-
-            if not accounts:
+        cache_key = (self.wallet_address, token_mint)
+        cached = _BALANCE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Prefer the whole-wallet account map - one RPC covers every mint
+        by_mint = _ACCOUNTS_CACHE.get(self.wallet_address)
+        if by_mint is None:
+            by_mint = await self._refresh_all_token_accounts()
+        if by_mint is not None:
+            balance_info = by_mint.get(token_mint)
+            if balance_info is None:
                 logger.warning(f"No token account found for {token_mint[:8]}...")
-                return {
+                balance_info = {
                     'balance': 0,
                     'decimals': 6,
                     'uiAmount': 0.0,
                     'tokenAccount': None
                 }
+            _BALANCE_CACHE[cache_key] = balance_info
+            return balance_info
 
-            # Get the first account (should only be one for a given mint)
-            account = accounts[0]
-            token_amount = account['account']['data']['parsed']['info']['tokenAmount']
-            token_account_address = account['pubkey']
+        # Fallback: query the single mint directly
+        logger.info(f"Fetching token balance for {token_mint[:8]}...")
+        result = await self._rpc_call(
+            'getTokenAccountsByOwner', [],
+            body=self._balance_payload(token_mint)
+        )
+        if result is None:
+            return None
 
-            balance_info = {
-                'balance': int(token_amount['amount']),
-                'decimals': token_amount['decimals'],
-                'uiAmount': float(token_amount['uiAmount'] or 0),
-                'tokenAccount': token_account_address
+        if 'error' in result:
+            logger.error(f"RPC error: {result['error']}")
+            return None
+
+        accounts = result.get('result', {}).get('value', [])
+
+        if not accounts:
+            logger.warning(f"No token account found for {token_mint[:8]}...")
+            return {
+                'balance': 0,
+                'decimals': 6,
+                'uiAmount': 0.0,
+                'tokenAccount': None
             }
 
-            logger.info(f"Token balance: {balance_info['uiAmount']:.6f}")
-            return balance_info
+        # Get the first account (should only be one for a given mint)
+        account = accounts[0]
+        token_amount = account['account']['data']['parsed']['info']['tokenAmount']
+        token_account_address = account['pubkey']
 
-        except Exception as e:
-            logger.error(f"Failed to get token balance: {e}")
-            if hasattr(e, 'response') and e.response:
-                logger.error(f"Response: {e.response.text}")
-            return None
+        balance_info = {
+            'balance': int(token_amount['amount']),
+            'decimals': token_amount['decimals'],
+            'uiAmount': float(token_amount['uiAmount'] or 0),
+            'tokenAccount': token_account_address
+        }
+
+        logger.info(f"Token balance: {balance_info['uiAmount']:.6f}")
+        _BALANCE_CACHE[cache_key] = balance_info
+        return balance_info
 
-    def get_quote(
+    async def get_quote(
         self,
         input_mint: str,
         output_mint: str,
@@ -277,54 +753,103 @@ class JupiterSwap:
         Returns:
             Quote data or None if failed
         """
+        cache_key = (input_mint, output_mint, _bucket_amount(amount), slippage_bps)
+        cached = _QUOTE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent identical requests onto one network call
+        inflight = _INFLIGHT.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        fut = asyncio.get_running_loop().create_future()
+        _INFLIGHT[cache_key] = fut
+        try:
+            quote = await self._fetch_quote(input_mint, output_mint, amount, slippage_bps)
+            if quote is not None:
+                _QUOTE_CACHE[cache_key] = quote
+            fut.set_result(quote)
+            return quote
+        except Exception as e:
+            # Fail the joiners too - an unresolved future would park
+            # them forever
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved if nobody joined
+            raise
+        finally:
+            _INFLIGHT.pop(cache_key, None)
+
+    async def _fetch_quote(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: int
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a quote from Jupiter (uncached network path)"""
         try:
             params = {
                 'inputMint': input_mint,
                 'outputMint': output_mint,
-                'amount': amount,
-                'slippageBps': slippage_bps,
+                'amount': str(amount),
+                'slippageBps': str(slippage_bps),
                 'onlyDirectRoutes': 'false',
                 'asLegacyTransaction': 'false'
             }
 
-            # Prepare headers with optional API key
-            headers = {}
-            if JUPITER_API_KEY:
-                headers['x-api-key'] = JUPITER_API_KEY
-
             logger.info(f"Requesting quote for {amount} lamports...")
-            response = self.session.get(f"{JUPITER_API_BASE}/quote", params=params, headers=headers)
-            response.raise_for_status()
+            session = await get_http()
+            for attempt in range(3):
+                async with _RPC_SEMAPHORE, session.get(f"{self.api_base}/quote", params=params) as response:
+                    if response.status in _RETRY_STATUSES:
+                        delay = _retry_delay(response, attempt)
+                        logger.warning(f"Jupiter returned {response.status}, retrying in {delay:.1f}s...")
+                    elif response.status == 401:
+                        logger.error(f"Response: {await response.text()}")
+                        logger.error("="*60)
+                        logger.error("API KEY REQUIRED!")
+                        logger.error("Get a FREE API key at: https://portal.jup.ag/")
+                        logger.error("Add to .env: JUPITER_API_KEY=your_key_here")
+                        logger.error("See API_KEY_SETUP.md for instructions.")
+                        logger.error("="*60)
+                        return None
+                    elif response.status != 200:
+                        logger.error(f"Failed to get quote: {response.status}: {await response.text()}")
+                        return None
+                    else:
+                        quote = _loads(await response.read())
+                        break
+                await asyncio.sleep(delay)
+            else:
+                logger.error("Quote request failed after retries")
+                return None
 
-            quote = response.json()
+            # A quote with no route can't execute - bail before the
+            # caller burns a doomed /swap round-trip on it
+            route_plan = quote.get('routePlan')
+            if not route_plan:
+                logger.warning("No route for this pair")
+                return None
 
-            # Display quote info
-            in_amount = int(quote['inAmount'])
-            out_amount = int(quote['outAmount'])
-            price_impact = float(quote.get('priceImpactPct', 0))
+            # Display quote info (skip the parsing when INFO is off)
+            if logger.isEnabledFor(logging.INFO):
+                in_amount = int(quote['inAmount'])
+                out_amount = int(quote['outAmount'])
+                price_impact = float(quote.get('priceImpactPct', 0))
 
-            logger.info(f"Quote received:")
-            logger.info(f"  Input: {in_amount / 1e9:.9f} SOL")
-            logger.info(f"  Output: {out_amount / 1e6:.6f} tokens")
-            logger.info(f"  Price Impact: {price_impact:.4f}%")
-            logger.info(f"  Routes: {len(quote.get('routePlan', []))}")
+                logger.info(f"Quote received:")
+                logger.info(f"  Input: {in_amount / 1e9:.9f} SOL")
+                logger.info(f"  Output: {out_amount / 1e6:.6f} tokens")
+                logger.info(f"  Price Impact: {price_impact:.4f}%")
+                logger.info(f"  Routes: {len(route_plan)}")
 
             return quote
         except Exception as e:
             logger.error(f"Failed to get quote: {e}")
-            if hasattr(e, 'response') and e.response:
-                logger.error(f"Response: {e.response.text}")
-                # Check for 401 Unauthorized
-                if e.response.status_code == 401:
-                    logger.error("="*60)
-                    logger.error("API KEY REQUIRED!")
-                    logger.error("Get a FREE API key at: https://portal.jup.ag/")
-                    logger.error("Add to .env: JUPITER_API_KEY=your_key_here")
-                    logger.error("See API_KEY_SETUP.md for instructions.")
-                    logger.error("="*60)
             return None
 
-    def get_swap_transaction(
+    async def get_swap_transaction(
         self,
         quote: Dict[str, Any],
         user_public_key: str,
@@ -352,20 +877,24 @@ class JupiterSwap:
                 'prioritizationFeeLamports': priority_fee or 'auto'
             }
 
-            # Prepare headers with optional API key
-            headers = {'Content-Type': 'application/json'}
-            if JUPITER_API_KEY:
-                headers['x-api-key'] = JUPITER_API_KEY
-
             logger.info("Requesting swap transaction...")
-            response = self.session.post(
-                f"{JUPITER_API_BASE}/swap",
-                json=payload,
-                headers=headers
-            )
-            response.raise_for_status()
+            session = await get_http()
+            for attempt in range(3):
+                async with _RPC_SEMAPHORE, session.post(f"{self.api_base}/swap", data=_dumps(payload), headers=_JSON_HEADERS) as response:
+                    if response.status in _RETRY_STATUSES:
+                        delay = _retry_delay(response, attempt)
+                        logger.warning(f"Jupiter returned {response.status}, retrying in {delay:.1f}s...")
+                    elif response.status != 200:
+                        logger.error(f"Failed to get swap transaction: {response.status}: {await response.text()}")
+                        return None
+                    else:
+                        result = _loads(await response.read())
+                        break
+                await asyncio.sleep(delay)
+            else:
+                logger.error("Swap transaction request failed after retries")
+                return None
 
-            result = response.json()
             swap_transaction = result.get('swapTransaction')
 
             if not swap_transaction:
@@ -376,11 +905,9 @@ class JupiterSwap:
             return swap_transaction
         except Exception as e:
             logger.error(f"Failed to get swap transaction: {e}")
-            if hasattr(e, 'response') and e.response:
-                logger.error(f"Response: {e.response.text}")
             return None
 
-    def send_transaction(self, signed_tx: str) -> Optional[str]:
+    async def send_transaction(self, signed_tx: str) -> Optional[str]:
         """
         Send signed transaction to Solana network
 
@@ -390,44 +917,32 @@ class JupiterSwap:
         Returns:
             Transaction signature or None if failed
         """
-        try:
-            payload = {
-                'jsonrpc': '2.0',
-                'id': 1,
-                'method': 'sendTransaction',
-                'params': [
-                    signed_tx,
-                    {
-                        'encoding': 'base64',
-                        'skipPreflight': False,
-                        'preflightCommitment': 'confirmed',
-                        'maxRetries': 3
-                    }
-                ]
+        logger.info("Sending transaction to network...")
+        params = [
+            signed_tx,
+            {
+                'encoding': 'base64',
+                'skipPreflight': False,
+                'preflightCommitment': 'confirmed',
+                'maxRetries': 3
             }
+        ]
+        if SOLANA_TX_BATCH:
+            result = await _get_tx_batcher(self.rpc_url).enqueue(params)
+        else:
+            result = await self._rpc_call('sendTransaction', params)
+        if result is None:
+            return None
 
-            logger.info("Sending transaction to network...")
-            response = self.session.post(
-                self.rpc_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
-
-            result = response.json()
-
-            if 'error' in result:
-                logger.error(f"Transaction error: {result['error']}")
-                return None
-
-            signature = result.get('result')
-            logger.info(f"Transaction sent: {signature}")
-            return signature
-        except Exception as e:
-            logger.error(f"Failed to send transaction: {e}")
+        if 'error' in result:
+            logger.error(f"Transaction error: {result['error']}")
             return None
 
-    def get_transaction_status(self, signature: str, max_attempts: int = 30) -> bool:
+        signature = result.get('result')
+        logger.info(f"Transaction sent: {signature}")
+        return signature
+
+    async def get_transaction_status(self, signature: str, max_attempts: int = 30) -> bool:
         """
         Poll transaction status until confirmed
 
@@ -440,47 +955,22 @@ class JupiterSwap:
         """
         logger.info(f"Polling transaction status: {signature}")
 
-        for attempt in range(max_attempts):
-            try:
-                payload = {
-                    'jsonrpc': '2.0',
-                    'id': 1,
-                    'method': 'getSignatureStatuses',
-                    'params': [[signature]]
-                }
-
-                response = self.session.post(
-                    self.rpc_url,
-                    json=payload,
-                    headers={'Content-Type': 'application/json'}
-                )
-                response.raise_for_status()
-
-                result = response.json()
-
-                if 'result' in result and result['result']['value']:
-                    status = result['result']['value'][0]
-
-                    if status is None:
-                        logger.info(f"Attempt {attempt + 1}/{max_attempts}: Not found yet...")
-                    elif status.get('err'):
-                        logger.error(f"Transaction failed: {status['err']}")
-                        return False
-                    elif status.get('confirmationStatus') in ['confirmed', 'finalized']:
-                        logger.info(f"Transaction confirmed! Status: {status['confirmationStatus']}")
-                        return True
-                    else:
-                        logger.info(f"Attempt {attempt + 1}/{max_attempts}: {status.get('confirmationStatus', 'processing')}")
+        poller = _get_poller(self.rpc_url)
+        try:
+            status = await asyncio.wait_for(poller.watch(signature), timeout=max_attempts * 2)
+        except asyncio.TimeoutError:
+            poller.discard(signature)
+            logger.warning("Transaction confirmation timeout")
+            return False
 
-                time.sleep(2)
-            except Exception as e:
-                logger.error(f"Error checking status: {e}")
-                time.sleep(2)
+        if status.get('err'):
+            logger.error(f"Transaction failed: {status['err']}")
+            return False
 
-        logger.warning("Transaction confirmation timeout")
-        return False
+        logger.info(f"Transaction confirmed! Status: {status['confirmationStatus']}")
+        return True
 
-    def swap(
+    async def swap(
         self,
         input_mint: str,
         output_mint: str,
@@ -507,43 +997,46 @@ class JupiterSwap:
             Always keep MIN_SOL_RESERVE (0.003 SOL) in wallet.
             Use get_max_swappable_sol() to calculate safe amount.
         """
-        # Get quote
-        quote = self.get_quote(input_mint, output_mint, amount, slippage_bps)
-        if not quote:
-            return False
+        from solders.transaction import VersionedTransaction
 
         if simulate:
+            quote = await self.get_quote(input_mint, output_mint, amount, slippage_bps)
+            if not quote:
+                return False
             logger.info("Simulation mode - transaction not executed")
             return True
 
+        # Execution prices the exact amount - the bucketed display cache
+        # may hold a near-miss quote for a different caller's size, and a
+        # real trade must never execute someone else's inAmount
+        quote = await self._fetch_quote(input_mint, output_mint, amount, slippage_bps)
+        if not quote:
+            return False
+
         # Get swap transaction
-        swap_tx = self.get_swap_transaction(quote, self.wallet_address)
+        swap_tx = await self.get_swap_transaction(quote, self.wallet_address)
         if not swap_tx:
             return False
 
         # Deserialize and sign transaction
         try:
             logger.info("Signing transaction...")
-            tx_bytes = base64.b64decode(swap_tx)
-            transaction = VersionedTransaction.from_bytes(tx_bytes)
-
-            # Get the message from the unsigned transaction
-            message = transaction.message
-
-            # Create a new signed transaction with the message and keypair
-            # In solders, signing happens in the constructor
-            signed_transaction = VersionedTransaction(message, [self.keypair])
-
-            # Serialize signed transaction
-            signed_tx = base64.b64encode(bytes(signed_transaction)).decode('utf-8')
+            # Carry bytes end-to-end: decode once, re-sign (in solders,
+            # signing happens in the constructor), serialize once - no
+            # intermediate copies held
+            raw = base64.b64decode(swap_tx)
+            signed = bytes(VersionedTransaction(
+                VersionedTransaction.from_bytes(raw).message,
+                [self.keypair]
+            ))
 
             # Send transaction
-            signature = self.send_transaction(signed_tx)
+            signature = await self.send_transaction(base64.b64encode(signed).decode())
             if not signature:
                 return False
 
             # Wait for confirmation
-            confirmed = self.get_transaction_status(signature)
+            confirmed = await self.get_transaction_status(signature)
 
             if confirmed:
                 logger.info(f"Swap successful!")
@@ -569,11 +1062,14 @@ def get_token_address(token_symbol: str) -> Optional[str]:
     if token_upper in TOKENS:
         return TOKENS[token_upper]
 
-    # If not found, assume it's an address
-    if len(token_symbol) > 30:
+    # If not a known symbol, accept it only if it parses as a real
+    # pubkey - rejecting garbage here saves a doomed Jupiter round-trip
+    try:
+        from solders.pubkey import Pubkey
+        Pubkey.from_string(token_symbol)
         return token_symbol
-
-    return None
+    except Exception:
+        return None
 
 
 def main():
@@ -625,12 +1121,10 @@ def main():
         amount_str = input(f"Amount in {input_token}: ").strip()
         amount_float = float(amount_str)
 
-        # Convert to lamports if input is SOL
-        if input_token.upper() == 'SOL':
-            amount = sol_to_lamports(amount_float)
-        else:
-            # For other tokens, assume 6 decimals (most SPL tokens)
-            amount = int(amount_float * 1e6)
+        # Scale by the token's real decimals (6 only as a last resort
+        # for unknown mints - BONK is 5, SOL is 9)
+        decimals = TOKEN_DECIMALS.get(input_token.upper(), 6)
+        amount = int(amount_float * 10 ** decimals)
     except ValueError:
         logger.error("Invalid amount")
         return
@@ -654,13 +1148,19 @@ def main():
     print("=" * 60)
     print()
 
-    success = swap_handler.swap(
-        input_mint=input_mint,
-        output_mint=output_mint,
-        amount=amount,
-        slippage_bps=slippage_bps,
-        simulate=simulate
-    )
+    async def _run():
+        try:
+            return await swap_handler.swap(
+                input_mint=input_mint,
+                output_mint=output_mint,
+                amount=amount,
+                slippage_bps=slippage_bps,
+                simulate=simulate
+            )
+        finally:
+            await close_http()
+
+    success = asyncio.run(_run())
 
     if success:
         print("\n" + "=" * 60)
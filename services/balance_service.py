@@ -3,33 +3,15 @@ Balance Service
 Handles balance checking and price fetching for all supported networks
 """
 
+import asyncio
 import logging
-import requests
 from typing import Dict, Any
+from cachetools import TTLCache
 from web3 import Web3
-from requests.adapters import HTTPAdapter
-from urllib3.util.ssl_ import create_urllib3_context
 
 logger = logging.getLogger(__name__)
 
 
-class SSLAdapter(HTTPAdapter):
-    """Custom HTTPAdapter with modern TLS configuration"""
-    def init_poolmanager(self, *args, **kwargs):
-        context = create_urllib3_context()
-        context.load_default_certs()
-        context.set_ciphers('DEFAULT@SECLEVEL=1')
-        kwargs['ssl_context'] = context
-        return super().init_poolmanager(*args, **kwargs)
-
-
-def create_secure_session():
-    """Create a requests session with proper SSL/TLS configuration"""
-    session = requests.Session()
-    session.mount('https://', SSLAdapter())
-    return session
-
-
 class BalanceService:
     """Handles balance queries and price fetching"""
 
@@ -43,6 +25,52 @@ class BalanceService:
         self.config = config
         self.networks = self._build_network_config()
 
+        # Per-address balance cache with a short TTL - back-and-forth menu
+        # navigation re-reads the same (network, address) pairs constantly,
+        # and an 8 s old balance is fine for display purposes
+        self._balance_cache = TTLCache(maxsize=8192, ttl=8)
+
+        self._session = None  # Shared aiohttp session, created on first use
+
+        # One Web3 instance per EVM network - its HTTPProvider keeps a
+        # requests session alive, so repeat balance calls reuse the
+        # connection instead of paying a TLS handshake each
+        self._web3: Dict[str, Web3] = {}
+
+    async def _get_session(self):
+        """
+        Get the shared aiohttp session, creating it lazily
+
+        Price and RPC endpoints are hit on every menu render; a single
+        keep-alive session skips the TCP+TLS handshake each call would
+        otherwise pay.
+        """
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=50,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session (call on bot shutdown)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def _get_web3(self, network: str) -> Web3:
+        """Get the cached Web3 instance for an EVM network"""
+        w3 = self._web3.get(network)
+        if w3 is None:
+            w3 = self._web3[network] = Web3(Web3.HTTPProvider(self.networks[network]['rpc']))
+        return w3
+
     def _build_network_config(self) -> Dict[str, Any]:
         """Build network configuration from config"""
         networks = {}
@@ -78,9 +106,9 @@ class BalanceService:
             ids = ','.join(coingecko_ids)
             url = f'https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies=usd'
 
-            session = create_secure_session()
-            response = session.get(url, timeout=10)
-            data = response.json()
+            session = await self._get_session()
+            async with session.get(url) as response:
+                data = await response.json()
 
             # Map back to network keys
             prices = {}
@@ -109,24 +137,38 @@ class BalanceService:
             Dictionary with 'balance' (float) and 'formatted' (str)
         """
         try:
+            key = (network, address)
+            cached = self._balance_cache.get(key)
+            if cached is not None:
+                return cached
+
             logger.info(f"Fetching balance for {network} address: {address}")
 
             if network == 'SOL':
-                return await self.get_solana_balance(address)
+                result = await self.get_solana_balance(address)
             elif network == 'ETH':
-                return await self.get_ethereum_balance(address)
+                result = await self.get_ethereum_balance(address)
             elif network == 'BSC':
-                return await self.get_bsc_balance(address)
+                result = await self.get_bsc_balance(address)
             elif network == 'STACKS':
-                return await self.get_stacks_balance(address)
+                result = await self.get_stacks_balance(address)
             else:
                 logger.error(f"Unsupported network: {network}")
                 return {'balance': 0, 'formatted': 'Unsupported network'}
 
+            # Don't cache failed lookups - the next render should retry
+            if result.get('formatted') != 'Error':
+                self._balance_cache[key] = result
+            return result
+
         except Exception as e:
             logger.error(f"Error getting balance for {network}: {e}", exc_info=True)
             return {'balance': 0, 'formatted': 'Error'}
 
+    def invalidate_balance(self, network: str, address: str):
+        """Drop a cached balance after a transfer touches the address"""
+        self._balance_cache.pop((network, address), None)
+
     async def get_solana_balance(self, address: str) -> Dict[str, Any]:
         """
         Get Solana balance
@@ -146,9 +188,9 @@ class BalanceService:
                 "params": [address]
             }
 
-            session = create_secure_session()
-            response = session.post(rpc_url, json=payload, timeout=10)
-            data = response.json()
+            session = await self._get_session()
+            async with session.post(rpc_url, json=payload) as response:
+                data = await response.json()
 
             if 'result' in data and 'value' in data['result']:
                 balance_lamports = data['result']['value']
@@ -175,9 +217,9 @@ class BalanceService:
             Balance information
         """
         try:
-            rpc_url = self.networks['ETH']['rpc']
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
-            balance_wei = w3.eth.get_balance(address)
+            w3 = self._get_web3('ETH')
+            # web3's HTTP provider blocks, so keep it off the event loop
+            balance_wei = await asyncio.to_thread(w3.eth.get_balance, address)
             balance_eth = w3.from_wei(balance_wei, 'ether')
 
             return {
@@ -200,9 +242,8 @@ class BalanceService:
             Balance information
         """
         try:
-            rpc_url = self.networks['BSC']['rpc']
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
-            balance_wei = w3.eth.get_balance(address)
+            w3 = self._get_web3('BSC')
+            balance_wei = await asyncio.to_thread(w3.eth.get_balance, address)
             balance_bnb = w3.from_wei(balance_wei, 'ether')
 
             return {
@@ -234,14 +275,12 @@ class BalanceService:
             url = f"{rpc_url}/v2/accounts/{address}"
             logger.info(f"Fetching Stacks balance from: {url}")
 
-            session = create_secure_session()
-            response = session.get(url, timeout=10)
-
-            if response.status_code != 200:
-                logger.error(f"Stacks API error: {response.status_code}")
-                return {'balance': 0, 'formatted': '0 STX'}
-
-            data = response.json()
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status != 200:
+                    logger.error(f"Stacks API error: {response.status}")
+                    return {'balance': 0, 'formatted': '0 STX'}
+                data = await response.json()
 
             # Stacks API returns balance in microSTX
             if 'balance' in data:
@@ -275,26 +314,26 @@ class BalanceService:
             if not slot_data or 'chains' not in slot_data:
                 return 0.0
 
-            # Get current prices
-            prices = await self.get_token_prices()
-            total_usd = 0.0
-
-            # Sum up balances from all chains
-            for network, wallet in slot_data['chains'].items():
-                if network not in self.networks:
-                    continue
+            # Fetch prices and every chain's balance concurrently - the
+            # wall time becomes the slowest network instead of the sum
+            targets = [
+                (network, wallet['address'])
+                for network, wallet in slot_data['chains'].items()
+                if network in self.networks and wallet.get('address')
+            ]
+            results = await asyncio.gather(
+                self.get_token_prices(),
+                *(self.get_balance(network, address) for network, address in targets),
+                return_exceptions=True
+            )
 
-                address = wallet.get('address')
-                if not address:
+            prices = results[0] if not isinstance(results[0], Exception) else {}
+            total_usd = 0.0
+            for (network, _), balance_info in zip(targets, results[1:]):
+                if isinstance(balance_info, Exception):
+                    logger.error(f"Balance fetch failed for {network}: {balance_info}")
                     continue
-
-                # Get balance
-                balance_info = await self.get_balance(network, address)
-                balance = balance_info.get('balance', 0)
-
-                # Convert to USD
-                price = prices.get(network, 0)
-                total_usd += balance * price
+                total_usd += balance_info.get('balance', 0) * prices.get(network, 0)
 
             return total_usd
 
@@ -9,6 +9,13 @@ import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# orjson (C implementation) is several times faster at encoding the nested
+# wallet_slots structure; fall back to stdlib json when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +35,11 @@ class DataManager:
         self.user_wallets_file = wallets_dir / 'user_wallets.json'
         self.user_wallets = self.load_user_wallets()
 
+        # Users already confirmed to be on the multi-wallet format - lets
+        # get_user_data skip the migration check after the first read, since
+        # handlers fetch the same user's data several times per update
+        self._migration_checked = set()
+
         # Ensure wallets directory exists
         self.wallets_dir.mkdir(parents=True, exist_ok=True)
 
@@ -35,8 +47,9 @@ class DataManager:
         """Load user wallet assignments from file"""
         if self.user_wallets_file.exists():
             try:
-                with open(self.user_wallets_file, 'r') as f:
-                    return json.load(f)
+                with open(self.user_wallets_file, 'rb') as f:
+                    raw = f.read()
+                return orjson.loads(raw) if orjson else json.loads(raw)
             except Exception as e:
                 logger.error(f"Error loading user wallets: {e}")
                 return {}
@@ -45,8 +58,12 @@ class DataManager:
     def save_user_wallets(self) -> bool:
         """Save user wallet assignments to file"""
         try:
-            with open(self.user_wallets_file, 'w') as f:
-                json.dump(self.user_wallets, f, indent=2)
+            if orjson:
+                encoded = orjson.dumps(self.user_wallets, option=orjson.OPT_INDENT_2)
+            else:
+                encoded = json.dumps(self.user_wallets, indent=2).encode()
+            with open(self.user_wallets_file, 'wb') as f:
+                f.write(encoded)
             return True
         except Exception as e:
             logger.error(f"Error saving user wallets: {e}")
@@ -64,9 +81,12 @@ class DataManager:
         """
         user_id_str = str(user_id)
 
-        # Auto-migrate old format if needed
-        if self.needs_migration(user_id_str):
-            self.migrate_user_data(user_id_str)
+        # Auto-migrate old format if needed (checked once per user - data
+        # can never regress to the old format after migration)
+        if user_id_str not in self._migration_checked:
+            if self.needs_migration(user_id_str):
+                self.migrate_user_data(user_id_str)
+            self._migration_checked.add(user_id_str)
 
         return self.user_wallets.get(user_id_str, {})
 
@@ -82,6 +102,10 @@ class DataManager:
             Success status
         """
         user_id_str = str(user_id)
+        # Keep the persisted slot order current so renders can iterate it
+        # without re-sorting on every view
+        if 'wallet_slots' in data:
+            data['slot_order'] = sorted(data['wallet_slots'])
         self.user_wallets[user_id_str] = data
         return self.save_user_wallets()
 
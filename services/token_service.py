@@ -10,6 +10,11 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# Precompiled address patterns - is_contract_address runs on every
+# non-command message, so avoid per-call regex work
+_EVM_ADDRESS_RE = re.compile(r'0x[a-fA-F0-9]{40}')
+_BASE58_ADDRESS_RE = re.compile(r'[1-9A-HJ-NP-Za-km-z]{32,44}')
+
 
 class TokenService:
     """Handles token detection and data fetching"""
@@ -24,6 +29,33 @@ class TokenService:
         self.config = config
         self.dexscreener_base_url = "https://api.dexscreener.com/latest/dex/tokens"
         self.supported_chains = self._get_supported_chains()
+        self._session = None  # Shared aiohttp session, created on first use
+
+    async def _get_session(self):
+        """
+        Get the shared aiohttp session, creating it lazily
+
+        A single keep-alive session avoids a fresh TCP+TLS handshake on
+        every DexScreener call.
+        """
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=256,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session (call on bot shutdown)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
     def _get_supported_chains(self) -> List[str]:
         """Get list of supported DexScreener chains from config"""
@@ -46,24 +78,12 @@ class TokenService:
         # Remove whitespace
         text = text.strip()
 
-        # Most blockchain addresses are 32-44 characters alphanumeric
-        # Solana: 32-44 base58
-        # Ethereum: 42 characters starting with 0x
-        if len(text) < 26 or len(text) > 66:
-            return False
-
-        # Check if it's mostly alphanumeric (allowing 0x prefix)
-        clean_text = text.replace('0x', '').replace('0X', '')
-
-        # Must be mostly alphanumeric
-        if not re.match(r'^[a-zA-Z0-9]+$', clean_text):
-            return False
-
-        # Should have a mix of letters and numbers (not just numbers)
-        has_letter = bool(re.search(r'[a-zA-Z]', clean_text))
-        has_number = bool(re.search(r'[0-9]', clean_text))
-
-        return has_letter and has_number
+        # EVM: 0x + 40 hex chars; Solana: 32-44 base58 chars.
+        # Check the EVM shape first - it is the cheaper, more specific match.
+        return bool(
+            _EVM_ADDRESS_RE.fullmatch(text)
+            or _BASE58_ADDRESS_RE.fullmatch(text)
+        )
 
     async def detect_and_fetch_token(self, token_address: str) -> Optional[Dict[str, Any]]:
         """
@@ -82,15 +102,14 @@ class TokenService:
 
             # Try async aiohttp first, fallback to requests
             try:
-                import aiohttp
+                session = await self._get_session()
 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                        if response.status != 200:
-                            logger.error(f"DexScreener API returned status {response.status}")
-                            return None
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        logger.error(f"DexScreener API returned status {response.status}")
+                        return None
 
-                        data = await response.json()
+                    data = await response.json()
 
             except ImportError:
                 # Fallback to requests
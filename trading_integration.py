@@ -11,18 +11,40 @@ from bsc_swap import BSCSwap, TOKENS as BSC_TOKENS, bnb_to_wei
 
 logger = logging.getLogger(__name__)
 
+# Shared single-button "back" keyboards - immutable, so build them once at
+# import instead of allocating a fresh markup in every error branch
+BACK_TO_MENU_KB = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]
+)
+BACK_TO_MANAGE_KB = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("⬅️ Back", callback_data='manage_wallets')]]
+)
+BACK_TO_BAGS_KB = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("⬅️ Back", callback_data='view_bags')]]
+)
+
 
 class TradingMixin:
     """Mixin class to add trading functionality to TradingBot"""
 
     async def execute_buy(self, query, user_id: int, sol_amount: float, token_address: str):
-        """Execute a token buy using chain-specific swap"""
+        """Execute a token buy from a callback query"""
+        await self._execute_buy_core(query.message, user_id, sol_amount, token_address)
+
+    async def _execute_buy_core(self, message, user_id: int, sol_amount: float, token_address: str):
+        """
+        Execute a token buy using chain-specific swap
+
+        Progress is reported by editing `message`, so both the button path
+        and the typed-amount path can share this without synthesizing a
+        CallbackQuery.
+        """
         try:
             logger.info(f"execute_buy called: user_id={user_id}, sol_amount={sol_amount}, token_address={token_address}")
 
             if user_id not in self.trading_context:
-                await query.edit_message_text("❌ Trading session expired. Please scan the token again.",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                await message.edit_text("❌ Trading session expired. Please scan the token again.",
+                    reply_markup=BACK_TO_MENU_KB)
                 return
 
             context = self.trading_context[user_id]
@@ -32,8 +54,8 @@ class TradingMixin:
 
             user_data = self.get_user_wallet_data(user_id)
             if not user_data:
-                await query.edit_message_text("❌ No wallet found! Please create one first.",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                await message.edit_text("❌ No wallet found! Please create one first.",
+                    reply_markup=BACK_TO_MENU_KB)
                 return
 
             primary_wallet = user_data.get('primary_wallet', 'wallet1')
@@ -44,23 +66,23 @@ class TradingMixin:
 
             # Route to appropriate chain handler
             if chain == 'solana':
-                await self._execute_buy_solana(query, user_id, sol_amount, token_address, token_symbol, slippage_bps, chains)
+                await self._execute_buy_solana(message, user_id, sol_amount, token_address, token_symbol, slippage_bps, chains)
             elif chain == 'bsc':
-                await self._execute_buy_bsc(query, user_id, sol_amount, token_address, token_symbol, slippage_bps, chains)
+                await self._execute_buy_bsc(message, user_id, sol_amount, token_address, token_symbol, slippage_bps, chains)
             else:
-                await query.edit_message_text(f"❌ Trading not yet supported on {chain.upper()}",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                await message.edit_text(f"❌ Trading not yet supported on {chain.upper()}",
+                    reply_markup=BACK_TO_MENU_KB)
 
         except Exception as e:
             logger.error(f"Error in execute_buy: {e}", exc_info=True)
-            await query.edit_message_text(f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+            await message.edit_text(f"❌ Error: {str(e)}",
+                reply_markup=BACK_TO_MENU_KB)
 
-    async def _execute_buy_solana(self, query, user_id: int, sol_amount: float, token_address: str, token_symbol: str, slippage_bps: int, chains: dict):
+    async def _execute_buy_solana(self, message, user_id: int, sol_amount: float, token_address: str, token_symbol: str, slippage_bps: int, chains: dict):
         """Execute Solana token buy using Jupiter"""
         if 'SOL' not in chains:
-            await query.edit_message_text("❌ No Solana wallet found! Please create one first.",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+            await message.edit_text("❌ No Solana wallet found! Please create one first.",
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         sol_wallet = chains['SOL']
@@ -69,35 +91,33 @@ class TradingMixin:
         # Validate private key before using it
         if not private_key or not isinstance(private_key, str):
             logger.error(f"Invalid private key retrieved: type={type(private_key)}, value={private_key}")
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Wallet Error</b>\n\n"
                 f"Failed to retrieve valid private key from wallet.\n"
                 f"Please contact support or try recreating your wallet.",
-                parse_mode='HTML',
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         if len(private_key) < 32:
             logger.error(f"Private key too short: length={len(private_key)}, preview={private_key[:10]}...")
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Wallet Error</b>\n\n"
                 f"Private key format is invalid.\n"
                 f"Please contact support or try recreating your wallet.",
-                parse_mode='HTML',
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         logger.info(f"Retrieved private key: length={len(private_key)}, starts_with={private_key[:8]}...")
 
-        await query.edit_message_text(f"🔄 Processing buy order...\n\n💰 Amount: {sol_amount} SOL\n🪙 Token: {token_symbol}\n⚙️ Slippage: {slippage_bps/100}%\n\n⏳ Checking balance...")
+        await message.edit_text(f"🔄 Processing buy order...\n\n💰 Amount: {sol_amount} SOL\n🪙 Token: {token_symbol}\n⚙️ Slippage: {slippage_bps/100}%\n\n⏳ Checking balance...")
 
         # Initialize swap handler and check balance
         swap_handler = JupiterSwap(private_key)
-        sol_balance = swap_handler.get_sol_balance()
+        sol_balance = await swap_handler.get_sol_balance()
 
         if sol_balance is None:
-            await query.edit_message_text("❌ Failed to fetch wallet balance. Please try again.",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+            await message.edit_text("❌ Failed to fetch wallet balance. Please try again.",
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         balance_sol = sol_balance / 1e9
@@ -108,25 +128,23 @@ class TradingMixin:
 
         # Check if user has enough balance
         if sol_balance < user_requested_lamports:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Insufficient Balance</b>\n\n"
                 f"💰 Your balance: <b>{balance_sol:.9f} SOL</b>\n"
                 f"💸 You requested: <b>{sol_amount} SOL</b>\n\n"
                 f"Please add more SOL to your wallet.",
-                parse_mode='HTML',
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         # Ensure we have enough to do any swap at all
         if absolute_max_swappable <= 1_000_000:  # Less than 0.001 SOL
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Balance Too Low</b>\n\n"
                 f"💰 Your balance: <b>{balance_sol:.9f} SOL</b>\n\n"
                 f"After reserving {MIN_SOL_RESERVE/1e9:.3f} SOL for fees and rent, "
                 f"there's not enough left to swap.\n\n"
                 f"Minimum balance needed: <b>0.004 SOL</b>",
-                parse_mode='HTML',
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         # Calculate how much we'll actually swap
@@ -134,19 +152,18 @@ class TradingMixin:
 
         # Final safety check
         if actual_swap_amount <= 0:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Amount Too Small</b>\n\n"
                 f"After reserving {MIN_SOL_RESERVE/1e9:.3f} SOL for fees and rent, "
                 f"there's nothing left to swap from {sol_amount} SOL.\n\n"
                 f"Please try a larger amount (min 0.004 SOL).",
-                parse_mode='HTML',
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         actual_swap_sol = actual_swap_amount / 1e9
         reserve_sol = MIN_SOL_RESERVE / 1e9
 
-        await query.edit_message_text(
+        await message.edit_text(
             f"🔄 Processing buy order...\n\n"
             f"💰 Input: {sol_amount} SOL\n"
             f"📊 Swapping: ~{actual_swap_sol:.6f} SOL\n"
@@ -155,11 +172,11 @@ class TradingMixin:
             f"⚙️ Slippage: {slippage_bps/100}%\n\n"
             f"⏳ Getting quote...")
 
-        quote = swap_handler.get_quote(JUPITER_TOKENS['SOL'], token_address, actual_swap_amount, slippage_bps)
+        quote = await swap_handler.get_quote(JUPITER_TOKENS['SOL'], token_address, actual_swap_amount, slippage_bps)
 
         if not quote:
-            await query.edit_message_text("❌ Failed to get quote from Jupiter. Token may have low liquidity.",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+            await message.edit_text("❌ Failed to get quote from Jupiter. Token may have low liquidity.",
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         in_amount = int(quote['inAmount']) / 1e9
@@ -169,7 +186,7 @@ class TradingMixin:
         keyboard = [[InlineKeyboardButton("✅ Confirm Buy", callback_data=f'confirm_buy_{sol_amount}_{token_address}')],
                     [InlineKeyboardButton("❌ Cancel", callback_data=f'refresh_{token_address}')]]
 
-        await query.edit_message_text(
+        await message.edit_text(
             f"📊 <b>Buy Order Quote</b>\n━━━━━━━━━━━━━━━━━━━━\n\n"
             f"💰 <b>Using: {sol_amount} SOL</b>\n"
             f"   ├─ Swap: {in_amount:.6f} SOL\n"
@@ -179,17 +196,17 @@ class TradingMixin:
             f"⚙️ Slippage: <b>{slippage_bps/100}%</b>\n\n"
             f"ℹ️ Reserved amount covers transaction fees and rent.\n\n"
             f"⚠️ <b>Confirm this transaction?</b>",
-            parse_mode='HTML', reply_markup=InlineKeyboardMarkup(keyboard))
+            reply_markup=InlineKeyboardMarkup(keyboard))
 
         self.trading_context[user_id]['pending_quote'] = quote
         self.trading_context[user_id]['pending_amount'] = sol_amount
         self.trading_context[user_id]['actual_swap_amount'] = actual_swap_amount
 
-    async def _execute_buy_bsc(self, query, user_id: int, bnb_amount: float, token_address: str, token_symbol: str, slippage_bps: int, chains: dict):
+    async def _execute_buy_bsc(self, message, user_id: int, bnb_amount: float, token_address: str, token_symbol: str, slippage_bps: int, chains: dict):
         """Execute BSC token buy using 1inch"""
         if 'BSC' not in chains:
-            await query.edit_message_text("❌ No BSC wallet found! Please create one first.",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+            await message.edit_text("❌ No BSC wallet found! Please create one first.",
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         bsc_wallet = chains['BSC']
@@ -198,14 +215,14 @@ class TradingMixin:
         # Convert slippage from basis points to percentage
         slippage_pct = slippage_bps / 100
 
-        await query.edit_message_text(f"🔄 Processing buy order...\n\n💰 Amount: {bnb_amount} BNB\n🪙 Token: {token_symbol}\n⚙️ Slippage: {slippage_pct}%\n\n⏳ Getting quote...")
+        await message.edit_text(f"🔄 Processing buy order...\n\n💰 Amount: {bnb_amount} BNB\n🪙 Token: {token_symbol}\n⚙️ Slippage: {slippage_pct}%\n\n⏳ Getting quote...")
 
         swap_handler = BSCSwap(private_key)
-        quote = swap_handler.get_quote(BSC_TOKENS['BNB'], token_address, bnb_to_wei(bnb_amount), slippage_pct)
+        quote = await swap_handler.get_quote(BSC_TOKENS['BNB'], token_address, bnb_to_wei(bnb_amount), slippage_pct)
 
         if not quote:
-            await query.edit_message_text("❌ Failed to get quote from 1inch. Token may have low liquidity.",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+            await message.edit_text("❌ Failed to get quote from 1inch. Token may have low liquidity.",
+                reply_markup=BACK_TO_MENU_KB)
             return
 
         from_amount = int(quote.get('fromTokenAmount', 0)) / 1e18
@@ -214,12 +231,12 @@ class TradingMixin:
         keyboard = [[InlineKeyboardButton("✅ Confirm Buy", callback_data=f'confirm_buy_{bnb_amount}_{token_address}')],
                     [InlineKeyboardButton("❌ Cancel", callback_data=f'refresh_{token_address}')]]
 
-        await query.edit_message_text(
+        await message.edit_text(
             f"📊 <b>Buy Order Quote</b>\n━━━━━━━━━━━━━━━━━━━━\n\n"
             f"💰 You Pay: <b>{from_amount:.6f} BNB</b>\n"
             f"🪙 You Receive: <b>~{to_amount:,.2f} {token_symbol}</b>\n"
             f"⚙️ Slippage: <b>{slippage_pct}%</b>\n\n⚠️ <b>Confirm this transaction?</b>",
-            parse_mode='HTML', reply_markup=InlineKeyboardMarkup(keyboard))
+            reply_markup=InlineKeyboardMarkup(keyboard))
 
         self.trading_context[user_id]['pending_quote'] = quote
         self.trading_context[user_id]['pending_amount'] = bnb_amount
@@ -242,12 +259,12 @@ class TradingMixin:
                 await self._confirm_buy_bsc(query, user_id, sol_amount, token_address, token_symbol, context)
             else:
                 await query.edit_message_text(f"❌ Trading not yet supported on {chain.upper()}",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                    reply_markup=BACK_TO_MENU_KB)
 
         except Exception as e:
             logger.error(f"Error in confirm_buy: {e}", exc_info=True)
             await query.edit_message_text(f"❌ Error executing buy: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+                reply_markup=BACK_TO_MENU_KB)
 
     async def _confirm_buy_solana(self, query, user_id: int, sol_amount: float, token_address: str, token_symbol: str, context: dict):
         """Confirm and execute Solana buy"""
@@ -267,13 +284,12 @@ class TradingMixin:
             f"💰 Using: {sol_amount} SOL\n"
             f"📊 Swapping: {swap_sol:.6f} SOL\n"
             f"🪙 Token: {token_symbol}\n\n"
-            f"⏳ Please wait...",
-            parse_mode='HTML')
+            f"⏳ Please wait...")
 
         swap_handler = JupiterSwap(private_key)
         slippage_bps = int(context.get('slippage_pct', 10) * 100)
 
-        success = swap_handler.swap(JUPITER_TOKENS['SOL'], token_address, actual_swap_amount, slippage_bps, simulate=False)
+        success = await swap_handler.swap(JUPITER_TOKENS['SOL'], token_address, actual_swap_amount, slippage_bps, simulate=False)
 
         if success:
             order = {'order_id': f"order_{user_id}_{int(datetime.datetime.now().timestamp())}", 'token_address': token_address,
@@ -286,13 +302,13 @@ class TradingMixin:
 
             await query.edit_message_text(
                 f"✅ <b>Buy Order Completed!</b>\n━━━━━━━━━━━━━━━━━━━━\n\n💰 Spent: <b>{sol_amount} SOL</b>\n🪙 Token: <b>{token_symbol}</b>\n📋 Status: <b>Success</b>\n\n🔍 Check your transaction on Solscan",
-                parse_mode='HTML', reply_markup=InlineKeyboardMarkup([
+                reply_markup=InlineKeyboardMarkup([
                     [InlineKeyboardButton("🔄 Refresh Token", callback_data=f'refresh_{token_address}')],
                     [InlineKeyboardButton("📋 View Orders", callback_data=f'orders_{token_address}')],
                     [InlineKeyboardButton("⬅️ Back to Menu", callback_data='back_to_menu')]]))
         else:
             await query.edit_message_text("❌ <b>Buy Order Failed</b>\n\nThe swap transaction failed. Please try again.",
-                parse_mode='HTML', reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data=f'refresh_{token_address}')]]))
+                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data=f'refresh_{token_address}')]]))
 
     async def _confirm_buy_bsc(self, query, user_id: int, bnb_amount: float, token_address: str, token_symbol: str, context: dict):
         """Confirm and execute BSC buy"""
@@ -300,14 +316,30 @@ class TradingMixin:
         primary_wallet = user_data.get('primary_wallet', 'wallet1')
         private_key = user_data['wallet_slots'][primary_wallet]['chains']['BSC']['private_key']
 
-        await query.edit_message_text(f"⏳ <b>Executing Swap...</b>\n\n💰 Amount: {bnb_amount} BNB\n🪙 Token: {token_symbol}\n\n⏳ Please wait...", parse_mode='HTML')
+        await query.edit_message_text(f"⏳ <b>Executing Swap...</b>\n\n💰 Amount: {bnb_amount} BNB\n🪙 Token: {token_symbol}\n\n⏳ Please wait...")
 
         swap_handler = BSCSwap(private_key)
         slippage_pct = context.get('slippage_pct', 10)
 
-        success = swap_handler.swap(BSC_TOKENS['BNB'], token_address, bnb_to_wei(bnb_amount), slippage_pct, simulate=False)
+        tx_hash = await swap_handler.prepare_and_send(BSC_TOKENS['BNB'], token_address, bnb_to_wei(bnb_amount), slippage_pct)
 
-        if success:
+        if not tx_hash:
+            await query.edit_message_text("❌ <b>Buy Order Failed</b>\n\nThe swap transaction failed. Please try again.",
+                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data=f'refresh_{token_address}')]]))
+            return
+
+        # Hand control back to the user immediately; confirmation takes
+        # several block times and runs in the background
+        await query.edit_message_text(
+            f"🚀 <b>Swap Submitted</b>\n━━━━━━━━━━━━━━━━━━━━\n\n💰 Amount: <b>{bnb_amount} BNB</b>\n🪙 Token: <b>{token_symbol}</b>\n\n🔍 <a href=\"https://bscscan.com/tx/{tx_hash}\">View on BscScan</a>\n\n⏳ Waiting for confirmation...")
+
+        self._spawn(self._finish_bsc_buy(query.message, user_id, bnb_amount, token_address, token_symbol, swap_handler, tx_hash))
+
+    async def _finish_bsc_buy(self, message, user_id: int, bnb_amount: float, token_address: str, token_symbol: str, swap_handler, tx_hash: str):
+        """Background task: wait for buy confirmation and update the message"""
+        confirmed = await swap_handler.get_transaction_status(tx_hash)
+
+        if confirmed:
             order = {'order_id': f"order_{user_id}_{int(datetime.datetime.now().timestamp())}", 'token_address': token_address,
                      'token_symbol': token_symbol, 'amount_sol': bnb_amount, 'status': 'completed',
                      'timestamp': datetime.datetime.now().isoformat()}
@@ -316,15 +348,15 @@ class TradingMixin:
                 self.user_orders[user_id] = []
             self.user_orders[user_id].append(order)
 
-            await query.edit_message_text(
+            await message.edit_text(
                 f"✅ <b>Buy Order Completed!</b>\n━━━━━━━━━━━━━━━━━━━━\n\n💰 Spent: <b>{bnb_amount} BNB</b>\n🪙 Token: <b>{token_symbol}</b>\n📋 Status: <b>Success</b>\n\n🔍 Check your transaction on BscScan",
-                parse_mode='HTML', reply_markup=InlineKeyboardMarkup([
+                reply_markup=InlineKeyboardMarkup([
                     [InlineKeyboardButton("🔄 Refresh Token", callback_data=f'refresh_{token_address}')],
                     [InlineKeyboardButton("📋 View Orders", callback_data=f'orders_{token_address}')],
                     [InlineKeyboardButton("⬅️ Back to Menu", callback_data='back_to_menu')]]))
         else:
-            await query.edit_message_text("❌ <b>Buy Order Failed</b>\n\nThe swap transaction failed. Please try again.",
-                parse_mode='HTML', reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data=f'refresh_{token_address}')]]))
+            await message.edit_text("❌ <b>Buy Order Failed</b>\n\nThe swap transaction failed. Please try again.",
+                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data=f'refresh_{token_address}')]]))
 
     async def show_slippage_menu(self, query, user_id: int, token_address: str):
         """Show slippage configuration menu"""
@@ -342,7 +374,7 @@ class TradingMixin:
                 [InlineKeyboardButton("⬅️ Back", callback_data=f'refresh_{token_address}')]]
 
             await query.edit_message_text(f"⚙️ <b>Slippage Settings</b>\n━━━━━━━━━━━━━━━━━━━━\n\n🪙 Token: <b>{token_symbol}</b>\n📊 Current: <b>{current_slippage}%</b>\n\nSelect slippage tolerance:",
-                parse_mode='HTML', reply_markup=InlineKeyboardMarkup(keyboard))
+                reply_markup=InlineKeyboardMarkup(keyboard))
         except Exception as e:
             logger.error(f"Error in show_slippage_menu: {e}")
             await query.edit_message_text(f"❌ Error: {str(e)}")
@@ -381,7 +413,7 @@ class TradingMixin:
             keyboard = [[InlineKeyboardButton("🔄 Refresh Orders", callback_data=f'orders_{token_address}')],
                         [InlineKeyboardButton("⬅️ Back", callback_data=f'refresh_{token_address}')]]
 
-            await query.edit_message_text(message, parse_mode='HTML', reply_markup=InlineKeyboardMarkup(keyboard))
+            await query.edit_message_text(message, reply_markup=InlineKeyboardMarkup(keyboard))
         except Exception as e:
             logger.error(f"Error in show_orders: {e}")
             await query.edit_message_text(f"❌ Error: {str(e)}")
@@ -395,23 +427,23 @@ class TradingMixin:
             self.waiting_for_input[user_id] = {'type': 'buy_custom_amount', 'token_address': token_address, 'message_id': query.message.message_id}
 
             await query.edit_message_text(f"💵 <b>Custom Buy Amount</b>\n━━━━━━━━━━━━━━━━━━━━\n\n🪙 Token: <b>{token_symbol}</b>\n\nEnter the amount of SOL you want to spend:\n(e.g., 0.1, 0.5, 2)",
-                parse_mode='HTML', reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Cancel", callback_data=f'refresh_{token_address}')]]))
+                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Cancel", callback_data=f'refresh_{token_address}')]]))
         except Exception as e:
             logger.error(f"Error in ask_custom_amount: {e}")
             await query.edit_message_text(f"❌ Error: {str(e)}")
 
-    async def show_bags(self, query, user_id: int):
+    async def show_bags(self, message, user_id: int):
         """Show all tokens bought by the user (their bags)"""
         try:
             orders = self.user_orders.get(user_id, [])
 
             if not orders:
-                message = "🎒 <b>Your Bags</b>\n━━━━━━━━━━━━━━━━━━━━\n\n"
-                message += "You haven't bought any tokens yet!\n\n"
-                message += "Send a token contract address to start trading."
+                text = "🎒 <b>Your Bags</b>\n━━━━━━━━━━━━━━━━━━━━\n\n"
+                text += "You haven't bought any tokens yet!\n\n"
+                text += "Send a token contract address to start trading."
 
                 keyboard = [[InlineKeyboardButton("⬅️ Back to Menu", callback_data='back_to_menu')]]
-                await query.edit_message_text(message, parse_mode='HTML', reply_markup=InlineKeyboardMarkup(keyboard))
+                await message.edit_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
                 return
 
             # Group orders by token
@@ -429,8 +461,8 @@ class TradingMixin:
                     tokens[token_addr]['total_sol_spent'] += order['amount_sol']
                     tokens[token_addr]['buy_count'] += 1
 
-            message = "🎒 <b>Your Bags</b>\n━━━━━━━━━━━━━━━━━━━━\n\n"
-            message += f"<b>Total Tokens:</b> {len(tokens)}\n\n"
+            text = "🎒 <b>Your Bags</b>\n━━━━━━━━━━━━━━━━━━━━\n\n"
+            text += f"<b>Total Tokens:</b> {len(tokens)}\n\n"
 
             keyboard = []
             for idx, (token_addr, data) in enumerate(tokens.items(), 1):
@@ -438,10 +470,10 @@ class TradingMixin:
                 total_spent = data['total_sol_spent']
                 count = data['buy_count']
 
-                message += f"<b>{idx}. {symbol}</b>\n"
-                message += f"   💰 Spent: {total_spent:.4f} SOL\n"
-                message += f"   📊 Buys: {count}\n"
-                message += f"   📅 First: {data['first_buy'][:10]}\n\n"
+                text += f"<b>{idx}. {symbol}</b>\n"
+                text += f"   💰 Spent: {total_spent:.4f} SOL\n"
+                text += f"   📊 Buys: {count}\n"
+                text += f"   📅 First: {data['first_buy'][:10]}\n\n"
 
                 # Add buttons for this token: View, Buy More, Sell
                 keyboard.append([
@@ -455,12 +487,12 @@ class TradingMixin:
                 InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')
             ])
 
-            await query.edit_message_text(message, parse_mode='HTML', reply_markup=InlineKeyboardMarkup(keyboard))
+            await message.edit_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
 
         except Exception as e:
             logger.error(f"Error in show_bags: {e}")
-            await query.edit_message_text(f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='back_to_menu')]]))
+            await message.edit_text(f"❌ Error: {str(e)}",
+                reply_markup=BACK_TO_MENU_KB)
 
     async def show_bag_buy_options(self, query, user_id: int, token_address: str):
         """Show buy options for a token from bags"""
@@ -484,7 +516,7 @@ class TradingMixin:
 
             message = f"💰 <b>Buy More {token_symbol}</b>\n━━━━━━━━━━━━━━━━━━━━\n\nSelect amount to buy:"
 
-            await query.edit_message_text(message, parse_mode='HTML', reply_markup=InlineKeyboardMarkup(keyboard))
+            await query.edit_message_text(message, reply_markup=InlineKeyboardMarkup(keyboard))
 
         except Exception as e:
             logger.error(f"Error in show_bag_buy_options: {e}")
@@ -532,7 +564,7 @@ class TradingMixin:
                 f"(This will swap your tokens back to SOL)"
             )
 
-            await query.edit_message_text(message, parse_mode='HTML', reply_markup=InlineKeyboardMarkup(keyboard))
+            await query.edit_message_text(message, reply_markup=InlineKeyboardMarkup(keyboard))
 
         except Exception as e:
             logger.error(f"Error in show_bag_sell_options: {e}")
@@ -556,7 +588,6 @@ class TradingMixin:
                 f"🪙 Token: <b>{token_symbol}</b>\n\n"
                 f"Enter percentage to sell (1-100):\n"
                 f"(e.g., 10, 25, 33, 80)",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Cancel", callback_data='view_bags')]])
             )
         except Exception as e:
@@ -564,7 +595,16 @@ class TradingMixin:
             await query.edit_message_text(f"❌ Error: {str(e)}")
 
     async def execute_sell(self, query, user_id: int, percentage: float, token_address: str):
-        """Execute a token sell (reverse swap to native token)"""
+        """Execute a token sell from a callback query"""
+        await self._execute_sell_core(query.message, user_id, percentage, token_address)
+
+    async def _execute_sell_core(self, message, user_id: int, percentage: float, token_address: str):
+        """
+        Execute a token sell (reverse swap to native token)
+
+        Shared by the callback path and the typed-percentage path; progress
+        is reported by editing `message`.
+        """
         try:
             context = self.trading_context.get(user_id, {})
             token_symbol = context.get('token_symbol', 'TOKEN')
@@ -574,8 +614,8 @@ class TradingMixin:
             # Get wallet
             user_data = self.get_user_wallet_data(user_id)
             if not user_data:
-                await query.edit_message_text("❌ No wallet found!",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='view_bags')]]))
+                await message.edit_text("❌ No wallet found!",
+                    reply_markup=BACK_TO_BAGS_KB)
                 return
 
             primary_wallet = user_data.get('primary_wallet', 'wallet1')
@@ -584,45 +624,43 @@ class TradingMixin:
 
             # Route to appropriate chain handler
             if chain == 'solana':
-                await self._execute_sell_solana(query, user_id, percentage, token_address, token_symbol, slippage_bps, chains, context)
+                await self._execute_sell_solana(message, user_id, percentage, token_address, token_symbol, slippage_bps, chains, context)
             elif chain == 'bsc':
-                await self._execute_sell_bsc(query, user_id, percentage, token_address, token_symbol, slippage_bps, chains, context)
+                await self._execute_sell_bsc(message, user_id, percentage, token_address, token_symbol, slippage_bps, chains, context)
             else:
-                await query.edit_message_text(f"❌ Selling not yet supported on {chain.upper()}",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='view_bags')]]))
+                await message.edit_text(f"❌ Selling not yet supported on {chain.upper()}",
+                    reply_markup=BACK_TO_BAGS_KB)
 
         except Exception as e:
             logger.error(f"Error in execute_sell: {e}", exc_info=True)
-            await query.edit_message_text(f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='view_bags')]]))
+            await message.edit_text(f"❌ Error: {str(e)}",
+                reply_markup=BACK_TO_BAGS_KB)
 
-    async def _execute_sell_solana(self, query, user_id: int, percentage: float, token_address: str, token_symbol: str, slippage_bps: int, chains: dict, context: dict):
+    async def _execute_sell_solana(self, message, user_id: int, percentage: float, token_address: str, token_symbol: str, slippage_bps: int, chains: dict, context: dict):
         """Execute Solana token sell"""
         if 'SOL' not in chains:
-            await query.edit_message_text("❌ No Solana wallet found!",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='view_bags')]]))
+            await message.edit_text("❌ No Solana wallet found!",
+                reply_markup=BACK_TO_BAGS_KB)
             return
 
         sol_wallet = chains['SOL']
         private_key = sol_wallet.get('private_key')
 
-        await query.edit_message_text(
+        await message.edit_text(
             f"⏳ <b>Preparing Sell Order...</b>\n\n"
             f"💸 Selling {percentage}% of {token_symbol}\n"
             f"⚙️ Slippage: {slippage_bps/100}%\n\n"
-            f"⏳ Checking balance...",
-            parse_mode='HTML')
+            f"⏳ Checking balance...")
 
         # Get token balance from on-chain
         swap_handler = JupiterSwap(private_key)
-        balance_info = swap_handler.get_token_balance(token_address)
+        balance_info = await swap_handler.get_token_balance(token_address)
 
         if not balance_info:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Failed to Fetch Balance</b>\n\n"
                 f"Could not retrieve your {token_symbol} balance.\n"
                 f"Please check your RPC connection.",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
             return
@@ -632,10 +670,9 @@ class TradingMixin:
         ui_balance = balance_info['uiAmount']
 
         if token_balance == 0:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>No {token_symbol} Balance</b>\n\n"
                 f"You don't have any {token_symbol} tokens to sell.",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
             return
@@ -644,31 +681,28 @@ class TradingMixin:
         amount_to_sell = int(token_balance * (percentage / 100))
 
         if amount_to_sell == 0:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Amount Too Small</b>\n\n"
                 f"The calculated amount to sell is too small.\n"
                 f"Your balance: {ui_balance:.6f} {token_symbol}",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
             return
 
         # Get quote for selling (token → SOL)
-        await query.edit_message_text(
+        await message.edit_text(
             f"⏳ <b>Getting Quote...</b>\n\n"
             f"💰 Your Balance: {ui_balance:.6f} {token_symbol}\n"
             f"💸 Selling {percentage}%: {amount_to_sell / (10 ** token_decimals):.6f} {token_symbol}\n\n"
-            f"⏳ Getting best price from Jupiter...",
-            parse_mode='HTML')
+            f"⏳ Getting best price from Jupiter...")
 
-        quote = swap_handler.get_quote(token_address, JUPITER_TOKENS['SOL'], amount_to_sell, slippage_bps)
+        quote = await swap_handler.get_quote(token_address, JUPITER_TOKENS['SOL'], amount_to_sell, slippage_bps)
 
         if not quote:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Failed to Get Quote</b>\n\n"
                 f"Could not get a quote from Jupiter.\n"
                 f"Token may have low liquidity.",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
             return
@@ -683,7 +717,7 @@ class TradingMixin:
             [InlineKeyboardButton("❌ Cancel", callback_data='view_bags')]
         ]
 
-        await query.edit_message_text(
+        await message.edit_text(
             f"📊 <b>Sell Order Quote</b>\n"
             f"━━━━━━━━━━━━━━━━━━━━\n\n"
             f"💰 Your Balance: <b>{ui_balance:.6f} {token_symbol}</b>\n"
@@ -692,7 +726,6 @@ class TradingMixin:
             f"📊 Price Impact: <b>{price_impact:.4f}%</b>\n"
             f"⚙️ Slippage: <b>{slippage_bps/100}%</b>\n\n"
             f"⚠️ <b>Confirm this transaction?</b>",
-            parse_mode='HTML',
             reply_markup=InlineKeyboardMarkup(keyboard)
         )
 
@@ -701,34 +734,33 @@ class TradingMixin:
         self.trading_context[user_id]['pending_sell_amount'] = amount_to_sell
         self.trading_context[user_id]['pending_sell_percentage'] = percentage
 
-    async def _execute_sell_bsc(self, query, user_id: int, percentage: float, token_address: str, token_symbol: str, slippage_bps: int, chains: dict, context: dict):
+    async def _execute_sell_bsc(self, message, user_id: int, percentage: float, token_address: str, token_symbol: str, slippage_bps: int, chains: dict, context: dict):
         """Execute BSC token sell"""
         if 'BSC' not in chains:
-            await query.edit_message_text("❌ No BSC wallet found!",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back", callback_data='view_bags')]]))
+            await message.edit_text("❌ No BSC wallet found!",
+                reply_markup=BACK_TO_BAGS_KB)
             return
 
         bsc_wallet = chains['BSC']
         private_key = bsc_wallet.get('private_key')
         slippage_pct = slippage_bps / 100
 
-        await query.edit_message_text(
+        await message.edit_text(
             f"⏳ <b>Preparing Sell Order...</b>\n\n"
             f"💸 Selling {percentage}% of {token_symbol}\n"
             f"⚙️ Slippage: {slippage_pct}%\n\n"
             f"⏳ Checking balance..."
-        , parse_mode='HTML')
+        )
 
         # Get token balance from on-chain
         swap_handler = BSCSwap(private_key)
         balance_info = swap_handler.get_token_balance(token_address)
 
         if not balance_info:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Failed to Fetch Balance</b>\n\n"
                 f"Could not retrieve your {token_symbol} balance.\n"
                 f"Please check your RPC connection.",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
             return
@@ -738,10 +770,9 @@ class TradingMixin:
         ui_balance = balance_info['uiAmount']
 
         if token_balance == 0:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>No {token_symbol} Balance</b>\n\n"
                 f"You don't have any {token_symbol} tokens to sell.",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
             return
@@ -750,31 +781,29 @@ class TradingMixin:
         amount_to_sell = int(token_balance * (percentage / 100))
 
         if amount_to_sell == 0:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Amount Too Small</b>\n\n"
                 f"The calculated amount to sell is too small.\n"
                 f"Your balance: {ui_balance:.6f} {token_symbol}",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
             return
 
         # Get quote for selling (token → BNB)
-        await query.edit_message_text(
+        await message.edit_text(
             f"⏳ <b>Getting Quote...</b>\n\n"
             f"💰 Your Balance: {ui_balance:.6f} {token_symbol}\n"
             f"💸 Selling {percentage}%: {amount_to_sell / (10 ** token_decimals):.6f} {token_symbol}\n\n"
             f"⏳ Getting best price from 1inch..."
-        , parse_mode='HTML')
+        )
 
-        quote = swap_handler.get_quote(token_address, BSC_TOKENS['BNB'], amount_to_sell, slippage_pct)
+        quote = await swap_handler.get_quote(token_address, BSC_TOKENS['BNB'], amount_to_sell, slippage_pct)
 
         if not quote:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Failed to Get Quote</b>\n\n"
                 f"Could not get a quote from 1inch.\n"
                 f"Token may have low liquidity.",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
             return
@@ -788,7 +817,7 @@ class TradingMixin:
             [InlineKeyboardButton("❌ Cancel", callback_data='view_bags')]
         ]
 
-        await query.edit_message_text(
+        await message.edit_text(
             f"📊 <b>Sell Order Quote</b>\n"
             f"━━━━━━━━━━━━━━━━━━━━\n\n"
             f"💰 Your Balance: <b>{ui_balance:.6f} {token_symbol}</b>\n"
@@ -796,7 +825,6 @@ class TradingMixin:
             f"🪙 You Receive: <b>~{to_amount:.6f} BNB</b>\n"
             f"⚙️ Slippage: <b>{slippage_pct}%</b>\n\n"
             f"⚠️ <b>Confirm this transaction?</b>",
-            parse_mode='HTML',
             reply_markup=InlineKeyboardMarkup(keyboard)
         )
 
@@ -845,14 +873,13 @@ class TradingMixin:
             f"⏳ <b>Executing Sell...</b>\n\n"
             f"💸 Selling {percentage}% of {token_symbol}\n\n"
             f"⏳ Please wait...",
-            parse_mode='HTML'
         )
 
         swap_handler = JupiterSwap(private_key)
         slippage_bps = int(context.get('slippage_pct', 10) * 100)
 
         # Execute reverse swap (token → SOL)
-        success = swap_handler.swap(token_address, JUPITER_TOKENS['SOL'], amount_to_sell, slippage_bps, simulate=False)
+        success = await swap_handler.swap(token_address, JUPITER_TOKENS['SOL'], amount_to_sell, slippage_bps, simulate=False)
 
         if success:
             await query.edit_message_text(
@@ -862,7 +889,6 @@ class TradingMixin:
                 f"🪙 Received: <b>SOL</b>\n"
                 f"📋 Status: <b>Success</b>\n\n"
                 f"🔍 Check your transaction on Solscan",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([
                     [InlineKeyboardButton("🎒 View Bags", callback_data='view_bags')],
                     [InlineKeyboardButton("⬅️ Back to Menu", callback_data='back_to_menu')]
@@ -872,7 +898,6 @@ class TradingMixin:
             await query.edit_message_text(
                 f"❌ <b>Sell Order Failed</b>\n\n"
                 f"The swap transaction failed. Please try again.",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
 
@@ -888,34 +913,52 @@ class TradingMixin:
             f"⏳ <b>Executing Sell...</b>\n\n"
             f"💸 Selling {percentage}% of {token_symbol}\n\n"
             f"⏳ Please wait...",
-            parse_mode='HTML'
         )
 
         swap_handler = BSCSwap(private_key)
         slippage_pct = context.get('slippage_pct', 10)
 
         # Execute reverse swap (token → BNB)
-        success = swap_handler.swap(token_address, BSC_TOKENS['BNB'], amount_to_sell, slippage_pct, simulate=False)
+        tx_hash = await swap_handler.prepare_and_send(token_address, BSC_TOKENS['BNB'], amount_to_sell, slippage_pct)
 
-        if success:
+        if not tx_hash:
             await query.edit_message_text(
+                f"❌ <b>Sell Order Failed</b>\n\n"
+                f"The swap transaction failed. Please try again.",
+                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
+            )
+            return
+
+        # Confirmation runs in the background so the handler returns at once
+        await query.edit_message_text(
+            f"🚀 <b>Sell Submitted</b>\n━━━━━━━━━━━━━━━━━━━━\n\n"
+            f"💸 Selling <b>{percentage}% of {token_symbol}</b>\n\n"
+            f"🔍 <a href=\"https://bscscan.com/tx/{tx_hash}\">View on BscScan</a>\n\n"
+            f"⏳ Waiting for confirmation...")
+
+        self._spawn(self._finish_bsc_sell(query.message, percentage, token_symbol, swap_handler, tx_hash))
+
+    async def _finish_bsc_sell(self, message, percentage: float, token_symbol: str, swap_handler, tx_hash: str):
+        """Background task: wait for sell confirmation and update the message"""
+        confirmed = await swap_handler.get_transaction_status(tx_hash)
+
+        if confirmed:
+            await message.edit_text(
                 f"✅ <b>Sell Order Completed!</b>\n"
                 f"━━━━━━━━━━━━━━━━━━━━\n\n"
                 f"💸 Sold: <b>{percentage}% of {token_symbol}</b>\n"
                 f"🪙 Received: <b>BNB</b>\n"
                 f"📋 Status: <b>Success</b>\n\n"
                 f"🔍 Check your transaction on BscScan",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([
                     [InlineKeyboardButton("🎒 View Bags", callback_data='view_bags')],
                     [InlineKeyboardButton("⬅️ Back to Menu", callback_data='back_to_menu')]
                 ])
             )
         else:
-            await query.edit_message_text(
+            await message.edit_text(
                 f"❌ <b>Sell Order Failed</b>\n\n"
                 f"The swap transaction failed. Please try again.",
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to Bags", callback_data='view_bags')]])
             )
 
@@ -965,7 +1008,6 @@ class TradingMixin:
 
             await query.edit_message_text(
                 message,
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup(keyboard)
             )
 
@@ -999,7 +1041,6 @@ class TradingMixin:
 
             await query.edit_message_text(
                 message,
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[
                     InlineKeyboardButton("❌ Cancel", callback_data=f'limit_menu_{token_address}')
                 ]])
@@ -1044,7 +1085,6 @@ class TradingMixin:
 
             await query.edit_message_text(
                 message,
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup([[
                     InlineKeyboardButton("❌ Cancel", callback_data=f'limit_menu_{token_address}')
                 ]])
@@ -1097,7 +1137,6 @@ class TradingMixin:
 
             await query.edit_message_text(
                 message,
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup(keyboard)
             )
 
@@ -1164,7 +1203,6 @@ class TradingMixin:
 
             await query.edit_message_text(
                 message,
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup(keyboard)
             )
 
@@ -1227,7 +1265,6 @@ class TradingMixin:
 
             await query.edit_message_text(
                 message,
-                parse_mode='HTML',
                 reply_markup=InlineKeyboardMarkup(keyboard)
             )
 